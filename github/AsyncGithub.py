@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import collections
+
+import github.AuthenticatedUser
+import github.GithubObject
+import github.NamedUser
+import github.Organization
+import github.Repository
+
+from github.AsyncRequester import AsyncRequester, resolvedFuture, failedFuture, then
+
+
+class AsyncGithub:
+    """
+    Awaitable variants of the most used calls of :class:`github.MainClass.Github`, for asyncio applications.
+    Get an instance from :meth:`github.MainClass.Github.get_async_client`.
+    Requires Python 3.5.2 or later::
+
+        g = Github(token).get_async_client()
+        repo = await g.get_repo("jacquev6/PyGithub")
+        owner = await g.complete(repo.owner)
+        async for issue in g.iterate(repo.get_issues()):
+            print(issue.title)
+
+    Returned objects are the usual PyGithub objects, sharing the credentials and settings
+    of the :class:`github.MainClass.Github` instance. Their own methods are blocking.
+    Requests honour the credentials and the rate limit scheduler, but not the connection pool,
+    and proxies are not supported (see :class:`github.AsyncRequester.AsyncRequester`).
+    """
+
+    def __init__(self, requester, loop=None):
+        self.__asyncRequester = AsyncRequester(requester, loop)
+        self.__requester = requester
+        self.__loop = self.__asyncRequester.loop
+
+    def get_user(self, login=github.GithubObject.NotSet):
+        """
+        :calls: `GET /users/:user <http://developer.github.com/v3/users>`_ or `GET /user <http://developer.github.com/v3/users>`_
+        :param login: string
+        :rtype: future of :class:`github.NamedUser.NamedUser` or :class:`github.AuthenticatedUser.AuthenticatedUser`
+        """
+        assert login is github.GithubObject.NotSet or isinstance(login, (str, unicode)), login
+        if login is github.GithubObject.NotSet:
+            return self.__getObject(github.AuthenticatedUser.AuthenticatedUser, "/user")
+        else:
+            return self.__getObject(github.NamedUser.NamedUser, "/users/" + login)
+
+    def get_organization(self, login):
+        """
+        :calls: `GET /orgs/:org <http://developer.github.com/v3/orgs>`_
+        :param login: string
+        :rtype: future of :class:`github.Organization.Organization`
+        """
+        assert isinstance(login, (str, unicode)), login
+        return self.__getObject(github.Organization.Organization, "/orgs/" + login)
+
+    def get_repo(self, full_name_or_id):
+        """
+        :calls: `GET /repos/:owner/:repo <http://developer.github.com/v3/repos>`_ or `GET /repositories/:id <http://developer.github.com/v3/repos>`_
+        :param full_name_or_id: string or int
+        :rtype: future of :class:`github.Repository.Repository`
+        """
+        assert isinstance(full_name_or_id, (str, unicode, int, long)), full_name_or_id
+        url_base = "/repositories/" if isinstance(full_name_or_id, (int, long)) else "/repos/"
+        return self.__getObject(github.Repository.Repository, "%s%s" % (url_base, full_name_or_id))
+
+    def complete(self, obj):
+        """
+        Completes a lazy object (see :meth:`github.GithubObject.CompletableGithubObject`) without blocking.
+
+        :param obj: :class:`github.GithubObject.GithubObject`
+        :rtype: future of ``obj``
+        """
+        if not isinstance(obj, github.GithubObject.CompletableGithubObject) or obj._isCompleted():
+            return resolvedFuture(self.__loop, obj)
+
+        def useResponse(response):
+            headers, data = response
+            obj._completeWith(headers, data)
+            return obj
+
+        return then(self.__loop, self.__asyncRequester.requestJsonAndCheck("GET", obj._url.value), useResponse)
+
+    def iterate(self, paginated_list):
+        """
+        Iterates a :class:`github.PaginatedList.PaginatedList` from its beginning, fetching its pages without blocking.
+
+        :param paginated_list: :class:`github.PaginatedList.PaginatedList`
+        :rtype: asynchronous iterator
+        """
+        return AsyncPaginatedListIterator(self.__asyncRequester, paginated_list)
+
+    def __getObject(self, klass, url):
+        def makeObject(response):
+            headers, data = response
+            return github.GithubObject.GithubObject._makeObject(klass, self.__requester, headers, data, True)
+
+        return then(self.__loop, self.__asyncRequester.requestJsonAndCheck("GET", url), makeObject)
+
+
+class AsyncPaginatedListIterator:
+    """
+    Asynchronous iterator on the elements of a :class:`github.PaginatedList.PaginatedList`.
+    ``__anext__`` returns futures, so it can be used with ``async for``.
+    """
+
+    def __init__(self, asyncRequester, paginatedList):
+        self.__asyncRequester = asyncRequester
+        self.__loop = asyncRequester.loop
+        self.__list = paginatedList
+        self.__nextUrl, self.__nextParams, self.__headers, self.__offset = paginatedList._firstPageRequest()
+        self.__elements = collections.deque()
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        if len(self.__elements) > 0:
+            return resolvedFuture(self.__loop, self.__elements.popleft())
+        if self.__nextUrl is None:
+            return failedFuture(self.__loop, StopAsyncIteration())
+
+        def usePage(response):
+            headers, data = response
+            content, self.__nextUrl, links = self.__list._usePage(headers, data)
+            self.__nextParams = None
+            self.__elements.extend(content[self.__offset:])
+            self.__offset = 0
+            return self.__anext__()
+
+        page = self.__asyncRequester.requestJsonAndCheck("GET", self.__nextUrl, self.__nextParams, self.__headers)
+        return then(self.__loop, page, usePage)
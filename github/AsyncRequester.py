@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+# This module needs asyncio, so Python 3.5.2 or later. It is written without
+# the async/await syntax so that the package still compiles with Python 2.
+
+import asyncio
+import io
+import os
+import socket
+
+from Decompressor import Decompressor
+from Base64JsonBody import Base64JsonBody
+
+
+def resolvedFuture(loop, value):
+    future = loop.create_future()
+    future.set_result(value)
+    return future
+
+
+def failedFuture(loop, exception):
+    future = loop.create_future()
+    future.set_exception(exception)
+    return future
+
+
+def then(loop, future, function):
+    """
+    Returns a future resolved with ``function(future.result())``. If ``function`` returns a future,
+    the returned future is resolved with its result. Exceptions are propagated.
+    """
+    result = loop.create_future()
+
+    def copy(future):
+        if result.done():  # pragma no cover (Cancelled by the caller)
+            return
+        if future.cancelled():
+            result.cancel()
+        elif future.exception() is not None:
+            result.set_exception(future.exception())
+        else:
+            result.set_result(future.result())
+
+    def onDone(future):
+        if result.done() or future.cancelled() or future.exception() is not None:
+            copy(future)
+            return
+        try:
+            value = function(future.result())
+        except BaseException, e:
+            result.set_exception(e)
+            return
+        if isinstance(value, asyncio.Future):
+            value.add_done_callback(copy)
+        else:
+            result.set_result(value)
+
+    future.add_done_callback(onDone)
+    return result
+
+
+class _HttpResponseProtocol(asyncio.Protocol):
+    # One request per connection ("Connection: close"): the response ends when the server closes the connection.
+    # Like the timeout of a socket, the timeout applies to connecting and to each wait for data, not to the whole response.
+    def __init__(self, request, future, loop, timeout):
+        self.__request = request
+        self.__future = future
+        self.__chunks = []
+        self.__transport = None
+        self.__loop = loop
+        self.__timeout = timeout
+        self.__timer = None
+        self.__restartTimer()
+        future.add_done_callback(lambda future: self.__timer.cancel())
+
+    def __restartTimer(self):
+        if self.__timer is not None:
+            self.__timer.cancel()
+        self.__timer = self.__loop.call_later(self.__timeout, self.abort, socket.timeout("timed out"))
+
+    def connection_made(self, transport):
+        self.__transport = transport
+        transport.write(self.__request)
+
+    def data_received(self, data):
+        self.__chunks.append(data)
+        if not self.__future.done():  # pragma no branch (Data received after an abort)
+            self.__restartTimer()
+
+    def abort(self, exception):
+        if not self.__future.done():
+            self.__future.set_exception(exception)
+        if self.__transport is not None:
+            self.__transport.abort()
+
+    def connection_lost(self, exception):
+        if self.__future.done():
+            return
+        if exception is not None:
+            self.__future.set_exception(exception)
+            return
+        try:
+            self.__future.set_result(parseHttpResponse(b"".join(self.__chunks)))
+        except Exception, e:
+            self.__future.set_exception(e)
+
+
+def parseHttpResponse(raw):
+    """
+    Returns ``(status, headers, body)`` from the bytes of a complete HTTP/1.1 response
+    """
+    head, separator, body = raw.partition(b"\r\n\r\n")
+    if not separator:
+        raise socket.error("Incomplete HTTP response")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ")[1])
+    headers = dict()
+    for line in lines[1:]:
+        name, value = line.split(":", 1)
+        name = name.strip().lower()
+        value = value.strip()
+        if name in headers:
+            headers[name] += ", " + value
+        else:
+            headers[name] = value
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        body = decodeChunkedBody(body)
+    elif "content-length" in headers:
+        body = body[:int(headers["content-length"])]
+    if headers.get("content-encoding") in ("gzip", "deflate"):
+        body = Decompressor(io.BytesIO(body), headers["content-encoding"]).read()
+    return status, headers, body
+
+
+def decodeChunkedBody(body):
+    chunks = []
+    position = 0
+    while True:
+        endOfSize = body.index(b"\r\n", position)
+        size = int(body[position:endOfSize].split(b";")[0], 16)
+        if size == 0:
+            return b"".join(chunks)
+        chunks.append(body[endOfSize + 2:endOfSize + 2 + size])
+        position = endOfSize + 2 + size + 2
+
+
+class AsyncRequester:
+    """
+    Sends requests prepared by a :class:`github.Requester.Requester` on an asyncio event loop,
+    so that many requests can be in flight without a thread each.
+    Requests go through the same bookkeeping (credentials, rate limit scheduler, response cache, errors) as synchronous ones.
+    The waits of the rate limit scheduler are done in the loop's default executor, not in the loop itself.
+    As with synchronous requests, the ``timeout`` of the requester limits each wait for data, not the whole request.
+
+    Each request opens its own connection ("Connection: close"): the connection pool of the requester
+    (``pool_size`` and ``pool_idle_timeout``) is not used. Proxies (``http_proxy``) are not supported.
+    """
+
+    def __init__(self, requester, loop=None):
+        if os.getenv("http_proxy") or os.getenv("HTTP_PROXY"):
+            raise NotImplementedError("The asyncio client does not support proxies (http_proxy is set)")
+        self.__requester = requester
+        self.__loop = loop or asyncio.get_event_loop()
+
+    @property
+    def loop(self):
+        return self.__loop
+
+    @property
+    def requester(self):
+        return self.__requester
+
+    def requestJsonAndCheck(self, verb, url, parameters=None, headers=None, input=None):
+        """
+        Like :meth:`github.Requester.Requester.requestJsonAndCheck`, but returns a future of ``(headers, data)``
+        """
+        originalHeaders = dict(headers or {})
+        request = self.__requester._prepareJsonRequest(verb, url, parameters, dict(originalHeaders), input)
+        return self.__requestScheduled(request, originalHeaders, input, 0)
+
+    def __requestScheduled(self, request, originalHeaders, input, attempt):
+        verb, url, requestHeaders, encodedInput = request[:4]
+
+        def useResponse(response):
+            status, responseHeaders, output = response
+            if status == 301 and "location" in responseHeaders:
+                return self.requestJsonAndCheck(verb, responseHeaders["location"], None, originalHeaders, input)
+            status, responseHeaders, output = self.__requester._useResponse(request, status, responseHeaders, output)
+
+            def checkOrRetry(retryRequest):
+                if retryRequest is None:
+                    return self.__requester._check(status, responseHeaders, output)
+                return self.__requestScheduled(retryRequest, originalHeaders, input, attempt + 1)
+
+            return then(self.__loop, self.__wait(self.__requester._prepareRetry, request, status, responseHeaders, attempt), checkOrRetry)
+
+        sent = then(self.__loop, self.__wait(self.__requester._waitBeforeRequest), lambda ignored: self.__send(verb, url, requestHeaders, encodedInput))
+        return then(self.__loop, sent, useResponse)
+
+    def __wait(self, function, *args):
+        # The rate limit scheduler sleeps: it must not block the loop
+        if self.__requester._rateLimitScheduler is None:
+            try:
+                return resolvedFuture(self.__loop, function(*args))
+            except Exception, e:  # pragma no cover (Defensive: without scheduler, nothing waits or fails)
+                return failedFuture(self.__loop, e)
+        return self.__loop.run_in_executor(None, function, *args)
+
+    def __send(self, verb, url, requestHeaders, encodedInput):
+        scheme, hostname, port, timeout = self.__requester._server
+        if port is None:
+            port = 443 if scheme == "https" else 80
+
+        if isinstance(encodedInput, Base64JsonBody):
+            # The whole request is written to the transport at once
+            encodedInput.seek(0)
+            body = encodedInput.read()
+        else:
+            body = encodedInput.encode("utf-8")
+        lines = [verb + " " + url + " HTTP/1.1", "Host: " + hostname + ("" if port in (80, 443) else ":" + str(port))]
+        for name, value in requestHeaders.items():
+            if name != "Content-Length":
+                lines.append(name + ": " + value)
+        lines.append("Content-Length: " + str(len(body)))
+        lines.append("Connection: close")
+        request = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+        response = self.__loop.create_future()
+        protocol = _HttpResponseProtocol(request, response, self.__loop, timeout)
+        connection = asyncio.ensure_future(
+            self.__loop.create_connection(lambda: protocol, hostname, port, ssl=(scheme == "https")),
+            loop=self.__loop
+        )
+
+        def onConnected(connection):
+            if not connection.cancelled() and connection.exception() is not None and not response.done():
+                response.set_exception(connection.exception())
+
+        connection.add_done_callback(onConnected)
+        return response
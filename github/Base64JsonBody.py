@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import base64
+import mmap
+import sys
+
+atLeastPython26 = sys.hexversion >= 0x02060000
+atLeastPython3 = sys.hexversion >= 0x03000000
+
+if atLeastPython26:
+    import json
+else:  # pragma no cover (Covered by all tests with Python 2.5)
+    import simplejson as json  # pragma no cover (Covered by all tests with Python 2.5)
+
+if atLeastPython3:
+    binaryTypes = (bytes, bytearray, mmap.mmap)  # pragma no cover (Covered by Base64JsonBody tests with Python 3)
+else:
+    binaryTypes = (str, bytearray, mmap.mmap)
+
+
+class Base64JsonBody:
+    """
+    Body of a request whose JSON input has one member holding a base64-encoded content (typically a blob or a file).
+    The content is read from its source and encoded chunk by chunk while the body is sent,
+    so that neither the content nor its encoding is ever entirely in memory.
+    """
+
+    CHUNK_SIZE = 3 * 64 * 1024  # A multiple of 3, so that chunks are encoded without padding
+
+    def __init__(self, key, content, members):
+        """
+        :param key: string, name of the member holding the encoded content
+        :param content: bytes, bytearray, mmap, or seekable file-like object opened in binary mode, read from its current position
+        :param members: dict, the other members of the JSON object
+        """
+        assert self.accepts(content), content
+        self.__key = key
+        self.__content = content
+        self.__prefix = "{" + json.dumps(key) + ": \""
+        self.__suffix = "\"" + ("" if len(members) == 0 else ", " + json.dumps(members)[1:-1]) + "}"
+        if isinstance(content, binaryTypes):
+            self.__start = 0
+            self.__size = len(content)
+        else:
+            self.__start = content.tell()
+            content.seek(0, 2)
+            self.__size = content.tell() - self.__start
+            content.seek(self.__start)
+        self.seek(0)
+
+    @staticmethod
+    def accepts(content):
+        """
+        :param content: anything
+        :rtype: bool, True if ``content`` can be the source of a :class:`Base64JsonBody`
+        """
+        return isinstance(content, binaryTypes) or hasattr(content, "read")
+
+    def __len__(self):
+        return int(len(self.__prefix) + 4 * ((self.__size + 2) // 3) + len(self.__suffix))
+
+    def __str__(self):
+        return self.__prefix + "(" + str(self.__size) + " bytes)" + self.__suffix
+
+    def seek(self, offset):
+        """
+        Rewinds the body, so that it can be sent again (after a redirection, or when a request is retried)
+
+        :param offset: int, must be 0
+        """
+        assert offset == 0, offset
+        if not isinstance(self.__content, binaryTypes):
+            self.__content.seek(self.__start)
+        self.__pieces = self.__generatePieces()
+        self.__piece = "".encode("ascii")
+        self.__offset = 0
+
+    def read(self, size=-1):
+        """
+        :param size: int, maximum number of bytes returned, or -1 to read the whole remaining body
+        :rtype: bytes, empty at the end of the body
+        """
+        parts = []
+        length = 0
+        while size < 0 or length < size:
+            if self.__offset == len(self.__piece):
+                self.__piece = self.__nextPiece()
+                self.__offset = 0
+                if len(self.__piece) == 0:
+                    break
+            end = len(self.__piece) if size < 0 else min(len(self.__piece), self.__offset + size - length)
+            parts.append(self.__piece[self.__offset:end])
+            length += end - self.__offset
+            self.__offset = end
+        return "".encode("ascii").join(parts)
+
+    def __nextPiece(self):
+        for piece in self.__pieces:
+            return piece
+        return "".encode("ascii")
+
+    def __generatePieces(self):
+        yield self.__prefix.encode("ascii")
+        position = 0
+        while position < self.__size:
+            chunkSize = min(self.CHUNK_SIZE, self.__size - position)
+            chunk = self.__readChunk(position, chunkSize)
+            yield base64.b64encode(chunk)
+            position += chunkSize
+        yield self.__suffix.encode("ascii")
+
+    def __readChunk(self, position, chunkSize):
+        if isinstance(self.__content, binaryTypes):
+            return self.__content[position:position + chunkSize]
+        parts = []
+        length = 0
+        while length < chunkSize:
+            part = self.__content.read(chunkSize - length)
+            if len(part) == 0:
+                raise IOError("Content of " + self.__key + " ended after " + str(position + length) + " bytes instead of " + str(self.__size))
+            parts.append(part)
+            length += len(part)
+        return "".encode("ascii").join(parts)
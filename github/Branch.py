@@ -73,7 +73,10 @@ class Branch(github.GithubObject.NonCompletableGithubObject):
 
     def _initAttributes(self):
         self._commit = github.GithubObject.NotSet
+        self._contexts = github.GithubObject.NotSet
+        self._enforcement_level = github.GithubObject.NotSet
         self._name = github.GithubObject.NotSet
+        self._protected = github.GithubObject.NotSet
 
     def _useAttributes(self, attributes):
         if "commit" in attributes:  # pragma no branch
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import os
+import sys
+import tempfile
+
+from LruDict import LruDict
+
+atLeastPython26 = sys.hexversion >= 0x02060000
+atLeastPython3 = sys.hexversion >= 0x03000000
+
+if atLeastPython26:
+    import json
+else:  # pragma no cover (Covered by all tests with Python 2.5)
+    import simplejson as json  # pragma no cover (Covered by all tests with Python 2.5)
+
+
+class InMemoryCacheStore:
+    """
+    Keeps the ``max_size`` most recently used entries in memory. Base of the in-memory caches.
+    """
+
+    def __init__(self, max_size):
+        """
+        :param max_size: integer
+        """
+        assert isinstance(max_size, (int, long)) and max_size > 0, max_size
+        self.__entries = LruDict(max_size)
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def get(self, key):
+        return self.__entries.get(key)
+
+    def set(self, key, entry):
+        self.__entries.set(key, entry)
+
+
+class FileSystemCacheStore:
+    """
+    Stores entries as files in a directory, used by the file system caches. Each file is a line of JSON metadata,
+    followed by an optional binary payload. Files are written under a temporary name, then renamed,
+    so that a concurrent reader never sees a partial file.
+    """
+
+    def __init__(self, directory):
+        """
+        :param directory: string
+        """
+        assert isinstance(directory, (str, unicode)), directory
+        self.__directory = directory
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def read(self, fileName):
+        """
+        :param fileName: string, relative to the directory
+        :rtype: tuple ``(metadata, payload)``, with ``payload`` as bytes, or None if there is no such file
+        """
+        try:
+            f = open(os.path.join(self.__directory, fileName), "rb")
+        except IOError:
+            return None
+        try:
+            metadata = f.readline()
+            payload = f.read()
+        finally:
+            f.close()
+        if atLeastPython3:
+            metadata = metadata.decode("utf-8")  # pragma no cover (Covered by cache tests with Python 3)
+        return json.loads(metadata), payload
+
+    def write(self, fileName, metadata, payload=None):
+        """
+        :param fileName: string, relative to the directory. Missing sub-directories are created
+        :param metadata: anything that can be dumped as JSON
+        :param payload: bytes or None
+        """
+        metadata = json.dumps(metadata) + "\n"
+        if atLeastPython3:
+            metadata = metadata.encode("utf-8")  # pragma no cover (Covered by cache tests with Python 3)
+        fileName = os.path.join(self.__directory, fileName)
+        directory = os.path.dirname(fileName)
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:  # Created by another thread
+                pass
+        fd, temporaryFileName = tempfile.mkstemp(dir=directory)
+        f = os.fdopen(fd, "wb")
+        try:
+            f.write(metadata)
+            if payload is not None:
+                f.write(payload)
+        finally:
+            f.close()
+        self.__rename(temporaryFileName, fileName)
+
+    @staticmethod
+    def __rename(source, destination):
+        # os.rename does not replace an existing file on Windows
+        try:
+            os.rename(source, destination)
+        except OSError:
+            if not os.path.exists(destination):
+                raise
+            os.remove(destination)
+            os.rename(source, destination)
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import hashlib
+import sys
+
+import github.GithubObject
+from github.Base64JsonBody import Base64JsonBody, binaryTypes
+from github.WorkerPool import WorkerPool
+
+atLeastPython3 = sys.hexversion >= 0x03000000
+
+if not atLeastPython3:  # pragma no branch (Branch useful only with Python 2)
+    from StringIO import StringIO  # Reads a str without copying it
+
+
+class CommitBuilder:
+    """
+    Builds a single commit changing many files on a branch, through the Git Data API, instead of one commit for each
+    file with :meth:`github.Repository.Repository.update_file`::
+
+        builder = repo.get_commit_builder("gh-pages")
+        for path in paths:
+            builder.add_file(path, open(path, "rb"))
+        builder.commit("Update documentation")
+
+    On :meth:`commit`, the blobs are uploaded concurrently, except the ones already in the tree of the branch (their SHAs
+    are computed locally), then a tree based on the tree of the branch and a commit are created, and the branch is
+    fast-forwarded to the new commit. If the branch moved in the meantime, :class:`github.GithubException.GithubException`
+    is raised, and the branch is left unchanged.
+
+    Get instances from :meth:`github.Repository.Repository.get_commit_builder`.
+    """
+
+    def __init__(self, repo, branch):
+        self.__repo = repo
+        self.__branch = branch
+        self.__files = dict()
+        self.__paths = []  # In the order they were added (collections.OrderedDict only exists from Python 2.7)
+
+    def add_file(self, path, content, mode="100644"):
+        """
+        Adds or replaces a file. Adding the same path again replaces the previous content.
+
+        :param path: string
+        :param content: bytes, bytearray, mmap, unicode encoded as UTF-8, or seekable file-like object opened in binary mode, read from its current position when committing
+        :param mode: string, "100755" for executable files
+        """
+        assert isinstance(path, (str, unicode)), path
+        assert isinstance(content, unicode) or Base64JsonBody.accepts(content), content
+        assert mode in ("100644", "100755"), mode
+        if isinstance(content, unicode):
+            content = content.encode("utf-8")
+        if path not in self.__files:
+            self.__paths.append(path)
+        self.__files[path] = (mode, content)
+
+    def commit(self, message, author=github.GithubObject.NotSet, committer=github.GithubObject.NotSet, workers=8):
+        """
+        :calls: `GET /repos/:owner/:repo/git/refs/:ref <http://developer.github.com/v3/git/refs>`_,
+                `POST /repos/:owner/:repo/git/blobs <http://developer.github.com/v3/git/blobs>`_ for each new blob,
+                `POST /repos/:owner/:repo/git/trees <http://developer.github.com/v3/git/trees>`_,
+                `POST /repos/:owner/:repo/git/commits <http://developer.github.com/v3/git/commits>`_ and
+                `PATCH /repos/:owner/:repo/git/refs/:ref <http://developer.github.com/v3/git/refs>`_
+        :param message: string
+        :param author: :class:`github.InputGitAuthor.InputGitAuthor`
+        :param committer: :class:`github.InputGitAuthor.InputGitAuthor`
+        :param workers: int, maximum number of concurrent blob uploads
+        :rtype: :class:`github.GitCommit.GitCommit`, or None if no file changed
+        """
+        assert isinstance(message, (str, unicode)), message
+        assert isinstance(workers, (int, long)) and workers > 0, workers
+        ref = self.__repo.get_git_ref("heads/" + self.__branch)
+        parent = self.__repo.get_git_commit(ref.object.sha)
+        existing = dict()
+        existingShas = set()
+        for element in self.__repo.get_git_tree(parent.tree.sha, recursive=True).tree:
+            existing[element.path] = (element.mode, element.sha)
+            existingShas.add(element.sha)
+
+        files = []
+        for path in self.__paths:
+            mode, content = self.__files[path]
+            sha = CommitBuilder.__getBlobSha(content)
+            if existing.get(path) != (mode, sha):
+                files.append((path, mode, content, sha))
+        if len(files) == 0:
+            return None
+
+        def upload(file):
+            path, mode, content, sha = file
+            if sha not in existingShas:
+                if not atLeastPython3 and isinstance(content, str):
+                    content = StringIO(content)  # create_git_blob would send a str as it is
+                sha = self.__repo.create_git_blob(content, "base64").sha
+            return github.InputGitTreeElement(path, mode, "blob", sha=sha)
+
+        elements = list(WorkerPool(workers).imap(upload, files))
+        tree = self.__repo.create_git_tree(elements, parent.tree)
+        commit = self.__repo.create_git_commit(message, tree, [parent], author, committer)
+        ref.edit(commit.sha)
+        return commit
+
+    @staticmethod
+    def __getBlobSha(content):
+        if isinstance(content, binaryTypes):
+            sha = hashlib.sha1(("blob %i\0" % len(content)).encode("ascii"))
+            sha.update(content)
+            return sha.hexdigest()
+        start = content.tell()
+        content.seek(0, 2)
+        size = content.tell() - start
+        content.seek(start)
+        sha = hashlib.sha1(("blob %i\0" % size).encode("ascii"))
+        while True:
+            chunk = content.read(Base64JsonBody.CHUNK_SIZE)
+            if len(chunk) == 0:
+                break
+            sha.update(chunk)
+        content.seek(start)
+        return sha.hexdigest()
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import array
+import collections
+import threading
+
+
+class CommitGraph:
+    """
+    Keeps the parents of the commits of a repository in compact arrays, to answer ancestry queries without requests.
+    Each SHA is interned to an integer index, and the parents of each commit are stored as indexes.
+
+    Commits are fetched by pages of 100 from :meth:`github.Repository.Repository.get_commits`, when a query involves
+    a commit that is not loaded yet. Loading stops as soon as all the ancestors of that commit are known,
+    so the history shared with already loaded commits is not fetched again. Commits can also be given by branch
+    or tag name, or by abbreviated SHA: they are then resolved by one request for each query::
+
+        graph = repo.get_commit_graph()
+        for pull in repo.get_pulls():
+            base = graph.merge_base(pull.base.sha, pull.head.sha)
+
+    Get instances from :meth:`github.Repository.Repository.get_commit_graph`.
+    """
+
+    PER_PAGE = 100
+
+    def __init__(self, repo):
+        self.__repo = repo
+        self.__lock = threading.RLock()
+        self.__indexes = dict()
+        self.__shas = []
+        # Parents of the commit with index i are __parents[__parentsStart[i]:__parentsStart[i] + __parentsCount[i]]
+        # __parentsCount[i] is -1 while the commit is known only as the parent of a loaded commit
+        self.__parentsStart = array.array("l")
+        self.__parentsCount = array.array("l")
+        self.__parents = array.array("l")
+
+    def __len__(self):
+        """
+        The number of loaded commits
+        """
+        self.__lock.acquire()
+        try:
+            return len([count for count in self.__parentsCount if count >= 0])
+        finally:
+            self.__lock.release()
+
+    def load(self, sha):
+        """
+        Loads the commit ``sha`` and all its ancestors, if they are not loaded yet.
+
+        :param sha: string
+        :rtype: string, the full SHA of the commit
+        """
+        return self.__query(lambda index: self.__shas[index], sha)
+
+    def get_parents(self, sha):
+        """
+        :param sha: string
+        :rtype: list of string
+        """
+        return self.__query(lambda index: [self.__shas[parent] for parent in self.__getParents(index)], sha)
+
+    def is_ancestor(self, ancestor, descendant):
+        """
+        True if ``ancestor`` is ``descendant`` or one of its ancestors, like ``git merge-base --is-ancestor``.
+
+        :param ancestor: string
+        :param descendant: string
+        :rtype: bool
+        """
+        return self.__query(lambda ancestor, descendant: self.__reachable(descendant, ancestor), ancestor, descendant)
+
+    def merge_bases(self, sha1, sha2):
+        """
+        The best common ancestors of two commits, that are not ancestors of other common ancestors, like ``git merge-base --all``.
+
+        :param sha1: string
+        :param sha2: string
+        :rtype: list of string
+        """
+        return self.__query(lambda index1, index2: [self.__shas[index] for index in self.__mergeBases(index1, index2)], sha1, sha2)
+
+    def merge_base(self, sha1, sha2):
+        """
+        One of the :meth:`merge_bases` of two commits, or None if they have no common ancestor.
+
+        :param sha1: string
+        :param sha2: string
+        :rtype: string or None
+        """
+        bases = self.merge_bases(sha1, sha2)
+        if len(bases) == 0:
+            return None
+        return bases[0]
+
+    def get_commits_between(self, base, head):
+        """
+        The commits that are ancestors of ``head`` (or ``head`` itself) but not of ``base``, like ``git rev-list base..head``,
+        each one before its parents.
+
+        :param base: string
+        :param head: string
+        :rtype: list of string
+        """
+        return self.__query(lambda base, head: [self.__shas[index] for index in self.__between(base, head)], base, head)
+
+    def __query(self, function, *shas):
+        for sha in shas:
+            assert isinstance(sha, (str, unicode)), sha
+        self.__lock.acquire()
+        try:
+            return function(*[self.__load(sha) for sha in shas])
+        finally:
+            self.__lock.release()
+
+    def __load(self, sha):
+        index = self.__indexes.get(sha)
+        if index is not None and self.__isLoaded(index):
+            return index
+        # The list starts with the commit itself, and contains all its ancestors. Loaded commits have all their ancestors
+        # loaded, or wanted: the list is read until no commit is wanted anymore.
+        index = None
+        wanted = set()
+        loaded = []
+        parentsLength = len(self.__parents)
+        try:
+            for commit in self.__repo.get_commits(sha=sha).with_per_page(self.PER_PAGE).streamed():
+                commitIndex = self.__intern(commit.sha)
+                if index is None:
+                    index = commitIndex
+                if not self.__isLoaded(commitIndex):
+                    wanted.discard(commitIndex)
+                    parents = [self.__intern(parent.sha) for parent in commit.parents]
+                    self.__parentsStart[commitIndex] = len(self.__parents)
+                    self.__parentsCount[commitIndex] = len(parents)
+                    self.__parents.extend(parents)
+                    loaded.append(commitIndex)
+                    wanted.update(parent for parent in parents if not self.__isLoaded(parent))
+                if len(wanted) == 0:
+                    break
+        except:
+            # Commits loaded before the error may have ancestors that are not: they would be taken for roots
+            for commitIndex in loaded:
+                self.__parentsCount[commitIndex] = -1
+            del self.__parents[parentsLength:]
+            raise
+        return index
+
+    def __intern(self, sha):
+        index = self.__indexes.get(sha)
+        if index is None:
+            index = len(self.__shas)
+            self.__indexes[sha] = index
+            self.__shas.append(sha)
+            self.__parentsStart.append(0)
+            self.__parentsCount.append(-1)
+        return index
+
+    def __isLoaded(self, index):
+        return self.__parentsCount[index] >= 0
+
+    def __getParents(self, index):
+        start = self.__parentsStart[index]
+        return self.__parents[start:start + self.__parentsCount[index]]
+
+    def __walk(self, starts, marks, mark):
+        # Marks starts and their ancestors, without going through commits already marked
+        todo = collections.deque(index for index in starts if not marks[index] & mark)
+        for index in todo:
+            marks[index] |= mark
+        while todo:
+            index = todo.popleft()
+            for parent in self.__getParents(index):
+                if not marks[parent] & mark:
+                    marks[parent] |= mark
+                    todo.append(parent)
+
+    def __reachable(self, start, target):
+        marks = bytearray(len(self.__shas))
+        todo = collections.deque([start])
+        marks[start] = 1
+        while todo:
+            index = todo.popleft()
+            if index == target:
+                return True
+            for parent in self.__getParents(index):
+                if not marks[parent]:
+                    marks[parent] = 1
+                    todo.append(parent)
+        return False
+
+    def __mergeBases(self, index1, index2):
+        ANCESTOR_OF_1, ANCESTOR_OF_2, REDUNDANT = 1, 2, 4
+        marks = bytearray(len(self.__shas))
+        self.__walk([index1], marks, ANCESTOR_OF_1)
+        self.__walk([index2], marks, ANCESTOR_OF_2)
+        common = [index for index in xrange(len(self.__shas)) if marks[index] & ANCESTOR_OF_1 and marks[index] & ANCESTOR_OF_2]
+        # Common ancestors of other common ancestors are redundant
+        for index in common:
+            self.__walk(self.__getParents(index), marks, REDUNDANT)
+        return [index for index in common if not marks[index] & REDUNDANT]
+
+    def __between(self, base, head):
+        EXCLUDED, INCLUDED = 1, 2
+        marks = bytearray(len(self.__shas))
+        self.__walk([base], marks, EXCLUDED)
+        if marks[head] & EXCLUDED:
+            return []
+        # Count the children of each included commit, then output commits once all their children are output
+        children = dict()
+        marks[head] |= INCLUDED
+        todo = collections.deque([head])
+        while todo:
+            index = todo.popleft()
+            for parent in self.__getParents(index):
+                if not marks[parent] & EXCLUDED:
+                    children[parent] = children.get(parent, 0) + 1
+                    if not marks[parent] & INCLUDED:
+                        marks[parent] |= INCLUDED
+                        todo.append(parent)
+        result = []
+        todo.append(head)
+        while todo:
+            index = todo.popleft()
+            result.append(index)
+            for parent in self.__getParents(index):
+                if not marks[parent] & EXCLUDED:
+                    children[parent] -= 1
+                    if children[parent] == 0:
+                        todo.append(parent)
+        return result
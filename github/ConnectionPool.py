@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import select
+import threading
+import time
+
+
+class ConnectionPool:
+    """
+    Keeps idle keep-alive connections, per host, so that successive requests do not each pay a TCP and TLS handshake.
+
+    Connections are identified by a key (typically ``(scheme, hostname, port)``).
+    A connection is only given back to the pool when the server did not ask to close it,
+    and is checked again before being reused.
+
+    A ConnectionPool can be shared by several threads: a connection is owned by a single thread
+    between :meth:`acquire` and :meth:`release`.
+    """
+
+    def __init__(self, size, idleTimeout):
+        """
+        :param size: maximum number of idle connections kept per key (0 disables pooling)
+        :param idleTimeout: number of seconds after which an idle connection is not reused anymore
+        """
+        self.__size = size
+        self.__idleTimeout = idleTimeout
+        self.__idleConnections = dict()
+        self.__lock = threading.Lock()
+
+    @property
+    def size(self):
+        return self.__size
+
+    def acquire(self, key, createConnection):
+        """
+        Returns a tuple ``(connection, reused)``: an idle healthy connection for ``key`` if any,
+        else a new connection built by ``createConnection()``.
+        """
+        while True:
+            self.__lock.acquire()
+            try:
+                idleConnections = self.__idleConnections.get(key)
+                if not idleConnections:
+                    break
+                cnx, releaseTime = idleConnections.pop()
+            finally:
+                self.__lock.release()
+            if time.time() - releaseTime <= self.__idleTimeout and self.__isHealthy(cnx):
+                return cnx, True
+            cnx.close()
+        return createConnection(), False
+
+    def release(self, key, cnx):
+        """
+        Gives a connection back to the pool after its response has been fully read.
+        """
+        self.__lock.acquire()
+        try:
+            idleConnections = self.__idleConnections.setdefault(key, [])
+            if len(idleConnections) < self.__size:
+                idleConnections.append((cnx, time.time()))
+                return
+        finally:
+            self.__lock.release()
+        cnx.close()
+
+    def clear(self):
+        """
+        Closes all idle connections.
+        """
+        self.__lock.acquire()
+        try:
+            idleConnections = self.__idleConnections
+            self.__idleConnections = dict()
+        finally:
+            self.__lock.release()
+        for connections in idleConnections.itervalues():
+            for cnx, releaseTime in connections:
+                cnx.close()
+
+    @staticmethod
+    def __isHealthy(cnx):
+        sock = getattr(cnx, "sock", None)
+        if sock is None:
+            return False
+        # An idle keep-alive socket has nothing to read. If it is readable,
+        # the server has closed it (or sent garbage) and it must not be reused.
+        try:
+            readable, writable, errored = select.select([sock], [], [], 0)
+        except (select.error, ValueError):
+            return False
+        return len(readable) == 0
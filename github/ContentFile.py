@@ -151,6 +151,7 @@ class ContentFile(github.GithubObject.CompletableGithubObject):
         self._sha = github.GithubObject.NotSet
         self._size = github.GithubObject.NotSet
         self._type = github.GithubObject.NotSet
+        self._url = github.GithubObject.NotSet
 
     def _useAttributes(self, attributes):
         if "content" in attributes:  # pragma no branch
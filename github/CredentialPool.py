@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import threading
+import time
+
+
+class CredentialPool:
+    """
+    Authorization headers of a :class:`github.Requester.Requester`, with the rate limit budget
+    of each, as announced by the responses to the requests it authenticated.
+    The credential with the most remaining budget is used for each request,
+    so the aggregate throughput grows with the number of credentials.
+    """
+
+    def __init__(self, authorizationHeaders, clock=time.time):
+        # [authorizationHeader, remaining, limit, resetTime]; remaining is -1 until a response is seen
+        self.__budgets = [[header, -1, -1, 0] for header in authorizationHeaders]
+        self.__clock = clock
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__budgets)
+
+    def select(self):
+        """
+        Returns the authorization header with the most remaining budget, or the one whose budget is reset first if all are exhausted
+        """
+        if len(self.__budgets) == 0:
+            return None
+        self.__lock.acquire()
+        try:
+            now = self.__clock()
+            best = max(self.__budgets, key=lambda budget: self.__available(budget, now))
+            if self.__available(best, now) == 0:
+                best = min(self.__budgets, key=lambda budget: budget[3])
+            return best[0]
+        finally:
+            self.__lock.release()
+
+    def update(self, authorizationHeader, remaining, limit, resetTime):
+        self.__lock.acquire()
+        try:
+            for budget in self.__budgets:
+                if budget[0] == authorizationHeader:
+                    budget[1:4] = [remaining, limit, resetTime]
+        finally:
+            self.__lock.release()
+
+    def hasBudget(self):
+        """
+        True if a credential is not known to be exhausted
+        """
+        self.__lock.acquire()
+        try:
+            now = self.__clock()
+            return any(self.__available(budget, now) != 0 for budget in self.__budgets)
+        finally:
+            self.__lock.release()
+
+    def budget(self):
+        """
+        Returns the remaining budget of all credentials, and the time at which it is reset.
+        The remaining budget is -1 if unknown for one credential.
+
+        :rtype: (int, int)
+        """
+        self.__lock.acquire()
+        try:
+            now = self.__clock()
+            available = [self.__available(budget, now) for budget in self.__budgets]
+            if len(available) == 0 or float("inf") in available:
+                return -1, 0
+            remaining = int(sum(available))
+            if remaining == 0:
+                return 0, min(budget[3] for budget in self.__budgets)
+            else:
+                return remaining, max(budget[3] for budget in self.__budgets)
+        finally:
+            self.__lock.release()
+
+    @staticmethod
+    def __available(budget, now):
+        header, remaining, limit, resetTime = budget
+        if remaining == -1:
+            return float("inf")  # Unknown budget: try it
+        elif remaining == 0 and resetTime <= now:
+            return limit
+        else:
+            return remaining
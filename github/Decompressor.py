@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import zlib
+
+_empty = "".encode("ascii")  # Empty bytes with Python 3
+
+
+class Decompressor:
+    """
+    File-like object returning the decompressed content of another one (typically an HTTP response)
+    compressed with one of the encodings of ``ACCEPT_ENCODING``. The content is decompressed as it is read.
+    """
+
+    ACCEPT_ENCODING = "gzip, deflate"
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, file, contentEncoding, chunkSize=CHUNK_SIZE):
+        """
+        :param file: object with a ``read(size)`` method
+        :param contentEncoding: string, "gzip" or "deflate"
+        :param chunkSize: int, number of compressed bytes read at once
+        """
+        assert contentEncoding in ("gzip", "deflate"), contentEncoding
+        self.__file = file
+        self.__chunkSize = chunkSize
+        if contentEncoding == "gzip":
+            self.__decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        else:
+            self.__decompressor = zlib.decompressobj(zlib.MAX_WBITS)
+        self.__maybeRawDeflate = contentEncoding == "deflate"
+        self.__buffer = _empty
+        self.__eof = False
+
+    def read(self, size=None):
+        chunks = [self.__buffer]
+        length = len(self.__buffer)
+        while (size is None or length < size) and not self.__eof:
+            data = self.__file.read(self.__chunkSize)
+            if len(data) == 0:
+                self.__eof = True
+                chunk = self.__decompressor.flush()
+            else:
+                chunk = self.__decompress(data)
+            chunks.append(chunk)
+            length += len(chunk)
+        output = _empty.join(chunks)
+        if size is None:
+            size = len(output)
+        self.__buffer = output[size:]
+        return output[:size]
+
+    def __decompress(self, data):
+        try:
+            chunk = self.__decompressor.decompress(data)
+        except zlib.error:
+            if not self.__maybeRawDeflate:
+                raise
+            # "deflate" is supposed to be zlib data, but some servers send raw deflate data
+            self.__decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+            chunk = self.__decompressor.decompress(data)
+        self.__maybeRawDeflate = False
+        return chunk
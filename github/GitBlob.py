@@ -73,6 +73,9 @@ class GitBlob(github.GithubObject.CompletableGithubObject):
         self._completeIfNotSet(self._url)
         return self._url.value
 
+    def _getGitObjectKey(self):
+        return "blob:" + self._sha.value
+
     def _initAttributes(self):
         self._content = github.GithubObject.NotSet
         self._encoding = github.GithubObject.NotSet
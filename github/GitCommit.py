@@ -104,6 +104,9 @@ class GitCommit(github.GithubObject.CompletableGithubObject):
     def _identity(self):
         return self.sha
 
+    def _getGitObjectKey(self):
+        return "commit:" + self._sha.value
+
     def _initAttributes(self):
         self._author = github.GithubObject.NotSet
         self._committer = github.GithubObject.NotSet
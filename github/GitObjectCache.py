@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import os
+
+from CacheStore import InMemoryCacheStore, FileSystemCacheStore
+
+
+class GitObjectCache:
+    """
+    Base class of the caches given as ``git_object_cache`` to :class:`github.MainClass.Github`, or as ``cache``
+    to :meth:`github.Repository.Repository.walk_git_tree`.
+
+    Git objects (blobs, trees, commits and tags) are addressed by the SHA of their content, so they never change and
+    are used from the cache without revalidation, by :meth:`github.Repository.Repository.get_git_blob` and the like,
+    and when lazy objects are completed. Entries are the raw data of the objects, as returned by the API.
+    Keys are their types and SHAs, like ``"tree:<sha>"``, followed by ``.recursive`` for recursive trees.
+    Subclasses must be safe to use from several threads.
+    """
+
+    def get(self, key):
+        """
+        :param key: string
+        :rtype: dict or None
+        """
+        raise NotImplementedError()
+
+    def set(self, key, data):
+        """
+        :param key: string
+        :param data: dict
+        """
+        raise NotImplementedError()
+
+
+class InMemoryGitObjectCache(InMemoryCacheStore, GitObjectCache):
+    """
+    Keeps the ``max_size`` most recently used Git objects in memory.
+    """
+
+    def __init__(self, max_size=1000):
+        """
+        :param max_size: integer
+        """
+        InMemoryCacheStore.__init__(self, max_size)
+
+
+class FileSystemGitObjectCache(GitObjectCache):
+    """
+    Stores Git objects as files in a directory, one sub-directory per type and per two first characters of their SHA,
+    so that they are kept from one run to the next, and keeps the ``memory_size`` most recently used ones in memory.
+    Nothing is ever removed: delete the directory to clear the cache.
+    """
+
+    def __init__(self, directory, memory_size=1000):
+        """
+        :param directory: string
+        :param memory_size: integer, 0 to not keep objects in memory
+        """
+        assert isinstance(memory_size, (int, long)) and memory_size >= 0, memory_size
+        self.__store = FileSystemCacheStore(directory)
+        self.__memory = None
+        if memory_size > 0:
+            self.__memory = InMemoryGitObjectCache(memory_size)
+
+    def get(self, key):
+        if self.__memory is not None:
+            data = self.__memory.get(key)
+            if data is not None:
+                return data
+        data = self.__read(key)
+        if data is not None and self.__memory is not None:
+            self.__memory.set(key, data)
+        return data
+
+    def set(self, key, data):
+        if self.__memory is not None:
+            self.__memory.set(key, data)
+        self.__store.write(self.__fileName(key), data)
+
+    def __read(self, key):
+        content = self.__store.read(self.__fileName(key))
+        if content is None:
+            return None
+        data, payload = content
+        return data
+
+    def __fileName(self, key):
+        type, sha = key.split(":", 1)
+        assert type in ("blob", "tree", "commit", "tag"), key
+        assert len(sha) > 2 and sha[:2].isalnum() and sha.replace(".", "").isalnum(), key
+        return os.path.join(type, sha[:2], sha[2:])
@@ -84,6 +84,9 @@ class GitTag(github.GithubObject.CompletableGithubObject):
         self._completeIfNotSet(self._url)
         return self._url.value
 
+    def _getGitObjectKey(self):
+        return "tag:" + self._sha.value
+
     def _initAttributes(self):
         self._message = github.GithubObject.NotSet
         self._object = github.GithubObject.NotSet
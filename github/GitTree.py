@@ -63,6 +63,9 @@ class GitTree(github.GithubObject.CompletableGithubObject):
     def _identity(self):
         return self.sha
 
+    def _getGitObjectKey(self):
+        return "tree:" + self._sha.value
+
     def _initAttributes(self):
         self._sha = github.GithubObject.NotSet
         self._tree = github.GithubObject.NotSet
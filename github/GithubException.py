@@ -116,3 +116,9 @@ class TwoFactorException(GithubException):
     """
     Exception raised when Github requires a onetime password for two-factor authentication
     """
+
+
+class TruncatedGitTreeException(GithubException):
+    """
+    Exception raised when Github truncates the listing of a single tree, that can't be split in smaller requests (when Github API replies with a 200 HTML status and a truncated tree)
+    """
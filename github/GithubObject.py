@@ -26,9 +26,12 @@
 # ##############################################################################
 
 import datetime
+import sys
+import threading
 
 import GithubException
 import Consts
+from github.WorkerPool import WorkerPool
 
 
 class _NotSetType:
@@ -39,12 +42,21 @@ class _NotSetType:
 NotSet = _NotSetType()
 
 
-class _ValuedAttribute:
+class _ValuedAttribute(object):
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
+# Attributes are immutable, so the most frequent ones can be shared by all objects
+_noneAttribute = _ValuedAttribute(None)
+_trueAttribute = _ValuedAttribute(True)
+_falseAttribute = _ValuedAttribute(False)
+
+
+class _BadAttribute(object):
+    __slots__ = ("__value", "__expectedType", "__exception")
 
-class _BadAttribute:
     def __init__(self, value, expectedType, exception=None):
         self.__value = value
         self.__expectedType = expectedType
@@ -55,11 +67,94 @@ class _BadAttribute:
         raise GithubException.BadAttributeException(self.__value, self.__expectedType, self.__exception)
 
 
+# Serialize the materialization of each object (see GithubObject.__materialize), so that an object shared between
+# threads is never seen half-built. Objects share a fixed set of locks instead of having one each, which would make
+# them much bigger. No object is built and no other lock is taken while one of these locks is held.
+_LAZY_LOCK_COUNT = 64
+_lazyLocks = [threading.RLock() for i in range(_LAZY_LOCK_COUNT)]
+
+
+def _getLazyLock(obj):
+    return _lazyLocks[(id(obj) >> 4) % _LAZY_LOCK_COUNT]
+
+
+class _LazyAttribute(object):
+    """
+    Attribute whose value is costly to build (datetime, nested object), so it is built on first access
+    """
+
+    __slots__ = ("__pending", "__expectedType", "__value")
+
+    def __init__(self, rawValue, expectedType, transform):
+        self.__pending = (rawValue, transform)
+        self.__expectedType = expectedType
+
+    @property
+    def value(self):
+        pending = self.__pending
+        if pending is not None:
+            # Built without lock (building a nested object takes other locks), then published by the first thread
+            rawValue, transform = pending
+            try:
+                value = transform(rawValue)
+            except Exception, e:
+                raise GithubException.BadAttributeException(rawValue, self.__expectedType, e)
+            lock = _getLazyLock(self)
+            lock.acquire()
+            try:
+                if self.__pending is not None:  # pragma no branch (Another thread built the value at the same time)
+                    self.__value = value
+                    self.__pending = None
+            finally:
+                lock.release()
+        return self.__value
+
+
+_PARSED_DATETIMES_CACHE_SIZE = 4096
+_parsedDatetimes = dict()
+
+
+class _AttributeRecorder:
+    pass
+
+
+class _Materializing:
+    pass
+
+
+class _GithubObjectType(type):
+    """
+    Adds to the ``__slots__`` of each class of PyGithub deriving from GithubObject the attributes set by
+    its ``_initAttributes``, so that its instances don't need a ``__dict__``.
+    Classes derived outside PyGithub keep their ``__dict__``.
+    """
+
+    def __new__(cls, name, bases, namespace):
+        if "_initAttributes" in namespace:
+            attributes = _AttributeRecorder()
+            try:
+                namespace["_initAttributes"](attributes)
+            except TypeError:  # pragma no cover (Derived class calling the _initAttributes of its base)
+                namespace["_attributeNames"] = None
+            else:
+                namespace["_attributeNames"] = frozenset(attributes.__dict__)
+                namespace["_hasInitialValues"] = any(value is not NotSet for value in attributes.__dict__.itervalues())
+        if namespace.get("__module__", "").split(".")[:-1] == ["github"]:
+            namespace["__slots__"] = tuple(namespace.get("__slots__", ())) + tuple(sorted(namespace.get("_attributeNames", ())))
+        return type.__new__(cls, name, bases, namespace)
+
+
 class GithubObject(object):
     """
     Base class for all classes representing objects returned by the API.
     """
 
+    __metaclass__ = _GithubObjectType
+    __slots__ = ("_requester", "_headers", "_rawData", "_pendingAttributes", "__weakref__")
+    # Attributes set by _initAttributes, and whether some are not initialized to NotSet
+    _attributeNames = frozenset()
+    _hasInitialValues = False
+
     '''
     A global debug flag to enable header validation by requester for all objects
     '''
@@ -71,7 +166,8 @@ class GithubObject(object):
 
     def __init__(self, requester, headers, attributes, completed):
         self._requester = requester
-        self._initAttributes()
+        # Attributes are set on first access (see __getattr__), so that building many objects is cheap
+        self._pendingAttributes = []
         self._storeAndUseAttributes(headers, attributes)
 
         # Ask requester to do some checking, for debug and test purpose
@@ -83,12 +179,61 @@ class GithubObject(object):
         # Make sure headers are assigned before calling _useAttributes
         # (Some derived classes will use headers in _useAttributes)
         self._headers = headers
-        self._rawData = attributes
+        self._rawData = attributes if self._requester.keep_raw_data else None
+        # Another thread may be materializing the pending attributes (see __materialize), or adding its own
+        lock = _getLazyLock(self)
+        lock.acquire()
+        try:
+            pendingAttributes = self._pendingAttributes
+            if pendingAttributes is not None and pendingAttributes is not _Materializing:
+                self._pendingAttributes = pendingAttributes + [attributes]
+                return
+        finally:
+            lock.release()
+        # Attributes are already set, or being set by this very thread (the lazy locks are reentrant)
         self._useAttributes(attributes)
 
+    def __getattr__(self, name):
+        # Called only for attributes not set yet
+        if name.startswith("__") or name == "_pendingAttributes":
+            raise AttributeError(name)
+        if self._pendingAttributes is not None:
+            self.__materialize()
+        if self._pendingAttributes is None:
+            # Attributes may have been set (by another thread) since name was looked up
+            try:
+                return object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+        if self._attributeNames is not None and name in self._attributeNames:
+            return NotSet
+        raise AttributeError(name)
+
+    def __materialize(self):
+        lock = _getLazyLock(self)
+        lock.acquire()
+        try:
+            pendingAttributes = self._pendingAttributes
+            if pendingAttributes is None or pendingAttributes is _Materializing:
+                return
+            self._pendingAttributes = _Materializing
+            try:
+                # Attributes not set by _useAttributes are NotSet (see __getattr__). _initAttributes is called
+                # only when needed, because other threads would see the NotSet it sets before _useAttributes ends.
+                if self._attributeNames is None or self._hasInitialValues:
+                    self._initAttributes()
+                for attributes in pendingAttributes:
+                    self._useAttributes(attributes)
+            finally:
+                self._pendingAttributes = None
+        finally:
+            lock.release()
+
     @property
     def raw_data(self):
         """
+        None if the :class:`github.MainClass.Github` instance was created with ``keep_raw_data=False``.
+
         :type: dict
         """
         self._completeIfNeeded()
@@ -108,7 +253,13 @@ class GithubObject(object):
 
     @staticmethod
     def __makeSimpleAttribute(value, type):
-        if value is None or isinstance(value, type):
+        if value is None:
+            return _noneAttribute
+        elif value is True and type is bool:
+            return _trueAttribute
+        elif value is False and type is bool:
+            return _falseAttribute
+        elif isinstance(value, type):
             return _ValuedAttribute(value)
         else:
             return _BadAttribute(value, type)
@@ -123,12 +274,9 @@ class GithubObject(object):
     @staticmethod
     def __makeTransformedAttribute(value, type, transform):
         if value is None:
-            return _ValuedAttribute(None)
+            return _noneAttribute
         elif isinstance(value, type):
-            try:
-                return _ValuedAttribute(transform(value))
-            except Exception, e:
-                return _BadAttribute(value, type, e)
+            return _LazyAttribute(value, type, transform)
         else:
             return _BadAttribute(value, type)
 
@@ -154,20 +302,90 @@ class GithubObject(object):
 
     @staticmethod
     def _makeDatetimeAttribute(value):
-        def parseDatetime(s):
-            if len(s) == 24:  # pragma no branch (This branch was used only when creating a download)
-                # The Downloads API has been removed. I'm keeping this branch because I have no mean
-                # to check if it's really useless now.
-                return datetime.datetime.strptime(s, "%Y-%m-%dT%H:%M:%S.000Z")  # pragma no cover (This branch was used only when creating a download)
-            elif len(s) == 25:
-                return datetime.datetime.strptime(s[:19], "%Y-%m-%dT%H:%M:%S") + (1 if s[19] == '-' else -1) * datetime.timedelta(hours=int(s[20:22]), minutes=int(s[23:25]))
-            else:
-                return datetime.datetime.strptime(s, "%Y-%m-%dT%H:%M:%SZ")
+        return GithubObject.__makeTransformedAttribute(value, (str, unicode), GithubObject._parseDatetime)
+
+    @staticmethod
+    def _parseDatetime(s):
+        """
+        Parses datetimes returned by the API ("2013-08-05T09:54:36Z", or with an offset like "+02:00"), in UTC.
+        Parsed values are cached because listings repeat the same timestamps again and again.
+        """
+        parsed = _parsedDatetimes.get(s)
+        if parsed is None:
+            parsed = GithubObject.__parseFixedFormatDatetime(s)
+            if parsed is None:
+                parsed = GithubObject.__parseDatetimeWithStrptime(s)
+            if len(_parsedDatetimes) >= _PARSED_DATETIMES_CACHE_SIZE:
+                _parsedDatetimes.clear()
+            _parsedDatetimes[s] = parsed
+        return parsed
+
+    @staticmethod
+    def __parseFixedFormatDatetime(s):
+        # Fields are at fixed positions, so slicing them is much faster than strptime.
+        # Returns None for anything unexpected, which strptime will parse or reject with a clear message.
+        length = len(s)
+        if length not in (20, 24, 25) or s[4] != "-" or s[7] != "-" or s[10] != "T" or s[13] != ":" or s[16] != ":":
+            return None
+        digits = s[0:4] + s[5:7] + s[8:10] + s[11:13] + s[14:16] + s[17:19]
+        if not digits.isdigit():
+            return None
+        if length == 20 and s[19] == "Z" or length == 24 and s[19:] == ".000Z":
+            offset = None
+        elif length == 25 and s[19] in "+-" and s[22] == ":" and (s[20:22] + s[23:25]).isdigit():
+            offset = (1 if s[19] == '-' else -1) * datetime.timedelta(hours=int(s[20:22]), minutes=int(s[23:25]))
+        else:
+            return None
+        n = int(digits)  # One conversion and some arithmetic is faster than six conversions
+        try:
+            parsed = datetime.datetime(n // 10000000000, n // 100000000 % 100, n // 1000000 % 100, n // 10000 % 100, n // 100 % 100, n % 100)
+        except ValueError:
+            return None
+        if offset is not None:
+            parsed += offset
+        return parsed
+
+    @staticmethod
+    def __parseDatetimeWithStrptime(s):
+        if len(s) == 24:  # pragma no branch (This branch was used only when creating a download)
+            # The Downloads API has been removed. I'm keeping this branch because I have no mean
+            # to check if it's really useless now.
+            return datetime.datetime.strptime(s, "%Y-%m-%dT%H:%M:%S.000Z")  # pragma no cover (This branch was used only when creating a download)
+        elif len(s) == 25:
+            return datetime.datetime.strptime(s[:19], "%Y-%m-%dT%H:%M:%S") + (1 if s[19] == '-' else -1) * datetime.timedelta(hours=int(s[20:22]), minutes=int(s[23:25]))
+        else:
+            return datetime.datetime.strptime(s, "%Y-%m-%dT%H:%M:%SZ")
+
+    @staticmethod
+    def _makeObject(klass, requester, headers, attributes, completed):
+        """
+        Returns ``klass(requester, headers, attributes, completed)``, or the object already returned for the same URL
+        if the requester has an identity map (see :class:`github.IdentityMap.IdentityMap`)
+        """
+        if requester.identity_map is not None and isinstance(klass, type) and issubclass(klass, CompletableGithubObject):
+            return requester.identity_map.get(klass, requester, headers, attributes, completed)
+        else:
+            return klass(requester, headers, attributes, completed=completed)
 
-        return GithubObject.__makeTransformedAttribute(value, (str, unicode), parseDatetime)
+    @staticmethod
+    def _getClassName(klass):
+        return klass.__module__ + "." + klass.__name__
+
+    @staticmethod
+    def _getClassByName(name):
+        # Names are read from files: only classes of PyGithub's modules can be created back
+        moduleName, className = name.rsplit(".", 1)
+        if not moduleName.startswith("github."):
+            raise ValueError("Not a PyGithub class: " + name)
+        __import__(moduleName)
+        klass = getattr(sys.modules[moduleName], className, None)
+        if not (isinstance(klass, type) and issubclass(klass, GithubObject)):
+            raise ValueError("Not a PyGithub class: " + name)
+        return klass
 
     def _makeClassAttribute(self, klass, value):
-        return GithubObject.__makeTransformedAttribute(value, dict, lambda value: klass(self._requester, self._headers, value, completed=False))
+        requester, headers = self._requester, self._headers
+        return GithubObject.__makeTransformedAttribute(value, dict, lambda value: GithubObject._makeObject(klass, requester, headers, value, False))
 
     @staticmethod
     def _makeListOfStringsAttribute(value):
@@ -183,13 +401,15 @@ class GithubObject(object):
 
     def _makeListOfClassesAttribute(self, klass, value):
         if isinstance(value, list) and all(isinstance(element, dict) for element in value):
-            return _ValuedAttribute([klass(self._requester, self._headers, element, completed=False) for element in value])
+            requester, headers = self._requester, self._headers
+            return _LazyAttribute(value, [dict], lambda value: [GithubObject._makeObject(klass, requester, headers, element, False) for element in value])
         else:
             return _BadAttribute(value, [dict])
 
     def _makeDictOfStringsToClassesAttribute(self, klass, value):
         if isinstance(value, dict) and all(isinstance(key, (str, unicode)) and isinstance(element, dict) for key, element in value.iteritems()):
-            return _ValuedAttribute(dict((key, klass(self._requester, self._headers, element, completed=False)) for key, element in value.iteritems()))
+            requester, headers = self._requester, self._headers
+            return _LazyAttribute(value, {(str, unicode): dict}, lambda value: dict((key, GithubObject._makeObject(klass, requester, headers, element, False)) for key, element in value.iteritems()))
         else:
             return _BadAttribute(value, {(str, unicode): dict})
 
@@ -209,11 +429,15 @@ class GithubObject(object):
 
 
 class NonCompletableGithubObject(GithubObject):
+    __slots__ = ()
+
     def _completeIfNeeded(self):
         pass
 
 
 class CompletableGithubObject(GithubObject):
+    __slots__ = ("__completed",)
+
     def __init__(self, requester, headers, attributes, completed):
         GithubObject.__init__(self, requester, headers, attributes, completed)
         self.__completed = completed
@@ -233,10 +457,64 @@ class CompletableGithubObject(GithubObject):
             self.__complete()
 
     def __complete(self):
+        headers, data = self.__requestCompletion()
+        self._completeWith(headers, data)
+
+    def __requestCompletion(self):
+        # Git objects never change: they are completed from the cache without revalidation
+        cache = self._requester.git_object_cache
+        key = None
+        if cache is not None:
+            key = self._getGitObjectKey()
+        if key is not None:
+            data = cache.get(key)
+            if data is not None:
+                return {}, data
         headers, data = self._requester.requestJsonAndCheck(
             "GET",
             self._url.value
         )
+        if key is not None:
+            cache.set(key, data)
+        return headers, data
+
+    def _getGitObjectKey(self):
+        """
+        The key of the object in a :class:`github.GitObjectCache.GitObjectCache`, for the Git objects, that never change
+        """
+        return None
+
+    def _isCompleted(self):
+        return self.__completed
+
+    @staticmethod
+    def _completeAll(objects, workers):
+        """
+        Completes the lazy objects among ``objects`` with at most ``workers`` concurrent requests, one for each distinct URL
+        """
+        objectsByUrl = dict()
+        urls = []
+        for obj in objects:
+            if isinstance(obj, CompletableGithubObject) and not obj._isCompleted():
+                url = obj._url.value
+                if url not in objectsByUrl:
+                    objectsByUrl[url] = []
+                    urls.append(url)
+                objectsByUrl[url].append(obj)
+
+        def get(url):
+            return objectsByUrl[url][0].__requestCompletion()
+
+        responses = WorkerPool(workers).imap(get, urls)
+        for url in urls:
+            headers, data = responses.next()
+            for obj in objectsByUrl[url]:
+                obj._completeWith(headers, data)
+
+    def _completeWith(self, headers, data):
+        """
+        Completes the object with the response of a GET on its URL made elsewhere (see :class:`github.AsyncGithub.AsyncGithub`)
+        """
         self._storeAndUseAttributes(headers, data)
         self.__completed = True
 
@@ -260,6 +538,5 @@ class CompletableGithubObject(GithubObject):
             return False
         else:
             headers, data = self._requester._Requester__check(status, responseHeaders, output)
-            self._storeAndUseAttributes(headers, data)
-            self.__completed = True
+            self._completeWith(headers, data)
             return True
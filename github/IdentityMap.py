@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import threading
+import weakref
+
+
+class IdentityMap:
+    """
+    Keeps at most one object for each class and URL, so that objects returned by different calls
+    (the owner of each repository of a list, the author of each issue...) are shared,
+    and completing one completes all of them.
+    Objects are referenced weakly: they are garbage collected as usual when no longer used.
+    URLs relative to the API (like the ones of lazy objects) and absolute ones identify the same objects.
+    """
+
+    def __init__(self, baseUrl):
+        """
+        :param baseUrl: string, the ``base_url`` of the :class:`github.MainClass.Github` instance
+        """
+        self.__baseUrl = baseUrl.rstrip("/")
+        self.__objects = weakref.WeakValueDictionary()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__objects)
+
+    def get(self, klass, requester, headers, attributes, completed):
+        """
+        Returns the object of class ``klass`` for the URL in ``attributes``, creating it if needed.
+        An existing object is updated with ``attributes`` unless it is completed and they are not.
+        """
+        url = attributes.get("url") if isinstance(attributes, dict) else None
+        if not isinstance(url, (str, unicode)):
+            return klass(requester, headers, attributes, completed)
+        if url.startswith("/"):
+            url = self.__baseUrl + url
+        key = (klass, url)
+        self.__lock.acquire()
+        try:
+            obj = self.__objects.get(key)
+        finally:
+            self.__lock.release()
+        if obj is None:
+            # Built without the lock: building an object takes other locks (see github.GithubObject)
+            created = klass(requester, headers, attributes, completed)
+            self.__lock.acquire()
+            try:
+                obj = self.__objects.get(key)
+                if obj is None:
+                    self.__objects[key] = created
+                    return created
+            finally:
+                self.__lock.release()
+            # Another thread stored its own object meanwhile: it is the one shared
+        if completed:
+            obj._completeWith(headers, attributes)
+        elif not obj._isCompleted():
+            obj._storeAndUseAttributes(headers, attributes)
+        return obj
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import threading
+
+import Consts
+import github.GithubObject
+import github.PaginatedList
+import github.Issue
+import github.IssueComment
+import github.NamedUser
+import github.Repository
+
+
+class IncrementalSync:
+    """
+    Returns only the objects created or updated since the previous call of the same method for the same
+    repository (or issue), using the ``since`` parameter of the API. The first page of each poll is
+    requested with the ETag of the previous poll when nothing changed since, so that an unchanged
+    endpoint costs a single request, answered by a "304 Not Modified" that doesn't count in the rate limit.
+
+    The high-water marks of all endpoints are a dict that can be dumped as JSON, to be given back
+    to the next instance::
+
+        sync = g.get_incremental_sync(json.load(open("watermarks.json")))
+        for issue in sync.get_issues(repo):
+            mirror(issue)
+        json.dump(sync.watermarks, open("watermarks.json", "w"))
+
+    The high-water mark of an endpoint is updated only once all its objects have been iterated.
+    Get instances from :meth:`github.MainClass.Github.get_incremental_sync`.
+    """
+
+    def __init__(self, requester, watermarks=None):
+        self.__requester = requester
+        self.__watermarks = dict((key, dict(watermark)) for key, watermark in (watermarks or {}).iteritems())
+        self.__lock = threading.Lock()
+
+    @property
+    def watermarks(self):
+        """
+        :type: dict
+        """
+        self.__lock.acquire()
+        try:
+            return dict((key, dict(watermark)) for key, watermark in self.__watermarks.iteritems())
+        finally:
+            self.__lock.release()
+
+    def get_issues(self, repo):
+        """
+        Issues and pull requests of ``repo`` created or updated since the previous sync, in the order of their update
+
+        :param repo: :class:`github.Repository.Repository`
+        :rtype: iterator of :class:`github.Issue.Issue`
+        """
+        assert isinstance(repo, github.Repository.Repository), repo
+        return self.__syncUpdated(github.Issue.Issue, repo.url + "/issues", {"state": "all", "sort": "updated", "direction": "asc"})
+
+    def get_issues_comments(self, repo):
+        """
+        Comments on the issues of ``repo`` created or updated since the previous sync, in the order of their update
+
+        :param repo: :class:`github.Repository.Repository`
+        :rtype: iterator of :class:`github.IssueComment.IssueComment`
+        """
+        assert isinstance(repo, github.Repository.Repository), repo
+        return self.__syncUpdated(github.IssueComment.IssueComment, repo.url + "/issues/comments", {"sort": "updated", "direction": "asc"})
+
+    def get_comments(self, issue):
+        """
+        Comments on ``issue`` created or updated since the previous sync
+
+        :param issue: :class:`github.Issue.Issue`
+        :rtype: iterator of :class:`github.IssueComment.IssueComment`
+        """
+        assert isinstance(issue, github.Issue.Issue), issue
+        return self.__syncUpdated(github.IssueComment.IssueComment, issue.url + "/comments", {})
+
+    def get_users(self):
+        """
+        Users created since the previous sync
+
+        :rtype: iterator of :class:`github.NamedUser.NamedUser`
+        """
+        return self.__syncCreated(github.NamedUser.NamedUser, "/users")
+
+    def get_repos(self):
+        """
+        Public repositories created since the previous sync
+
+        :rtype: iterator of :class:`github.Repository.Repository`
+        """
+        return self.__syncCreated(github.Repository.Repository, "/repositories")
+
+    def __syncUpdated(self, contentClass, url, parameters):
+        # The API returns the objects updated at "since" or later: the ids of the objects updated exactly
+        # at the high-water mark are kept, to skip them at the next poll
+        watermark = self.__getWatermark(url)
+        since = watermark.get("since")
+        seenIds = set(watermark.get("ids", []))
+        if since is not None:
+            parameters["since"] = since
+            sinceDate = github.GithubObject.GithubObject._parseDatetime(since)
+        newest, newestIds = since, seenIds
+        etag = None
+        for index, element in enumerate(self.__list(contentClass, url, parameters, watermark)):
+            if index == 0:
+                etag = element.etag
+            updated = element.updated_at
+            if since is not None and (updated < sinceDate or (updated == sinceDate and element.id in seenIds)):
+                continue
+            updated = updated.strftime("%Y-%m-%dT%H:%M:%SZ")
+            if newest is None or updated > newest:
+                newest, newestIds = updated, set([element.id])
+            elif updated == newest:
+                newestIds.add(element.id)
+            yield element
+        self.__setWatermark(url, watermark, etag, newest != since, {"since": newest, "ids": sorted(newestIds)})
+
+    def __syncCreated(self, contentClass, url):
+        # Objects are listed by increasing id, from the one after "since"
+        watermark = self.__getWatermark(url)
+        since = watermark.get("since")
+        parameters = dict()
+        if since is not None:
+            parameters["since"] = since
+        newest = since
+        etag = None
+        for index, element in enumerate(self.__list(contentClass, url, parameters, watermark)):
+            if index == 0:
+                etag = element.etag
+            if since is not None and element.id <= since:
+                continue
+            if newest is None or element.id > newest:
+                newest = element.id
+            yield element
+        self.__setWatermark(url, watermark, etag, newest != since, {"since": newest})
+
+    def __list(self, contentClass, url, parameters, watermark):
+        headers = dict()
+        if watermark.get("etag") is not None:
+            headers[Consts.REQ_IF_NONE_MATCH] = watermark["etag"]
+        return github.PaginatedList.PaginatedList(contentClass, self.__requester, url, parameters, headers)
+
+    def __getWatermark(self, key):
+        self.__lock.acquire()
+        try:
+            return dict(self.__watermarks.get(key, {}))
+        finally:
+            self.__lock.release()
+
+    def __setWatermark(self, key, previous, etag, changed, watermark):
+        # The ETag is valid for the same request, so only while "since" doesn't change. Without elements,
+        # the response was a 304 (or empty) and the previous ETag is still valid.
+        if changed:
+            watermark["etag"] = None
+        elif etag is None:
+            watermark["etag"] = previous.get("etag")
+        else:
+            watermark["etag"] = etag
+        self.__lock.acquire()
+        try:
+            self.__watermarks[key] = watermark
+        finally:
+            self.__lock.release()
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import codecs
+import sys
+
+atLeastPython26 = sys.hexversion >= 0x02060000
+
+if atLeastPython26:
+    import json
+else:  # pragma no cover (Covered by all tests with Python 2.5)
+    import simplejson as json  # pragma no cover (Covered by all tests with Python 2.5)
+
+
+class JsonStream:
+    """
+    Decodes a JSON document while it is read from a file-like object (typically an HTTP response).
+    The elements of the main array of the document are decoded and returned one by one,
+    so that neither the body of the response nor the whole decoded array is ever in memory.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, file, chunkSize=CHUNK_SIZE, onEnd=None):
+        """
+        :param file: object with a ``read(size)`` method
+        :param chunkSize: int, number of bytes read at once
+        :param onEnd: callable, called with True when the whole document has been read, or with False if decoding stopped before
+        """
+        self.__file = file
+        self.__chunkSize = chunkSize
+        self.__onEnd = onEnd
+        self.__decoder = json.JSONDecoder()
+        self.__utf8Decoder = codecs.getincrementaldecoder("utf-8")()
+        self.__buffer = u""
+        self.__position = 0
+        self.__eof = False
+        self.members = dict()
+
+    def elements(self, key=None):
+        """
+        Yields the elements of the document if it is an array, or of its member ``key`` if it is an object.
+        The other members of an object are stored in the ``members`` dict as they are decoded.
+        An empty document has no elements.
+
+        :param key: string
+        :rtype: iterator
+        """
+        try:
+            c = self.__peek()
+            if c == "[":
+                for element in self.__array():
+                    yield element
+            elif c == "{":
+                self.__position += 1
+                if self.__peek() == "}":
+                    self.__position += 1
+                else:
+                    while True:
+                        name = self.__value()
+                        self.__expect(":")
+                        if name == key and self.__peek() == "[":
+                            for element in self.__array():
+                                yield element
+                        else:
+                            self.members[name] = self.__value()
+                        if self.__expect(",}") == "}":
+                            break
+            elif c != "":
+                raise ValueError("Expecting an array or an object at position %i" % self.__position)
+            if self.__peek() != "":
+                raise ValueError("Extra data at position %i" % self.__position)
+        finally:
+            self.__end()
+
+    def __array(self):
+        self.__expect("[")
+        if self.__peek() == "]":
+            self.__position += 1
+            return
+        while True:
+            yield self.__value()
+            if self.__expect(",]") == "]":
+                return
+
+    def __value(self):
+        while True:
+            self.__peek()
+            try:
+                value, end = self.__decoder.raw_decode(self.__buffer, self.__position)
+                # A number at the end of the buffer may continue in the next chunk
+                complete = end < len(self.__buffer) or self.__eof
+            except ValueError:
+                if self.__eof:
+                    raise
+                complete = False
+            if complete:
+                self.__position = end
+                return value
+            # Read at least as much as already buffered, so that a large value is decoded in few attempts
+            self.__read(max(self.__chunkSize, len(self.__buffer) - self.__position))
+
+    def __expect(self, characters):
+        c = self.__peek()
+        if c == "" or c not in characters:
+            raise ValueError("Expecting one of '%s' at position %i" % (characters, self.__position))
+        self.__position += 1
+        return c
+
+    def __peek(self):
+        # Skips whitespace and returns the next character, or "" at the end of the document
+        while True:
+            while self.__position < len(self.__buffer) and self.__buffer[self.__position] in " \t\n\r":
+                self.__position += 1
+            if self.__position < len(self.__buffer):
+                return self.__buffer[self.__position]
+            if self.__eof:
+                return ""
+            self.__read(self.__chunkSize)
+
+    def __read(self, size):
+        chunk = self.__file.read(size)
+        self.__eof = len(chunk) == 0
+        if not isinstance(chunk, unicode):
+            chunk = self.__utf8Decoder.decode(chunk, self.__eof)
+        self.__buffer = self.__buffer[self.__position:] + chunk
+        self.__position = 0
+
+    def __end(self):
+        onEnd = self.__onEnd
+        self.__onEnd = None
+        if onEnd is not None:
+            onEnd(self.__eof)
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import threading
+
+
+class LruDict:
+    """
+    Keeps the ``maxSize`` most recently used entries of a mapping. Can be shared by several threads.
+
+    Entries are links of a circular doubly linked list, the most recently used last,
+    because ``collections.OrderedDict`` only exists from Python 2.7.
+    """
+
+    __PREVIOUS, __NEXT, __KEY, __VALUE = range(4)
+
+    def __init__(self, maxSize):
+        """
+        :param maxSize: int
+        """
+        self.__maxSize = maxSize
+        self.__links = dict()
+        self.__root = []
+        self.__root[:] = [self.__root, self.__root, None, None]
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__links)
+
+    def get(self, key):
+        """
+        :param key: hashable
+        :rtype: the value of ``key``, or None
+        """
+        self.__lock.acquire()
+        try:
+            link = self.__links.get(key)
+            if link is None:
+                return None
+            self.__unlink(link)
+            self.__append(link)
+            return link[self.__VALUE]
+        finally:
+            self.__lock.release()
+
+    def set(self, key, value):
+        """
+        :param key: hashable
+        :param value: anything but None
+        """
+        self.__lock.acquire()
+        try:
+            link = self.__links.pop(key, None)
+            if link is not None:
+                self.__unlink(link)
+            link = [None, None, key, value]
+            self.__append(link)
+            self.__links[key] = link
+            while len(self.__links) > self.__maxSize:
+                oldest = self.__root[self.__NEXT]
+                self.__unlink(oldest)
+                del self.__links[oldest[self.__KEY]]
+        finally:
+            self.__lock.release()
+
+    def __append(self, link):
+        last = self.__root[self.__PREVIOUS]
+        link[self.__PREVIOUS] = last
+        link[self.__NEXT] = self.__root
+        last[self.__NEXT] = link
+        self.__root[self.__PREVIOUS] = link
+
+    def __unlink(self, link):
+        link[self.__PREVIOUS][self.__NEXT] = link[self.__NEXT]
+        link[self.__NEXT][self.__PREVIOUS] = link[self.__PREVIOUS]
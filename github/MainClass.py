@@ -28,6 +28,7 @@
 
 import urllib
 import pickle
+import sys
 
 from Requester import Requester
 import AuthenticatedUser
@@ -43,21 +44,40 @@ import GitignoreTemplate
 import Status
 import StatusMessage
 import RateLimit
+import ResponseCache
+import IdentityMap
+import GitObjectCache
+import IncrementalSync
+import MirrorStore
+import RateLimitScheduler
+
+atLeastPython26 = sys.hexversion >= 0x02060000
+atLeastPython3 = sys.hexversion >= 0x03000000
+
+if atLeastPython26:
+    import json
+else:  # pragma no cover (Covered by all tests with Python 2.5)
+    import simplejson as json  # pragma no cover (Covered by all tests with Python 2.5)
 
 
 DEFAULT_BASE_URL = "https://api.github.com"
 DEFAULT_TIMEOUT = 10
 DEFAULT_PER_PAGE = 30
+DEFAULT_POOL_SIZE = 4
+DEFAULT_POOL_IDLE_TIMEOUT = 60
 
 
 class Github(object):
     """
     This is the main class you instanciate to access the Github API v3. Optional parameters allow different authentication methods.
+
+    A Github instance can be shared between threads: connections are kept in a thread-safe :class:`github.ConnectionPool.ConnectionPool`,
+    and rate limiting information is updated atomically. Objects returned by the API should be completed or modified by one thread at a time.
     """
 
-    def __init__(self, login_or_token=None, password=None, base_url=DEFAULT_BASE_URL, timeout=DEFAULT_TIMEOUT, client_id=None, client_secret=None, user_agent='PyGithub/Python', per_page=DEFAULT_PER_PAGE, api_preview=False):
+    def __init__(self, login_or_token=None, password=None, base_url=DEFAULT_BASE_URL, timeout=DEFAULT_TIMEOUT, client_id=None, client_secret=None, user_agent='PyGithub/Python', per_page=DEFAULT_PER_PAGE, api_preview=False, pool_size=DEFAULT_POOL_SIZE, pool_idle_timeout=DEFAULT_POOL_IDLE_TIMEOUT, response_cache=None, rate_limit_scheduler=None, keep_raw_data=True, identity_map=False, compression=True, adaptive_per_page=False, git_object_cache=None):
         """
-        :param login_or_token: string
+        :param login_or_token: string, or list of tokens (strings) and (login, password) tuples: each request then uses the credential with the most remaining rate limit
         :param password: string
         :param base_url: string
         :param timeout: integer
@@ -65,17 +85,36 @@ class Github(object):
         :param client_secret: string
         :param user_agent: string
         :param per_page: int
-        """
-
-        assert login_or_token is None or isinstance(login_or_token, (str, unicode)), login_or_token
+        :param pool_size: int, number of idle keep-alive connections kept per host (0 to open a new connection for each request)
+        :param pool_idle_timeout: integer, seconds after which an idle connection is not reused
+        :param response_cache: :class:`github.ResponseCache.ResponseCache`, to revalidate GET requests with their ETag and Last-Modified headers
+        :param rate_limit_scheduler: :class:`github.RateLimitScheduler.RateLimitScheduler`, to pace requests and wait for the rate limit reset instead of failing
+        :param keep_raw_data: bool, False to save memory by not keeping the :attr:`github.GithubObject.GithubObject.raw_data` of returned objects
+        :param identity_map: bool, True to return the same object each time the same URL is seen (see :class:`github.IdentityMap.IdentityMap`)
+        :param compression: bool, False to receive responses uncompressed instead of compressed with gzip or deflate
+        :param adaptive_per_page: bool, True to request larger pages, up to 100 elements, when a :class:`github.PaginatedList.PaginatedList` is iterated beyond its second page
+        :param git_object_cache: :class:`github.GitObjectCache.GitObjectCache`, to get Git blobs, trees, commits and tags without requests once they have been seen
+        """
+
+        assert login_or_token is None or isinstance(login_or_token, (str, unicode)) or (isinstance(login_or_token, list) and all(isinstance(credential, (str, unicode)) or (isinstance(credential, tuple) and len(credential) == 2) for credential in login_or_token)), login_or_token
         assert password is None or isinstance(password, (str, unicode)), password
+        assert password is None or not isinstance(login_or_token, list), password
         assert isinstance(base_url, (str, unicode)), base_url
         assert isinstance(timeout, (int, long)), timeout
         assert client_id is None or isinstance(client_id, (str, unicode)), client_id
         assert client_secret is None or isinstance(client_secret, (str, unicode)), client_secret
         assert user_agent is None or isinstance(user_agent, (str, unicode)), user_agent
         assert isinstance(api_preview, (bool))
-        self.__requester = Requester(login_or_token, password, base_url, timeout, client_id, client_secret, user_agent, per_page, api_preview)
+        assert isinstance(pool_size, (int, long)) and pool_size >= 0, pool_size
+        assert isinstance(pool_idle_timeout, (int, long, float)), pool_idle_timeout
+        assert response_cache is None or isinstance(response_cache, ResponseCache.ResponseCache), response_cache
+        assert rate_limit_scheduler is None or isinstance(rate_limit_scheduler, RateLimitScheduler.RateLimitScheduler), rate_limit_scheduler
+        assert isinstance(keep_raw_data, bool), keep_raw_data
+        assert isinstance(identity_map, bool), identity_map
+        assert isinstance(compression, bool), compression
+        assert isinstance(adaptive_per_page, bool), adaptive_per_page
+        assert git_object_cache is None or isinstance(git_object_cache, GitObjectCache.GitObjectCache), git_object_cache
+        self.__requester = Requester(login_or_token, password, base_url, timeout, client_id, client_secret, user_agent, per_page, api_preview, pool_size, pool_idle_timeout, response_cache, rate_limit_scheduler, keep_raw_data, IdentityMap.IdentityMap(base_url) if identity_map else None, compression, adaptive_per_page, git_object_cache)
 
     def __get_FIX_REPO_GET_GIT_REF(self):
         """
@@ -107,6 +146,7 @@ class Github(object):
     def rate_limiting(self):
         """
         First value is requests remaining, second value is request limit.
+        With several credentials, these are the values of the credential used by the last request.
         :type: (int, int)
         """
         remaining, limit = self.__requester.rate_limiting
@@ -144,6 +184,52 @@ class Github(object):
         """
         return self.__requester.oauth_scopes
 
+    def get_async_client(self, loop=None):
+        """
+        Returns awaitable variants of the most used calls, sharing the credentials and settings of this instance.
+        Requires Python 3.5.2 or later, and no proxy.
+
+        :param loop: asyncio event loop, defaults to the current one
+        :rtype: :class:`github.AsyncGithub.AsyncGithub`
+        """
+        import AsyncGithub  # asyncio is not available in Python 2
+        return AsyncGithub.AsyncGithub(self.__requester, loop)
+
+    def get_incremental_sync(self, watermarks=None):
+        """
+        Returns an object listing only the objects created or updated since its previous calls, sharing the credentials and settings of this instance.
+
+        :param watermarks: dict, the :attr:`github.IncrementalSync.IncrementalSync.watermarks` of a previous instance
+        :rtype: :class:`github.IncrementalSync.IncrementalSync`
+        """
+        assert watermarks is None or isinstance(watermarks, dict), watermarks
+        return IncrementalSync.IncrementalSync(self.__requester, watermarks)
+
+    def open_mirror_store(self, filename):
+        """
+        Opens (or creates) a local store of the raw data of objects, creating back objects that share the credentials and settings of this instance.
+
+        :param filename: string, the name of a SQLite database file, or ":memory:"
+        :rtype: :class:`github.MirrorStore.MirrorStore`
+        """
+        assert isinstance(filename, (str, unicode)), filename
+        return MirrorStore.MirrorStore(self.__requester, filename)
+
+    def complete_all(self, objects, workers=8):
+        """
+        Completes lazy objects, like the elements of a :class:`github.PaginatedList.PaginatedList`, concurrently.
+        Otherwise, each one is completed by a blocking request when one of its missing attributes is first read.
+        Objects with the same URL are completed by a single request.
+
+        :param objects: list of :class:`github.GithubObject.GithubObject`
+        :param workers: int, maximum number of concurrent requests
+        :rtype: list of :class:`github.GithubObject.GithubObject` (``objects``)
+        """
+        assert isinstance(workers, (int, long)) and workers > 0, workers
+        objects = list(objects)
+        github.GithubObject.CompletableGithubObject._completeAll(objects, workers)
+        return objects
+
     def get_user(self, login=github.GithubObject.NotSet):
         """
         :calls: `GET /users/:user <http://developer.github.com/v3/users>`_ or `GET /user <http://developer.github.com/v3/users>`_
@@ -158,7 +244,7 @@ class Github(object):
                 "GET",
                 "/users/" + login
             )
-            return github.NamedUser.NamedUser(self.__requester, headers, data, completed=True)
+            return github.GithubObject.GithubObject._makeObject(github.NamedUser.NamedUser, self.__requester, headers, data, True)
 
     def get_users(self, since=github.GithubObject.NotSet):
         """
@@ -188,7 +274,7 @@ class Github(object):
             "GET",
             "/orgs/" + login
         )
-        return github.Organization.Organization(self.__requester, headers, data, completed=True)
+        return github.GithubObject.GithubObject._makeObject(github.Organization.Organization, self.__requester, headers, data, True)
 
     def get_repo(self, full_name_or_id, lazy=True):
         """
@@ -199,12 +285,12 @@ class Github(object):
         url_base = "/repositories/" if isinstance(full_name_or_id, int) or isinstance(full_name_or_id, long) else "/repos/"
         url = "%s%s" % (url_base, full_name_or_id)
         if lazy:
-            return Repository.Repository(self.__requester, {}, {"url": url}, completed=False)
+            return github.GithubObject.GithubObject._makeObject(Repository.Repository, self.__requester, {}, {"url": url}, False)
         headers, data = self.__requester.requestJsonAndCheck(
             "GET",
             "%s%s" % (url_base, full_name_or_id)
         )
-        return Repository.Repository(self.__requester, headers, data, completed=True)
+        return github.GithubObject.GithubObject._makeObject(Repository.Repository, self.__requester, headers, data, True)
 
     def get_repos(self, since=github.GithubObject.NotSet):
         """
@@ -537,7 +623,10 @@ class Github(object):
         :param obj: the object to pickle
         :param file: the file-like object to pickle to
         :param protocol: the `pickling protocol <http://docs.python.org/2.7/library/pickle.html#data-stream-format>`_
+        :raises: ValueError if the Github instance was created with ``keep_raw_data=False``
         """
+        if not obj._requester.keep_raw_data:
+            raise ValueError("Objects can't be dumped when the Github instance is created with keep_raw_data=False")
         pickle.dump((obj.__class__, obj.raw_data, obj.raw_headers), file, protocol)
 
     def load(self, f):
@@ -549,6 +638,48 @@ class Github(object):
         """
         return self.create_from_raw_data(*pickle.load(f))
 
+    def dump_many(self, objects, file):
+        """
+        Dumps PyGithub objects to a binary file-like object, as one line of JSON ``[class name, raw_data, raw_headers, completed]`` per object.
+        This is more compact and much faster than :meth:`dump`, and :meth:`load_many` can only create PyGithub objects.
+        Objects are dumped as they are, without completing them: objects loaded from lazy ones are completed on demand as usual. As with :meth:`dump`, NO EFFORT is made to remove sensitive information from the object's attributes.
+
+        :param objects: iterable of PyGithub objects, for example a :class:`github.PaginatedList.PaginatedList`
+        :param file: the file-like object to write to
+        :rtype: integer, the number of dumped objects
+        :raises: ValueError if the Github instance was created with ``keep_raw_data=False``
+        """
+        count = 0
+        for obj in objects:
+            if obj._rawData is None:
+                raise ValueError("Objects can't be dumped when the Github instance is created with keep_raw_data=False")
+            completed = not isinstance(obj, github.GithubObject.CompletableGithubObject) or obj._isCompleted()
+            line = json.dumps([github.GithubObject.GithubObject._getClassName(obj.__class__), obj._rawData, obj._headers, completed], separators=(",", ":")) + "\n"
+            if atLeastPython3:
+                line = line.encode("utf-8")  # pragma no cover (Covered by Persistence tests with Python 3)
+            file.write(line)
+            count += 1
+        return count
+
+    def load_many(self, file):
+        """
+        Loads the PyGithub objects dumped by :meth:`dump_many` from a file-like object, while they are iterated.
+
+        :param file: the file-like object to read from
+        :rtype: iterator of PyGithub objects
+        """
+        classes = dict()
+        for line in file:
+            if atLeastPython3 and isinstance(line, bytes):
+                line = line.decode("utf-8")  # pragma no cover (Covered by Persistence tests with Python 3)
+            if line.strip() == "":
+                continue
+            className, data, headers, completed = json.loads(line)
+            klass = classes.get(className)
+            if klass is None:
+                klass = classes[className] = github.GithubObject.GithubObject._getClassByName(className)
+            yield github.GithubObject.GithubObject._makeObject(klass, self.__requester, headers, data, completed)
+
     def get_api_status(self):
         """
         This doesn't work with a Github Enterprise installation, because it always targets https://status.github.com.
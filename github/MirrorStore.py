@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import datetime
+import sqlite3
+import sys
+import threading
+
+import github.GithubObject
+
+atLeastPython26 = sys.hexversion >= 0x02060000
+
+if atLeastPython26:
+    import json
+else:  # pragma no cover (Covered by all tests with Python 2.5)
+    import simplejson as json  # pragma no cover (Covered by all tests with Python 2.5)
+
+
+class MirrorStore:
+    """
+    Stores the :attr:`github.GithubObject.GithubObject.raw_data` of many objects in a SQLite database, so that they
+    can be queried locally instead of requesting the API. Objects of any class can be stored in the same database,
+    indexed by class and URL, id, number and update date. Storing an object with the URL of an already stored object replaces it.
+
+    Objects are stored as they were received, without completing them, and are created back (like by
+    :meth:`github.MainClass.Github.create_from_raw_data`) only while the results of a query are iterated,
+    so that a query over a large mirror doesn't need to keep it in memory::
+
+        store = g.open_mirror_store("issues.sqlite")
+        store.put_many(repo.get_issues(state="all"))
+        for issue in store.find(github.Issue.Issue, updated_since=datetime.datetime(2014, 1, 1)):
+            ...
+
+    Get instances from :meth:`github.MainClass.Github.open_mirror_store`.
+    """
+
+    BATCH_SIZE = 1000
+
+    def __init__(self, requester, filename):
+        self.__requester = requester
+        self.__connection = sqlite3.connect(filename, check_same_thread=False)
+        self.__lock = threading.Lock()
+        self.__execute(
+            "CREATE TABLE IF NOT EXISTS objects (class TEXT NOT NULL, url TEXT NOT NULL PRIMARY KEY, id INTEGER, number INTEGER, updated_at TEXT, raw_data TEXT NOT NULL, raw_headers TEXT NOT NULL)",
+            "CREATE INDEX IF NOT EXISTS objects_id ON objects (class, id)",
+            "CREATE INDEX IF NOT EXISTS objects_number ON objects (class, number)",
+            "CREATE INDEX IF NOT EXISTS objects_updated_at ON objects (class, updated_at)",
+        )
+
+    def __len__(self):
+        return self.count()
+
+    def close(self):
+        self.__connection.close()
+
+    def put(self, obj):
+        """
+        :param obj: :class:`github.GithubObject.GithubObject`
+        """
+        self.put_many([obj])
+
+    def put_many(self, objects):
+        """
+        Stores objects by batches of :attr:`BATCH_SIZE`, one transaction each, iterating them only once
+        (a :class:`github.PaginatedList.PaginatedList` can be given). The store is usable by other threads, and from
+        the iteration itself, while objects are iterated. If the iteration fails, the objects of its last batch are not stored.
+
+        :param objects: iterable of :class:`github.GithubObject.GithubObject`
+        :rtype: integer, the number of stored objects
+        :raises: ValueError if the Github instance was created with ``keep_raw_data=False``
+        """
+        count = 0
+        batch = []
+        for obj in objects:
+            batch.append(self.__makeRow(obj))
+            if len(batch) == self.BATCH_SIZE:
+                self.__insert(batch)
+                count += len(batch)
+                batch = []
+        self.__insert(batch)
+        count += len(batch)
+        return count
+
+    def get(self, url):
+        """
+        :param url: string
+        :rtype: :class:`github.GithubObject.GithubObject` or None
+        """
+        return self.__first("url = ?", [url])
+
+    def get_by_id(self, klass, id):
+        """
+        :param klass: the class of the object
+        :param id: integer
+        :rtype: instance of class ``klass`` or None
+        """
+        return self.__first("class = ? AND id = ?", [github.GithubObject.GithubObject._getClassName(klass), id])
+
+    def find(self, klass, number=github.GithubObject.NotSet, url_prefix=github.GithubObject.NotSet, updated_since=github.GithubObject.NotSet):
+        """
+        Objects of class ``klass`` matching all the given criteria, in the order they were first stored
+
+        :param klass: the class of the objects
+        :param number: integer
+        :param url_prefix: string, for example the URL of a repository to find only its issues
+        :param updated_since: datetime.datetime
+        :rtype: iterator of instances of class ``klass``
+        """
+        where, parameters = self.__makeWhere(klass, number, url_prefix, updated_since)
+        # Rows are read by batches, after the last rowid read, so that objects can be stored while iterating
+        lastRowId = -1
+        while True:
+            rows = self.__select("SELECT rowid, class, raw_data, raw_headers FROM objects WHERE " + where + " AND rowid > ? ORDER BY rowid LIMIT ?", parameters + [lastRowId, self.BATCH_SIZE])
+            for row in rows:
+                yield self.__makeObject(row[1:])
+            if len(rows) < self.BATCH_SIZE:
+                break
+            lastRowId = rows[-1][0]
+
+    def count(self, klass=github.GithubObject.NotSet, number=github.GithubObject.NotSet, url_prefix=github.GithubObject.NotSet, updated_since=github.GithubObject.NotSet):
+        """
+        The number of objects that :meth:`find` would return
+
+        :param klass: the class of the objects
+        :param number: integer
+        :param url_prefix: string
+        :param updated_since: datetime.datetime
+        :rtype: integer
+        """
+        where, parameters = self.__makeWhere(klass, number, url_prefix, updated_since)
+        return self.__select("SELECT COUNT(*) FROM objects WHERE " + where, parameters)[0][0]
+
+    def delete(self, url):
+        """
+        :param url: string
+        """
+        self.__lock.acquire()
+        try:
+            self.__connection.execute("DELETE FROM objects WHERE url = ?", [url])
+            self.__connection.commit()
+        finally:
+            self.__lock.release()
+
+    def __makeWhere(self, klass, number, url_prefix, updated_since):
+        assert number is github.GithubObject.NotSet or isinstance(number, (int, long)), number
+        assert url_prefix is github.GithubObject.NotSet or isinstance(url_prefix, (str, unicode)), url_prefix
+        assert updated_since is github.GithubObject.NotSet or isinstance(updated_since, datetime.datetime), updated_since
+        conditions = ["1"]
+        parameters = []
+        if klass is not github.GithubObject.NotSet:
+            conditions.append("class = ?")
+            parameters.append(github.GithubObject.GithubObject._getClassName(klass))
+        if number is not github.GithubObject.NotSet:
+            conditions.append("number = ?")
+            parameters.append(number)
+        if url_prefix is not github.GithubObject.NotSet:
+            # A range instead of LIKE, to use the primary key index and not interpret "%" and "_"
+            conditions.append("url >= ? AND url < ?")
+            parameters += [url_prefix, url_prefix + u"\U0010ffff"]
+        if updated_since is not github.GithubObject.NotSet:
+            conditions.append("updated_at >= ?")
+            parameters.append(updated_since.strftime("%Y-%m-%dT%H:%M:%SZ"))
+        return " AND ".join(conditions), parameters
+
+    def __first(self, where, parameters):
+        rows = self.__select("SELECT class, raw_data, raw_headers FROM objects WHERE " + where + " LIMIT 1", parameters)
+        if len(rows) == 0:
+            return None
+        return self.__makeObject(rows[0])
+
+    def __makeRow(self, obj):
+        # Objects are stored as they are, without completing them: the elements of a PaginatedList are stored as listed
+        data = obj._rawData
+        if data is None:
+            raise ValueError("Objects can't be stored when the Github instance is created with keep_raw_data=False")
+        if not isinstance(data.get("url"), (str, unicode)):
+            raise ValueError("Objects without an url can't be stored: " + repr(obj))
+        return (github.GithubObject.GithubObject._getClassName(obj.__class__), data["url"], data.get("id"), data.get("number"), data.get("updated_at"), json.dumps(data), json.dumps(obj._headers))
+
+    def __makeObject(self, row):
+        className, data, headers = row
+        klass = github.GithubObject.GithubObject._getClassByName(className)
+        return github.GithubObject.GithubObject._makeObject(klass, self.__requester, json.loads(headers), json.loads(data), True)
+
+    def __insert(self, rows):
+        # The lock is not held while objects are iterated: their iteration may make requests, or use the store
+        if len(rows) == 0:
+            return
+        self.__lock.acquire()
+        try:
+            try:
+                # Not "INSERT OR REPLACE", that would give a new rowid to replaced objects, and move them in the order of find
+                self.__connection.executemany("UPDATE objects SET class = ?, id = ?, number = ?, updated_at = ?, raw_data = ?, raw_headers = ? WHERE url = ?", [row[:1] + row[2:] + row[1:2] for row in rows])
+                self.__connection.executemany("INSERT OR IGNORE INTO objects VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+                self.__connection.commit()
+            except:
+                self.__connection.rollback()
+                raise
+        finally:
+            self.__lock.release()
+
+    def __select(self, query, parameters):
+        self.__lock.acquire()
+        try:
+            return self.__connection.execute(query, parameters).fetchall()
+        finally:
+            self.__lock.release()
+
+    def __execute(self, *statements):
+        self.__lock.acquire()
+        try:
+            for statement in statements:
+                self.__connection.execute(statement)
+            self.__connection.commit()
+        finally:
+            self.__lock.release()
@@ -113,6 +113,7 @@ class Notification(github.GithubObject.CompletableGithubObject):
         self._last_read_at = github.GithubObject.NotSet
         self._repository = github.GithubObject.NotSet
         self._reason = github.GithubObject.NotSet
+        self._subject = github.GithubObject.NotSet
         self._subscription_url = github.GithubObject.NotSet
         self._unread = github.GithubObject.NotSet
         self._updated_at = github.GithubObject.NotSet
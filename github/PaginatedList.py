@@ -27,12 +27,20 @@
 #                                                                              #
 # ##############################################################################
 
+import threading
+import urllib
+import urlparse
+
 import github.GithubObject
+from github.WorkerPool import WorkerPool
 
 
 class PaginatedListBase:
     def __init__(self):
         self.__elements = list()
+        # Several threads may iterate the same list: pages are fetched
+        # under this lock so that each one is requested only once.
+        self.__lock = threading.RLock()
 
     def __getitem__(self, index):
         assert isinstance(index, (int, slice))
@@ -43,24 +51,41 @@ class PaginatedListBase:
             return self._Slice(self, index)
 
     def __iter__(self):
-        for element in self.__elements:
-            yield element
-        while self._couldGrow():
-            newElements = self._grow()
-            for element in newElements:
-                yield element
+        index = 0
+        while True:
+            while index < len(self.__elements):
+                yield self.__elements[index]
+                index += 1
+            if not self.__growBeyond(index):
+                return
 
     def _isBiggerThan(self, index):
         return len(self.__elements) > index or self._couldGrow()
 
     def __fetchToIndex(self, index):
-        while len(self.__elements) <= index and self._couldGrow():
-            self._grow()
+        while len(self.__elements) <= index:
+            if not self.__growBeyond(len(self.__elements)):
+                return
+
+    def __growBeyond(self, size):
+        # Fetches the next page unless another thread already did, and tells
+        # if there are now more than ``size`` elements (or could be)
+        self.__lock.acquire()
+        try:
+            if len(self.__elements) <= size and self._couldGrow():
+                self._grow()
+            return len(self.__elements) > size or self._couldGrow()
+        finally:
+            self.__lock.release()
 
     def _grow(self):
-        newElements = self._fetchNextPage()
-        self.__elements += newElements
-        return newElements
+        self.__lock.acquire()
+        try:
+            newElements = self._fetchNextPage()
+            self.__elements += newElements
+            return newElements
+        finally:
+            self.__lock.release()
 
     class _Slice:
         def __init__(self, theList, theSlice):
@@ -105,8 +130,22 @@ class PaginatedList(PaginatedListBase):
 
         some_repos = user.get_repos().get_page(0)
         some_other_repos = user.get_repos().get_page(3)
+
+    A PaginatedList can be iterated and indexed concurrently by several threads: each page is fetched only once.
+
+    To iterate a long list faster, you can fetch its pages concurrently (see :meth:`prefetch`)::
+
+        for issue in repo.get_issues().prefetch(workers=8):
+            print issue.title
+
+    And if you read attributes missing from the elements of the list, you can complete them concurrently (see :meth:`completed`).
+
+    The number of elements of each page can be set for a single list (see :meth:`with_per_page`).
     """
 
+    MAX_PER_PAGE = 100
+    CURSOR_HEADERS = ["Accept"]  # Headers kept in cursors, which must never hold credentials
+
     def __init__(self, contentClass, requester, firstUrl, firstParams, headers=None):
         PaginatedListBase.__init__(self)
         self.__requester = requester
@@ -116,10 +155,20 @@ class PaginatedList(PaginatedListBase):
         self.__nextUrl = firstUrl
         self.__nextParams = firstParams or {}
         self.__headers = headers
-        if self.__requester.per_page != 30:
-            self.__nextParams["per_page"] = self.__requester.per_page
+        self.__perPage = self.__requester.per_page
+        if self.__perPage != 30:
+            self.__nextParams["per_page"] = self.__perPage
         self._reversed = False
+        self.__startUrl = self.__nextUrl
+        self.__startParams = dict(self.__nextParams)
         self.__totalCount = None
+        self.__prefetchWorkers = None
+        self.__prefetchedPages = None
+        self.__lastPrefetchedPage = None
+        self.__firstIndex = 0  # Index of the first element in the original list, when resumed from a cursor
+        self.__firstPageOffset = 0  # Number of elements of the first page to skip, when resumed from a cursor
+        self.__fetchedCount = 0
+        self.__pages = []  # (index of the first element, url, parameters) of each page fetched
 
     @property
     def totalCount(self):
@@ -142,6 +191,7 @@ class PaginatedList(PaginatedListBase):
     @property
     def reversed(self):
         r = PaginatedList(self.__contentClass, self.__requester, self.__firstUrl, self.__firstParams)
+        r.with_per_page(self.__perPage)
         r.__reverse()
         return r
 
@@ -150,40 +200,293 @@ class PaginatedList(PaginatedListBase):
         lastUrl = self._getLastPageUrl()
         if lastUrl:
             self.__nextUrl = lastUrl
+            self.__startUrl = lastUrl
 
     def _couldGrow(self):
         return self.__nextUrl is not None
 
+    def with_per_page(self, per_page):
+        """
+        Sets the number of elements of the pages requested for this list, instead of the ``per_page``
+        of :class:`github.MainClass.Github`. It must be set before the first page is fetched::
+
+            for commit in repo.get_commits().with_per_page(10):
+                print commit.sha
+
+        :param per_page: int, from 1 to 100
+        :rtype: :class:`github.PaginatedList.PaginatedList` (this list)
+        """
+        assert isinstance(per_page, (int, long)) and 0 < per_page <= self.MAX_PER_PAGE, per_page
+        assert self.__nextParams is not None and not self._reversed and self.__startUrl == self.__firstUrl, "The page size must be set before fetching pages"
+        self.__perPage = per_page
+        for parameters in (self.__nextParams, self.__startParams):
+            if per_page != 30:
+                parameters["per_page"] = per_page
+            else:
+                parameters.pop("per_page", None)
+        return self
+
+    def cursor(self, index):
+        """
+        Returns a cursor to iterate the list from its element ``index`` later, even in another process
+        (see :meth:`resume`). ``index`` can be the index of an element already fetched, or of the element
+        following them, typically the next one of an iteration. The cursor is a dict that can be pickled
+        or dumped as JSON::
+
+            for index, issue in enumerate(issues):
+                process(issue)
+                checkpoint(json.dumps(issues.cursor(index + 1)))
+
+        :param index: int
+        :rtype: dict
+        """
+        position = self.__firstIndex + index
+        assert 0 <= index and position <= self.__fetchedCount, index
+        if position == self.__fetchedCount:
+            url, parameters, offset = self.__nextUrl, self.__nextParams, self.__firstPageOffset
+        else:
+            for start, url, parameters in reversed(self.__pages):  # pragma no branch (A page starts before position)
+                if start <= position:
+                    break
+            offset = position - start
+        return {
+            "url": url,
+            "params": dict(parameters or {}),
+            "headers": dict((name, value) for name, value in (self.__headers or {}).items() if name in self.CURSOR_HEADERS),
+            "index": position,
+            "offset": offset,
+            "reversed": self._reversed,
+        }
+
+    def resume(self, cursor):
+        """
+        Makes the list start at the element of ``cursor`` (see :meth:`cursor`), which must come from a list
+        created by the same method with the same arguments. Indexes of the list are then relative to this element.
+        It must be called before the first page is fetched::
+
+            issues = repo.get_issues(state="all").resume(json.loads(checkpoint))
+
+        :param cursor: dict
+        :rtype: :class:`github.PaginatedList.PaginatedList` (this list)
+        """
+        assert self.__nextParams is not None and self.__fetchedCount == self.__firstIndex, "The cursor must be set before fetching pages"
+        self.__nextUrl = self.__startUrl = cursor["url"]
+        self.__nextParams = dict(cursor["params"])
+        self.__startParams = dict(cursor["params"])
+        self.__headers = dict(cursor["headers"])
+        self._reversed = cursor["reversed"]
+        self.__firstIndex = self.__fetchedCount = cursor["index"]
+        self.__firstPageOffset = cursor["offset"]
+        return self
+
+    def prefetch(self, workers=8):
+        """
+        Fetches the remaining pages concurrently, with at most ``workers`` requests in flight, as soon as
+        a page gives the URL of the last page. Elements are still iterated in order.
+        This has no effect on :attr:`reversed` lists and on lists not paginated by page number.
+
+        :param workers: int
+        :rtype: :class:`github.PaginatedList.PaginatedList` (this list)
+        """
+        assert isinstance(workers, (int, long)) and workers > 0, workers
+        self.__prefetchWorkers = workers
+        return self
+
+    def completed(self, workers=8):
+        """
+        Iterates over the elements, completing the elements of each page concurrently
+        (see :meth:`github.MainClass.Github.complete_all`)::
+
+            for stargazer in repo.get_stargazers().completed(workers=8):
+                print stargazer.company
+
+        :param workers: int, maximum number of concurrent requests
+        :rtype: iterator
+        """
+        assert isinstance(workers, (int, long)) and workers > 0, workers
+        batch = []
+        for element in self:
+            batch.append(element)
+            if len(batch) >= self.__lastPerPage():
+                github.GithubObject.CompletableGithubObject._completeAll(batch, workers)
+                for element in batch:
+                    yield element
+                batch = []
+        github.GithubObject.CompletableGithubObject._completeAll(batch, workers)
+        for element in batch:
+            yield element
+
+    def __lastPerPage(self):
+        # Size of the last page requested: set by with_per_page, or grown with adaptive_per_page (see __grownPageUrl)
+        if len(self.__pages) == 0:
+            return self.__perPage
+        start, url, parameters = self.__pages[-1]
+        perPage = urlparse.parse_qs(urlparse.urlparse(url).query).get("per_page")
+        if perPage is not None:
+            return int(perPage[0])
+        return int((parameters or {}).get("per_page", 30))
+
+    def streamed(self):
+        """
+        Iterates over the elements, decoding each page while it is received (see :class:`github.JsonStream.JsonStream`).
+        Unlike the list itself, this doesn't keep the elements, so memory use doesn't grow
+        with the size of pages or of the list::
+
+            for issue in repo.get_issues(state="all").streamed():
+                print issue.title
+
+        Elements of :attr:`reversed` lists are decoded a page at a time.
+
+        :rtype: iterator
+        """
+        url, parameters, headers, offset = self._firstPageRequest()
+        while url is not None:
+            responseHeaders, stream = self.__requester.requestJsonStream("GET", url, parameters=parameters, headers=headers)
+            links = self.__parseLinkHeader(responseHeaders)
+            elements = (
+                github.GithubObject.GithubObject._makeObject(self.__contentClass, self.__requester, responseHeaders, element, False)
+                for element in stream.elements("items") if element is not None
+            )
+            if self._reversed:
+                elements = list(elements)[::-1]
+            for element in elements:
+                if offset > 0:
+                    offset -= 1
+                    continue
+                yield element
+            if "total_count" in stream.members:
+                self.__totalCount = stream.members["total_count"]
+            url = links.get("prev" if self._reversed else "next")
+            if url is not None and not self._reversed:
+                url = self.__grownPageUrl(url)
+            parameters = None
+
     def _fetchNextPage(self):
-        headers, data = self.__requester.requestJsonAndCheck(
-            "GET",
-            self.__nextUrl,
-            parameters=self.__nextParams,
-            headers=self.__headers
-        )
+        url, parameters = self.__nextUrl, self.__nextParams
+        headers, data = self.__getNextPage()
+        content, self.__nextUrl, links = self._usePage(headers, data)
+        self.__nextParams = None
+        self.__pages.append((self.__fetchedCount - self.__firstPageOffset, url, parameters))
+        content = content[self.__firstPageOffset:]
+        self.__firstPageOffset = 0
+        self.__fetchedCount += len(content)
+
+        if self.__nextUrl is not None and not self._reversed:
+            if self.__prefetchWorkers is not None and self.__prefetchedPages is None and "last" in links:
+                self.__startPrefetch(links["next"], links["last"])
+            self.__nextUrl = self.__grownPageUrl(self.__nextUrl)
+
+        return content
+
+    def _firstPageRequest(self):
+        """
+        Returns the arguments ``(url, parameters, headers)`` of the request for the first page to iterate,
+        and the number of elements to skip at the beginning of this page
+        """
+        return self.__startUrl, dict(self.__startParams), self.__headers, self.__firstPageOffset
+
+    def _usePage(self, headers, data):
+        """
+        Returns the elements of a page, the URL of the page to iterate after it (or None) and all its links
+        """
         data = data if data else []
 
-        self.__nextUrl = None
+        nextUrl = None
+        links = {}
         if len(data) > 0:
             links = self.__parseLinkHeader(headers)
             if self._reversed:
                 if "prev" in links:
-                    self.__nextUrl = links["prev"]
+                    nextUrl = links["prev"]
             elif "next" in links:
-                self.__nextUrl = links["next"]
-        self.__nextParams = None
+                nextUrl = links["next"]
 
         if 'items' in data:
             self.__totalCount = data['total_count']
             data = data["items"]
 
         content = [
-            self.__contentClass(self.__requester, headers, element, completed=False)
+            github.GithubObject.GithubObject._makeObject(self.__contentClass, self.__requester, headers, element, False)
             for element in data if element is not None
         ]
         if self._reversed:
-            return content[::-1]
-        return content
+            content = content[::-1]
+        return content, nextUrl, links
+
+    def __getNextPage(self):
+        if self.__prefetchedPages is not None:
+            nextPage = self.__pageNumber(self.__nextUrl)
+            try:
+                page, headers, data = self.__prefetchedPages.next()
+            except StopIteration:  # pragma no cover (Defensive: the last prefetched page stops the prefetch)
+                page = None
+            except:
+                self.__prefetchedPages = None
+                raise
+            if page == self.__lastPrefetchedPage or page != nextPage:
+                self.__prefetchedPages.close()
+                self.__prefetchedPages = None
+            if page == nextPage:
+                return headers, data
+        return self.__requester.requestJsonAndCheck(
+            "GET",
+            self.__nextUrl,
+            parameters=self.__nextParams,
+            headers=self.__headers
+        )
+
+    def __startPrefetch(self, nextUrl, lastUrl):
+        nextPage = self.__pageNumber(nextUrl)
+        lastPage = self.__pageNumber(lastUrl)
+        if nextPage is None or lastPage is None or nextPage > lastPage:
+            return
+
+        def fetch(page):
+            headers, data = self.__requester.requestJsonAndCheck(
+                "GET",
+                self.__makePageUrl(nextUrl, page),
+                headers=self.__headers
+            )
+            return page, headers, data
+
+        self.__lastPrefetchedPage = lastPage
+        self.__prefetchedPages = WorkerPool(self.__prefetchWorkers).imap(fetch, range(nextPage, lastPage + 1))
+
+    def __grownPageUrl(self, url):
+        # Once two pages have been fetched in a row, the list is probably scanned entirely: with
+        # adaptive_per_page, larger pages are requested. Their size divides the number of elements
+        # already fetched, so that the next page starts right after them.
+        if not self.__requester.adaptive_per_page or self.__prefetchWorkers is not None:
+            return url
+        parameters = urlparse.parse_qs(urlparse.urlparse(url).query)
+        if "page" not in parameters:
+            return url
+        page = int(parameters["page"][0])
+        perPage = int(parameters.get("per_page", ["30"])[0])
+        if page < 3:
+            return url
+        fetched = (page - 1) * perPage
+        for size in range(self.MAX_PER_PAGE, perPage, -1):
+            if fetched % size == 0:
+                return self.__makePageUrl(url, fetched // size + 1, size)
+        return url
+
+    @staticmethod
+    def __pageNumber(url):
+        pages = urlparse.parse_qs(urlparse.urlparse(url).query).get("page")
+        if pages is None:
+            return None
+        return int(pages[0])
+
+    @staticmethod
+    def __makePageUrl(url, page, perPage=None):
+        o = urlparse.urlparse(url)
+        replaced = ("page", "per_page") if perPage is not None else ("page",)
+        parameters = [(key, value) for key, value in urlparse.parse_qsl(o.query) if key not in replaced]
+        parameters.append(("page", page))
+        if perPage is not None:
+            parameters.append(("per_page", perPage))
+        return urlparse.urlunparse(o[:4] + (urllib.urlencode(parameters),) + o[5:])
 
     def __parseLinkHeader(self, headers):
         links = {}
@@ -200,8 +503,8 @@ class PaginatedList(PaginatedListBase):
         params = dict(self.__firstParams)
         if page != 0:
             params["page"] = page + 1
-        if self.__requester.per_page != 30:
-            params["per_page"] = self.__requester.per_page
+        if self.__perPage != 30:
+            params["per_page"] = self.__perPage
         headers, data = self.__requester.requestJsonAndCheck(
             "GET",
             self.__firstUrl,
@@ -214,6 +517,6 @@ class PaginatedList(PaginatedListBase):
             data = data["items"]
 
         return [
-            self.__contentClass(self.__requester, headers, element, completed=False)
+            github.GithubObject.GithubObject._makeObject(self.__contentClass, self.__requester, headers, element, False)
             for element in data
         ]
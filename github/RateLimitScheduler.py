@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import email.utils
+import threading
+import time
+
+
+class RateLimitScheduler:
+    """
+    Schedules the requests of a :class:`github.MainClass.Github` instance according to its rate limit.
+    Pass an instance as the ``rate_limit_scheduler`` argument of :class:`github.MainClass.Github`.
+
+    * With ``pace=True``, requests are spaced so that the remaining budget lasts until the reset time
+      announced by the API, instead of being spent in a burst and then waiting.
+    * When the budget is exhausted, the next request waits until the reset time instead of failing.
+    * A request answered 403 or 429 with a ``Retry-After`` header (abuse detection) or with no remaining budget
+      is retried after the requested delay, at most ``max_retries`` times.
+
+    Waits longer than ``max_wait`` seconds are not done: the request is sent (or fails) as without a scheduler.
+    ``on_wait(seconds, reason)`` is called before each wait, with ``reason`` one of
+    :attr:`PACE`, :attr:`RESET` and :attr:`RETRY_AFTER`. ``sleep`` and ``clock`` can be replaced for testing.
+
+    A scheduler can be shared by several :class:`github.MainClass.Github` instances and threads.
+    """
+
+    PACE = "pace"
+    RESET = "reset"
+    RETRY_AFTER = "retry-after"
+    DEFAULT_RETRY_AFTER = 60  # Seconds, when the Retry-After header can't be parsed
+
+    def __init__(self, pace=True, max_retries=3, max_wait=None, reset_margin=1, on_wait=None, sleep=time.sleep, clock=time.time):
+        """
+        :param pace: bool
+        :param max_retries: int
+        :param max_wait: number of seconds, or None for no limit
+        :param reset_margin: number of seconds, added to the reset time to compensate for clock skew
+        :param on_wait: callable(seconds, reason)
+        :param sleep: callable(seconds)
+        :param clock: callable returning the current Unix timestamp
+        """
+        assert isinstance(pace, bool), pace
+        assert isinstance(max_retries, (int, long)) and max_retries >= 0, max_retries
+        assert max_wait is None or isinstance(max_wait, (int, long, float)), max_wait
+        assert isinstance(reset_margin, (int, long, float)), reset_margin
+        self.__pace = pace
+        self.__maxRetries = max_retries
+        self.__maxWait = max_wait
+        self.__resetMargin = reset_margin
+        self.__onWait = on_wait
+        self.__sleep = sleep
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__nextSlot = 0
+
+    def beforeRequest(self, remaining, resetTime):
+        """
+        Waits, if needed, before sending a request with the budget known from previous responses
+
+        :param remaining: int, -1 if unknown
+        :param resetTime: int, Unix timestamp, 0 if unknown
+        """
+        now = self.__clock()
+        if remaining == 0:
+            self.__wait(resetTime + self.__resetMargin - now, self.RESET)
+        elif self.__pace and remaining > 0 and resetTime > now:
+            interval = float(resetTime - now) / remaining
+            self.__lock.acquire()
+            try:
+                slot = max(now, self.__nextSlot)
+                self.__nextSlot = slot + interval
+            finally:
+                self.__lock.release()
+            self.__wait(slot - now, self.PACE)
+
+    def afterResponse(self, status, responseHeaders, attempt):
+        """
+        Waits and returns True if the request must be sent again
+
+        :param status: int
+        :param responseHeaders: dict
+        :param attempt: int, number of previous retries of this request
+        :rtype: bool
+        """
+        if status not in (403, 429) or attempt >= self.__maxRetries:
+            return False
+        if "retry-after" in responseHeaders:
+            return self.__wait(self.__parseRetryAfter(responseHeaders["retry-after"]), self.RETRY_AFTER)
+        elif responseHeaders.get("x-ratelimit-remaining") == "0" and "x-ratelimit-reset" in responseHeaders:
+            return self.__wait(int(responseHeaders["x-ratelimit-reset"]) + self.__resetMargin - self.__clock(), self.RESET)
+        else:
+            return False
+
+    def __parseRetryAfter(self, value):
+        # A number of seconds, or an HTTP-date like "Tue, 06 Aug 2013 15:27:22 GMT"
+        try:
+            return int(value)
+        except ValueError:
+            date = email.utils.parsedate_tz(value)
+            if date is None:
+                return self.DEFAULT_RETRY_AFTER
+            return email.utils.mktime_tz(date) - self.__clock()
+
+    def __wait(self, seconds, reason):
+        if self.__maxWait is not None and seconds > self.__maxWait:
+            return False
+        if seconds > 0:
+            if self.__onWait is not None:
+                self.__onWait(seconds, reason)
+            self.__sleep(seconds)
+        return True
@@ -33,7 +33,8 @@
 import sys
 import urllib
 import datetime
-from base64 import b64encode
+from base64 import b64decode
+import fnmatch
 
 import github.GithubObject
 import github.PaginatedList
@@ -58,6 +59,13 @@ import github.GitCommit
 import github.Team
 import github.Commit
 import github.GitTree
+import github.GitTreeElement
+import github.GitObjectCache
+import github.CommitGraph
+import github.CommitBuilder
+from github.WorkerPool import WorkerPool
+from github.GithubException import TruncatedGitTreeException
+from github.Base64JsonBody import Base64JsonBody
 import github.Hook
 import github.Tag
 import github.GitTag
@@ -73,7 +81,6 @@ import github.StatsPunchCard
 import github.Stargazer
 
 atLeastPython26 = sys.hexversion >= 0x02060000
-atLeastPython3 = sys.hexversion >= 0x03000000
 
 class Repository(github.GithubObject.CompletableGithubObject):
     """
@@ -679,19 +686,79 @@ class Repository(github.GithubObject.CompletableGithubObject):
         )
         return github.Comparison.Comparison(self._requester, headers, data, completed=True)
 
+    def compare_git_trees(self, base, head):
+        """
+        :calls: `GET /repos/:owner/:repo/git/trees/:sha <http://developer.github.com/v3/git/trees>`_, for each tree not in the ``git_object_cache`` of the :class:`github.MainClass.Github` instance
+        :param base: string, the SHA of a tree or of a commit
+        :param head: string, the SHA of a tree or of a commit
+        :rtype: iterator of (status, base element, head element) tuples, with status "added", "removed" or "modified", and elements :class:`github.GitTreeElement.GitTreeElement` or None
+
+        Compares the recursive trees of two commits locally, unlike :meth:`compare` that is truncated by the API for large differences.
+        Only blobs and submodules are compared, in the order of their paths, in a time linear in the size of the trees.
+        When the API truncates a large recursive tree, its subtrees are requested one by one.
+        A blob whose mode changed is "modified".
+        """
+        assert isinstance(base, (str, unicode)), base
+        assert isinstance(head, (str, unicode)), head
+        baseElements = self.__getSortedGitTreeElements(base)
+        headElements = self.__getSortedGitTreeElements(head)
+        return (
+            (status, self.__makeGitTreeElement(baseElement), self.__makeGitTreeElement(headElement))
+            for status, baseElement, headElement in Repository.__compareGitTreeElements(baseElements, headElements)
+        )
+
+    def __getSortedGitTreeElements(self, sha):
+        elements = [element for element in self.__getRecursiveGitTreeElements(self._requester.git_object_cache, sha) if element["type"] != "tree"]
+        # The API lists paths in Git's order, where "a/b" comes after "a-b"
+        for i in xrange(1, len(elements)):
+            if elements[i - 1]["path"] > elements[i]["path"]:
+                elements.sort(key=lambda element: element["path"])
+                break
+        return elements
+
+    @staticmethod
+    def __compareGitTreeElements(baseElements, headElements):
+        i, j = 0, 0
+        while i < len(baseElements) and j < len(headElements):
+            baseElement, headElement = baseElements[i], headElements[j]
+            if baseElement["path"] == headElement["path"]:
+                if baseElement["sha"] != headElement["sha"] or baseElement["mode"] != headElement["mode"]:
+                    yield "modified", baseElement, headElement
+                i += 1
+                j += 1
+            elif baseElement["path"] < headElement["path"]:
+                yield "removed", baseElement, None
+                i += 1
+            else:
+                yield "added", None, headElement
+                j += 1
+        for baseElement in baseElements[i:]:
+            yield "removed", baseElement, None
+        for headElement in headElements[j:]:
+            yield "added", None, headElement
+
+    def __makeGitTreeElement(self, data):
+        if data is None:
+            return None
+        return github.GitTreeElement.GitTreeElement(self._requester, {}, data, completed=True)
+
     def create_git_blob(self, content, encoding):
         """
         :calls: `POST /repos/:owner/:repo/git/blobs <http://developer.github.com/v3/git/blobs>`_
-        :param content: string
-        :param encoding: string
+        :param content: string, or bytes, bytearray, mmap or file-like object opened in binary mode, streamed and base64-encoded while it is sent
+        :param encoding: string, must be "base64" if content is not a string
         :rtype: :class:`github.GitBlob.GitBlob`
         """
-        assert isinstance(content, (str, unicode)), content
+        assert isinstance(content, (str, unicode)) or Base64JsonBody.accepts(content), content
         assert isinstance(encoding, (str, unicode)), encoding
-        post_parameters = {
-            "content": content,
-            "encoding": encoding,
-        }
+        if isinstance(content, (str, unicode)):
+            post_parameters = {
+                "content": content,
+                "encoding": encoding,
+            }
+        else:
+            assert encoding == "base64", encoding
+            post_parameters = Base64JsonBody("content", content, {"encoding": encoding})
         headers, data = self._requester.requestJsonAndCheck(
             "POST",
             self.url + "/git/blobs",
@@ -1206,6 +1273,21 @@ class Repository(github.GithubObject.CompletableGithubObject):
             url_parameters
         )
 
+    def get_commit_builder(self, branch):
+        """
+        :param branch: string, the name of an existing branch
+        :rtype: :class:`github.CommitBuilder.CommitBuilder`
+        """
+        assert isinstance(branch, (str, unicode)), branch
+        return github.CommitBuilder.CommitBuilder(self, branch)
+
+    def get_commit_graph(self):
+        """
+        :calls: `GET /repos/:owner/:repo/commits <http://developer.github.com/v3/repos/commits>`_, only when commits are not loaded yet
+        :rtype: :class:`github.CommitGraph.CommitGraph`
+        """
+        return github.CommitGraph.CommitGraph(self)
+
     def get_contents(self, path, ref=github.GithubObject.NotSet):
         """
         :calls: `GET /repos/:owner/:repo/contents/:path <http://developer.github.com/v3/repos/contents>`_
@@ -1242,7 +1324,7 @@ class Repository(github.GithubObject.CompletableGithubObject):
         :calls: `PUT /repos/:owner/:repo/contents/:path <http://developer.github.com/v3/repos/contents#create-a-file>`_
         :param path: string, (required), path of the file in the repository
         :param message: string, (required), commit message
-        :param content: string, (required), the actual data in the file
+        :param content: string, bytes, bytearray, mmap or file-like object opened in binary mode, (required), the actual data in the file, streamed and base64-encoded while it is sent
         :param branch: string, (optional), branch to create the commit on. Defaults to the default branch of the repository
         :param committer: dict, (optional), if no information is given the authenticated user's information will be used. You must specify both a name and email.
         :param author: dict, (optional), if omitted this will be filled in with committer information. If passed, you must specify both a name and email.
@@ -1254,8 +1336,9 @@ class Repository(github.GithubObject.CompletableGithubObject):
             'path must be str/unicode object'
         assert isinstance(message, (str, unicode)),                \
             'message must be str/unicode object'
-        assert isinstance(content, (str, unicode)),                \
-            'content must be a str/unicode object'
+        assert isinstance(content, (str, unicode))                 \
+            or Base64JsonBody.accepts(content),                    \
+            'content must be a str/unicode, bytes, mmap or file-like object'
         assert branch is github.GithubObject.NotSet                \
             or isinstance(branch, (str, unicode)),                 \
             'branch must be a str/unicode object'
@@ -1266,13 +1349,9 @@ class Repository(github.GithubObject.CompletableGithubObject):
             or isinstance(committer, github.InputGitAuthor),       \
             'committer must be a github.InputGitAuthor object'
 
-        if atLeastPython3:
-            content = b64encode(content.encode('utf-8')).decode('utf-8')
-        else:
-            if isinstance(content, unicode):
-                content = content.encode('utf-8')
-            content = b64encode(content)
-        put_parameters = {'message': message, 'content': content}
+        if isinstance(content, unicode):
+            content = content.encode('utf-8')
+        put_parameters = {'message': message}
 
         if branch is not github.GithubObject.NotSet:
             put_parameters['branch'] = branch
@@ -1284,7 +1363,7 @@ class Repository(github.GithubObject.CompletableGithubObject):
         headers, data = self._requester.requestJsonAndCheck(
             "PUT",
             self.url + "/contents" + path,
-            input=put_parameters
+            input=Base64JsonBody('content', content, put_parameters)
         )
 
         return {'content': github.ContentFile.ContentFile(self._requester, headers, data["content"], completed=False),
@@ -1298,7 +1377,7 @@ class Repository(github.GithubObject.CompletableGithubObject):
         :calls: `PUT /repos/:owner/:repo/contents/:path <http://developer.github.com/v3/repos/contents#update-a-file>`_
         :param path: string, Required. The content path.
         :param message: string, Required. The commit message.
-        :param content: string, Required. The updated file content, Base64 encoded.
+        :param content: string, bytes, bytearray, mmap or file-like object opened in binary mode, Required. The updated file content, streamed and base64-encoded while it is sent.
         :param sha: string, Required. The blob SHA of the file being replaced.
         :param branch: string. The branch name. Default: the repository’s default branch (usually master)
         :rtype: {
@@ -1309,8 +1388,9 @@ class Repository(github.GithubObject.CompletableGithubObject):
             'path must be str/unicode object'
         assert isinstance(message, (str, unicode)),                \
             'message must be str/unicode object'
-        assert isinstance(content, (str, unicode)),                \
-            'content must be a str/unicode object'
+        assert isinstance(content, (str, unicode))                 \
+            or Base64JsonBody.accepts(content),                    \
+            'content must be a str/unicode, bytes, mmap or file-like object'
         assert isinstance(sha, (str, unicode)),                    \
             'sha must be a str/unicode object'
         assert branch is github.GithubObject.NotSet                \
@@ -1323,15 +1403,10 @@ class Repository(github.GithubObject.CompletableGithubObject):
             or isinstance(committer, github.InputGitAuthor),       \
             'committer must be a github.InputGitAuthor object'
 
-        if atLeastPython3:
-            content = b64encode(content.encode('utf-8')).decode('utf-8')
-        else:
-            if isinstance(content, unicode):
-                content = content.encode('utf-8')
-            content = b64encode(content)
+        if isinstance(content, unicode):
+            content = content.encode('utf-8')
 
-        put_parameters = {'message': message, 'content': content,
-                          'sha': sha}
+        put_parameters = {'message': message, 'sha': sha}
 
         if branch is not github.GithubObject.NotSet:
             put_parameters['branch'] = branch
@@ -1343,7 +1418,7 @@ class Repository(github.GithubObject.CompletableGithubObject):
         headers, data = self._requester.requestJsonAndCheck(
             "PUT",
             self.url + "/contents" + path,
-            input=put_parameters
+            input=Base64JsonBody('content', content, put_parameters)
         )
 
         return {'commit': github.Commit.Commit(self._requester, headers, data["commit"], completed=True),
@@ -1483,10 +1558,7 @@ class Repository(github.GithubObject.CompletableGithubObject):
         :rtype: :class:`github.GitBlob.GitBlob`
         """
         assert isinstance(sha, (str, unicode)), sha
-        headers, data = self._requester.requestJsonAndCheck(
-            "GET",
-            self.url + "/git/blobs/" + sha
-        )
+        headers, data = self.__requestGitObject(self._requester.git_object_cache, "blob", sha)
         return github.GitBlob.GitBlob(self._requester, headers, data, completed=True)
 
     def get_git_commit(self, sha):
@@ -1496,10 +1568,7 @@ class Repository(github.GithubObject.CompletableGithubObject):
         :rtype: :class:`github.GitCommit.GitCommit`
         """
         assert isinstance(sha, (str, unicode)), sha
-        headers, data = self._requester.requestJsonAndCheck(
-            "GET",
-            self.url + "/git/commits/" + sha
-        )
+        headers, data = self.__requestGitObject(self._requester.git_object_cache, "commit", sha)
         return github.GitCommit.GitCommit(self._requester, headers, data, completed=True)
 
     def get_git_ref(self, ref):
@@ -1537,10 +1606,7 @@ class Repository(github.GithubObject.CompletableGithubObject):
         :rtype: :class:`github.GitTag.GitTag`
         """
         assert isinstance(sha, (str, unicode)), sha
-        headers, data = self._requester.requestJsonAndCheck(
-            "GET",
-            self.url + "/git/tags/" + sha
-        )
+        headers, data = self.__requestGitObject(self._requester.git_object_cache, "tag", sha)
         return github.GitTag.GitTag(self._requester, headers, data, completed=True)
 
     def get_git_tree(self, sha, recursive=github.GithubObject.NotSet):
@@ -1552,15 +1618,137 @@ class Repository(github.GithubObject.CompletableGithubObject):
         """
         assert isinstance(sha, (str, unicode)), sha
         assert recursive is github.GithubObject.NotSet or isinstance(recursive, bool), recursive
+        headers, data = self.__requestGitObject(self._requester.git_object_cache, "tree", sha, recursive)
+        return github.GitTree.GitTree(self._requester, headers, data, completed=True)
+
+    def get_git_tree_elements(self, sha, recursive=github.GithubObject.NotSet):
+        """
+        :calls: `GET /repos/:owner/:repo/git/trees/:sha <http://developer.github.com/v3/git/trees>`_
+        :param sha: string
+        :param recursive: bool
+        :rtype: iterator of :class:`github.GitTreeElement.GitTreeElement`
+
+        Like :meth:`get_git_tree`, but the elements are decoded while the response is received, so that large recursive trees are never entirely in memory.
+        Except when the :class:`github.MainClass.Github` instance has a ``git_object_cache``: then the tree is cached like by :meth:`get_git_tree`.
+        """
+        assert isinstance(sha, (str, unicode)), sha
+        assert recursive is github.GithubObject.NotSet or isinstance(recursive, bool), recursive
+        if self._requester.git_object_cache is not None:
+            return iter(self.get_git_tree(sha, recursive).tree)
         url_parameters = dict()
         if recursive is not github.GithubObject.NotSet:
             url_parameters["recursive"] = recursive
-        headers, data = self._requester.requestJsonAndCheck(
+        headers, stream = self._requester.requestJsonStream(
             "GET",
             self.url + "/git/trees/" + sha,
             parameters=url_parameters
         )
-        return github.GitTree.GitTree(self._requester, headers, data, completed=True)
+        return (github.GitTreeElement.GitTreeElement(self._requester, headers, element, completed=True) for element in stream.elements("tree"))
+
+    def walk_git_tree(self, sha, path_filter=github.GithubObject.NotSet, workers=8, cache=github.GithubObject.NotSet):
+        """
+        :calls: `GET /repos/:owner/:repo/git/trees/:sha <http://developer.github.com/v3/git/trees>`_ and `GET /repos/:owner/:repo/git/blobs/:sha <http://developer.github.com/v3/git/blobs>`_
+        :param sha: string
+        :param path_filter: string (a pattern like ``"*.py"``, matched against the whole path) or callable taking a path and returning a bool
+        :param workers: int, maximum number of concurrent requests
+        :param cache: :class:`github.GitObjectCache.GitObjectCache`, by default the ``git_object_cache`` of the :class:`github.MainClass.Github` instance
+        :rtype: iterator of (path, content) tuples, with content as bytes
+
+        Yields the content of the blobs of the tree ``sha`` and of its subtrees, in the order of the tree.
+        Blobs are downloaded concurrently, a few ahead of the consumer, so that the contents are never all in memory.
+        When the API truncates a large recursive tree, its subtrees are requested one by one.
+        The tree and the blobs found in ``cache`` are not downloaded, and downloaded ones are added to it.
+        """
+        assert isinstance(sha, (str, unicode)), sha
+        assert path_filter is github.GithubObject.NotSet or isinstance(path_filter, (str, unicode)) or callable(path_filter), path_filter
+        assert isinstance(workers, (int, long)) and workers > 0, workers
+        assert cache is github.GithubObject.NotSet or cache is None or isinstance(cache, github.GitObjectCache.GitObjectCache), cache
+        if cache is github.GithubObject.NotSet:
+            cache = self._requester.git_object_cache
+        if isinstance(path_filter, (str, unicode)):
+            pattern = path_filter
+            path_filter = lambda path: fnmatch.fnmatchcase(path, pattern)
+        # The tree is read entirely before downloading blobs, to not keep its connection open during the downloads.
+        # Only the paths and SHAs of the matching blobs are kept.
+        blobs = [
+            (element["path"], element["sha"]) for element in self.__getRecursiveGitTreeElements(cache, sha)
+            if element["type"] == "blob" and (path_filter is github.GithubObject.NotSet or path_filter(element["path"]))
+        ]
+
+        def download(blob):
+            path, sha = blob
+            headers, data = self.__requestGitObject(cache, "blob", sha)
+            return path, Repository.__decodeBlob(data)
+
+        return WorkerPool(workers).imap(download, blobs)
+
+    def __requestGitObject(self, cache, type, sha, recursive=github.GithubObject.NotSet):
+        # Git objects never change: the ones in the cache are used without revalidation.
+        # The trees endpoint also accepts the SHA of a commit or the name of a branch, so objects are cached
+        # by the SHA returned by the API, and looked up before the request only when given a full SHA.
+        parameters = dict()
+        if recursive is not github.GithubObject.NotSet:
+            parameters["recursive"] = recursive
+        if cache is not None and Repository.__isFullSha(sha):
+            data = cache.get(Repository.__getGitObjectKey(type, sha, recursive))
+            if data is not None:
+                return {}, data
+        headers, data = self._requester.requestJsonAndCheck(
+            "GET",
+            self.url + "/git/" + type + "s/" + sha,
+            parameters=parameters
+        )
+        if cache is not None and not data.get("truncated"):
+            cache.set(Repository.__getGitObjectKey(type, data["sha"], recursive), data)
+        return headers, data
+
+    def __getRecursiveGitTreeElements(self, cache, sha):
+        # The API truncates large recursive trees: the subtrees of a truncated tree are then listed one by one
+        if cache is None:
+            # Elements are decoded while the response is received, without keeping it entirely in memory
+            headers, stream = self._requester.requestJsonStream(
+                "GET",
+                self.url + "/git/trees/" + sha,
+                parameters={"recursive": True}
+            )
+            elements = list(stream.elements("tree"))
+            data = stream.members
+        else:
+            headers, data = self.__requestGitObject(cache, "tree", sha, True)
+            elements = data["tree"]
+        if not data.get("truncated"):
+            return elements
+        headers, data = self.__requestGitObject(cache, "tree", data["sha"])
+        if data.get("truncated"):
+            raise TruncatedGitTreeException(200, {"message": "Tree " + data["sha"] + " is truncated"})
+        elements = []
+        for element in data["tree"]:
+            elements.append(element)
+            if element["type"] == "tree":
+                for subElement in self.__getRecursiveGitTreeElements(cache, element["sha"]):
+                    subElement = dict(subElement)
+                    subElement["path"] = element["path"] + "/" + subElement["path"]
+                    elements.append(subElement)
+        return elements
+
+    @staticmethod
+    def __getGitObjectKey(type, sha, recursive):
+        # The API returns the recursive tree for any value of the "recursive" parameter
+        if recursive is github.GithubObject.NotSet:
+            return type + ":" + sha
+        else:
+            return type + ":" + sha + ".recursive"
+
+    @staticmethod
+    def __isFullSha(sha):
+        return len(sha) == 40 and sha.strip("0123456789abcdef") == ""
+
+    @staticmethod
+    def __decodeBlob(data):
+        if data["encoding"] == "base64":
+            return b64decode(data["content"])
+        else:
+            return data["content"].encode("utf-8")
 
     def get_hook(self, id):
         """
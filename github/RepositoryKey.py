@@ -35,6 +35,8 @@ class RepositoryKey(github.GithubObject.CompletableGithubObject):
     This class represents RepositoryKeys. The reference can be found here http://developer.github.com/v3/repos/keys/
     """
 
+    __slots__ = ("__repoUrl",)
+
     def __init__(self, requester, headers, attributes, completed, repoUrl):
         github.GithubObject.CompletableGithubObject.__init__(self, requester, headers, attributes, completed)
         self.__repoUrl = repoUrl
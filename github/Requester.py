@@ -42,6 +42,8 @@ import sys
 import Consts
 import re
 import os
+import socket
+import threading
 
 atLeastPython26 = sys.hexversion >= 0x02060000
 atLeastPython3 = sys.hexversion >= 0x03000000
@@ -52,6 +54,11 @@ else:  # pragma no cover (Covered by all tests with Python 2.5)
     import simplejson as json  # pragma no cover (Covered by all tests with Python 2.5)
 
 import GithubException
+from ConnectionPool import ConnectionPool
+from CredentialPool import CredentialPool
+from JsonStream import JsonStream
+from Base64JsonBody import Base64JsonBody
+from Decompressor import Decompressor
 
 
 class Requester:
@@ -89,27 +96,32 @@ class Requester:
     def NEW_DEBUG_FRAME(self, requestHeader):
         '''
         Initialize a debug frame with requestHeader
-        Frame count is updated and will be attached to respond header
+        The index of the new frame is returned and must be given to DEBUG_ON_RESPONSE
         The structure of a frame: [requestHeader, statusCode, responseHeader, raw_data]
         Some of them may be None
         '''
         if self.DEBUG_FLAG:  # pragma no branch (Flag always set in tests)
             new_frame = [requestHeader, None, None, None]
-            if self._frameCount < self.DEBUG_FRAME_BUFFER_SIZE - 1:  # pragma no branch (Should be covered)
-                self._frameBuffer.append(new_frame)
-            else:
-                self._frameBuffer[0] = new_frame  # pragma no cover (Should be covered)
-
-            self._frameCount = len(self._frameBuffer) - 1
-
-    def DEBUG_ON_RESPONSE(self, statusCode, responseHeader, data):
+            self.__lock.acquire()
+            try:
+                if len(self._frameBuffer) < self.DEBUG_FRAME_BUFFER_SIZE:  # pragma no branch (Should be covered)
+                    self._frameBuffer.append(new_frame)
+                    self._frameCount = len(self._frameBuffer) - 1
+                else:
+                    self._frameCount = (self._frameCount + 1) % self.DEBUG_FRAME_BUFFER_SIZE  # pragma no cover (Should be covered)
+                    self._frameBuffer[self._frameCount] = new_frame  # pragma no cover (Should be covered)
+                return self._frameCount
+            finally:
+                self.__lock.release()
+
+    def DEBUG_ON_RESPONSE(self, frameIndex, statusCode, responseHeader, data):
         '''
-        Update current frame with response
-        Current frame index will be attached to responseHeader
+        Update the frame created by NEW_DEBUG_FRAME with response
+        Frame index will be attached to responseHeader
         '''
         if self.DEBUG_FLAG:  # pragma no branch (Flag always set in tests)
-            self._frameBuffer[self._frameCount][1:4] = [statusCode, responseHeader, data]
-            responseHeader[self.DEBUG_HEADER_KEY] = self._frameCount
+            self._frameBuffer[frameIndex][1:4] = [statusCode, responseHeader, data]
+            responseHeader[self.DEBUG_HEADER_KEY] = frameIndex
 
     def check_me(self, obj):
         if self.DEBUG_FLAG and self.ON_CHECK_ME is not None:  # pragma no branch (Flag always set in tests)
@@ -125,20 +137,21 @@ class Requester:
 
     #############################################################
 
-    def __init__(self, login_or_token, password, base_url, timeout, client_id, client_secret, user_agent, per_page, api_preview):
+    def __init__(self, login_or_token, password, base_url, timeout, client_id, client_secret, user_agent, per_page, api_preview, pool_size, pool_idle_timeout, response_cache, rate_limit_scheduler, keep_raw_data, identity_map, compression, adaptive_per_page, git_object_cache):
+        # Protects the bookkeeping done on each response, because a Requester
+        # (and the Github instance owning it) can be shared between threads.
+        self.__lock = threading.Lock()
         self._initializeDebugFeature()
 
-        if password is not None:
-            login = login_or_token
-            if atLeastPython3:
-                self.__authorizationHeader = "Basic " + base64.b64encode((login + ":" + password).encode("utf-8")).decode("utf-8").replace('\n', '')  # pragma no cover (Covered by Authentication.testAuthorizationHeaderWithXxx with Python 3)
-            else:
-                self.__authorizationHeader = "Basic " + base64.b64encode(login + ":" + password).replace('\n', '')
+        if isinstance(login_or_token, list):
+            credentials = login_or_token
+        elif password is not None:
+            credentials = [(login_or_token, password)]
         elif login_or_token is not None:
-            token = login_or_token
-            self.__authorizationHeader = "token " + token
+            credentials = [login_or_token]
         else:
-            self.__authorizationHeader = None
+            credentials = []
+        self.__credentialPool = CredentialPool([self.__makeAuthorizationHeader(credential) for credential in credentials])
 
         self.__base_url = base_url
         o = urlparse.urlparse(base_url)
@@ -157,6 +170,10 @@ class Requester:
         self.rate_limiting_resettime = 0
         self.FIX_REPO_GET_GIT_REF = True
         self.per_page = per_page
+        self.adaptive_per_page = adaptive_per_page
+        self.keep_raw_data = keep_raw_data
+        self.identity_map = identity_map
+        self.git_object_cache = git_object_cache
 
         self.oauth_scopes = None
 
@@ -167,10 +184,45 @@ class Requester:
             'See http://developer.github.com/v3/#user-agent-required'
         self.__userAgent = user_agent
         self.__apiPreview = api_preview
+        self.__compression = compression
+
+        self.__connectionPool = ConnectionPool(pool_size, pool_idle_timeout)
+        self.__responseCache = response_cache
+        self.__rateLimitScheduler = rate_limit_scheduler
+
+    @staticmethod
+    def __makeAuthorizationHeader(credential):
+        if isinstance(credential, tuple):
+            login, password = credential
+            if atLeastPython3:
+                return "Basic " + base64.b64encode((login + ":" + password).encode("utf-8")).decode("utf-8").replace('\n', '')  # pragma no cover (Covered by Authentication.testAuthorizationHeaderWithXxx with Python 3)
+            else:
+                return "Basic " + base64.b64encode(login + ":" + password).replace('\n', '')
+        else:
+            token = credential
+            return "token " + token
 
     def requestJsonAndCheck(self, verb, url, parameters=None, headers=None, input=None, cnx=None):
         return self.__check(*self.requestJson(verb, url, parameters, headers, input, cnx))
 
+    def requestJsonStream(self, verb, url, parameters=None, headers=None):
+        """
+        Like requestJsonAndCheck, but returns the body of the response as a :class:`github.JsonStream.JsonStream`
+        as soon as its headers are received. The connection is used until all the elements of the stream are decoded.
+        """
+        request = self.__prepareRequest(None, verb, url, parameters, headers, None, self.__encodeJson, stream=True)
+        verb, url, requestHeaders, encoded_input = request[:4]
+
+        frameIndex = self.NEW_DEBUG_FRAME(requestHeaders)
+
+        status, responseHeaders, output = self.__requestScheduled(None, request, stream=True)
+
+        self.DEBUG_ON_RESPONSE(frameIndex, status, responseHeaders, output)
+
+        if not isinstance(output, JsonStream):
+            self.__check(status, responseHeaders, output)  # Only error responses are not streamed: this raises
+        return responseHeaders, output
+
     def requestMultipartAndCheck(self, verb, url, parameters=None, headers=None, input=None):
         return self.__check(*self.requestMultipart(verb, url, parameters, headers, input))
 
@@ -187,7 +239,7 @@ class Requester:
             cls = GithubException.TwoFactorException  # pragma no cover (Should be covered)
         elif status == 403 and output.get("message").startswith("Missing or invalid User Agent string"):
             cls = GithubException.BadUserAgentException
-        elif status == 403 and output.get("message").startswith("API Rate Limit Exceeded"):
+        elif status == 403 and output.get("message").lower().startswith("api rate limit exceeded"):
             cls = GithubException.RateLimitExceededException
         elif status == 404 and output.get("message") == "Not Found":
             cls = GithubException.UnknownObjectException
@@ -207,10 +259,13 @@ class Requester:
                 return {'data': data}
 
     def requestJson(self, verb, url, parameters=None, headers=None, input=None, cnx=None):
-        def encode(input):
-            return "application/json", json.dumps(input)
+        return self.__requestEncode(cnx, verb, url, parameters, headers, input, self.__encodeJson)
 
-        return self.__requestEncode(cnx, verb, url, parameters, headers, input, encode)
+    @staticmethod
+    def __encodeJson(input):
+        if isinstance(input, Base64JsonBody):
+            return "application/json", input  # Encoded while it is sent
+        return "application/json", json.dumps(input)
 
     def requestMultipart(self, verb, url, parameters=None, headers=None, input=None):
         def encode(input):
@@ -229,16 +284,43 @@ class Requester:
         return self.__requestEncode(None, verb, url, parameters, headers, input, encode)
 
     def __requestEncode(self, cnx, verb, url, parameters, requestHeaders, input, encode):
+        request = self.__prepareRequest(cnx, verb, url, parameters, requestHeaders, input, encode)
+        verb, url, requestHeaders, encoded_input = request[:4]
+
+        frameIndex = self.NEW_DEBUG_FRAME(requestHeaders)
+
+        status, responseHeaders, output = self.__requestScheduled(cnx, request)
+
+        self.DEBUG_ON_RESPONSE(frameIndex, status, responseHeaders, output)
+
+        return status, responseHeaders, output
+
+    def __requestScheduled(self, cnx, request, stream=False):
+        verb, url, requestHeaders, encoded_input = request[:4]
+        attempt = 0
+        while True:
+            self._waitBeforeRequest()
+            status, responseHeaders, output = self.__requestRaw(cnx, verb, url, requestHeaders, encoded_input, stream)
+            status, responseHeaders, output = self.__useResponse(request, status, responseHeaders, output)
+            retryRequest = self._prepareRetry(request, status, responseHeaders, attempt)
+            if retryRequest is None:
+                return status, responseHeaders, output
+            request = retryRequest
+            attempt += 1
+
+    def __prepareRequest(self, cnx, verb, url, parameters, requestHeaders, input, encode, stream=False):
         assert verb in ["HEAD", "GET", "POST", "PATCH", "PUT", "DELETE"]
         if parameters is None:
             parameters = dict()
-        if requestHeaders is None:
-            requestHeaders = dict()
+        # The caller's headers may be kept (by a PaginatedList, for example): credentials must not be added to them
+        requestHeaders = dict(requestHeaders or {})
 
-        self.__authenticate(url, requestHeaders, parameters)
+        authorizationHeader = self.__authenticate(url, requestHeaders, parameters)
         requestHeaders["User-Agent"] = self.__userAgent
         if self.__apiPreview:
             requestHeaders["Accept"] = "application/vnd.github.moondragon+json"
+        if self.__compression:
+            requestHeaders["Accept-Encoding"] = Decompressor.ACCEPT_ENCODING
 
         url = self.__makeAbsoluteUrl(url)
         url = self.__addParametersToUrl(url, parameters)
@@ -246,57 +328,202 @@ class Requester:
         encoded_input = "null"
         if input is not None:
             requestHeaders["Content-Type"], encoded_input = encode(input)
+            if isinstance(encoded_input, Base64JsonBody):
+                requestHeaders["Content-Length"] = str(len(encoded_input))
+
+        if stream:
+            cacheKey, cachedEntry = None, None  # The body of a streamed response is not kept, so it can't be cached
+        else:
+            cacheKey, cachedEntry = self.__prepareCachedRequest(cnx, verb, url, requestHeaders, input)
 
-        self.NEW_DEBUG_FRAME(requestHeaders)
+        return verb, url, requestHeaders, encoded_input, cacheKey, cachedEntry, authorizationHeader
 
-        status, responseHeaders, output = self.__requestRaw(cnx, verb, url, requestHeaders, encoded_input)
+    def __useResponse(self, request, status, responseHeaders, output):
+        verb, url, requestHeaders, encoded_input, cacheKey, cachedEntry, authorizationHeader = request
 
-        if "x-ratelimit-remaining" in responseHeaders and "x-ratelimit-limit" in responseHeaders:
-            self.rate_limiting = (int(responseHeaders["x-ratelimit-remaining"]), int(responseHeaders["x-ratelimit-limit"]))
-        if "x-ratelimit-reset" in responseHeaders:
-            self.rate_limiting_resettime = int(responseHeaders["x-ratelimit-reset"])
+        self.__lock.acquire()
+        try:
+            if "x-ratelimit-remaining" in responseHeaders and "x-ratelimit-limit" in responseHeaders:
+                self.rate_limiting = (int(responseHeaders["x-ratelimit-remaining"]), int(responseHeaders["x-ratelimit-limit"]))
+            if "x-ratelimit-reset" in responseHeaders:
+                self.rate_limiting_resettime = int(responseHeaders["x-ratelimit-reset"])
+                if authorizationHeader is not None and "x-ratelimit-remaining" in responseHeaders:
+                    self.__credentialPool.update(authorizationHeader, self.rate_limiting[0], self.rate_limiting[1], self.rate_limiting_resettime)
 
-        if "x-oauth-scopes" in responseHeaders:
-            self.oauth_scopes = responseHeaders["x-oauth-scopes"].split(", ")
+            if "x-oauth-scopes" in responseHeaders:
+                self.oauth_scopes = responseHeaders["x-oauth-scopes"].split(", ")
+        finally:
+            self.__lock.release()
 
-        self.DEBUG_ON_RESPONSE(status, responseHeaders, output)
+        if cacheKey is not None:
+            status, responseHeaders, output = self.__useCachedResponse(cacheKey, cachedEntry, status, responseHeaders, output)
 
         return status, responseHeaders, output
 
-    def __requestRaw(self, cnx, verb, url, requestHeaders, input):
+    #############################################################
+    # For transports not using httplib (see github.AsyncRequester)
+
+    def _prepareJsonRequest(self, verb, url, parameters=None, headers=None, input=None):
+        """
+        Returns an opaque prepared request, whose first four elements are the verb, the absolute path,
+        the headers and the body to send to the API server
+        """
+        return self.__prepareRequest(None, verb, url, parameters, headers, input, self.__encodeJson)
+
+    def _waitBeforeRequest(self):
+        """
+        Waits, if the rate limit scheduler requires it, before sending a prepared request.
+        The wait is blocking.
+        """
+        if self.__rateLimitScheduler is not None:
+            if len(self.__credentialPool) > 1:
+                remaining, resetTime = self.__credentialPool.budget()
+            else:
+                remaining, resetTime = self.rate_limiting[0], self.rate_limiting_resettime
+            self.__rateLimitScheduler.beforeRequest(remaining, resetTime)
+
+    def _prepareRetry(self, request, status, responseHeaders, attempt):
+        """
+        Returns the prepared request to send again after a used response, or None if the response is final.
+        Waits (blocking) if the rate limit scheduler requires it.
+        """
+        verb, url, requestHeaders = request[:3]
+        if status == 403 and responseHeaders.get("x-ratelimit-remaining") == "0" and attempt < len(self.__credentialPool) - 1 and self.__credentialPool.hasBudget():
+            pass  # This credential is exhausted, but another one is not: retry at once
+        elif self.__rateLimitScheduler is None or not self.__rateLimitScheduler.afterResponse(status, responseHeaders, attempt):
+            return None
+        if len(self.__credentialPool) > 1:
+            request = request[:6] + (self.__authenticate(url, requestHeaders, dict()),)
+        return request
+
+    def _useResponse(self, request, status, responseHeaders, output):
+        """
+        Does for the response of a prepared request what requestJsonAndCheck does for its own responses, before checking it
+        """
+        verb, url, requestHeaders, encoded_input = request[:4]
+        self.__log(verb, url, requestHeaders, encoded_input, status, responseHeaders, output)
+        return self.__useResponse(request, status, responseHeaders, output)
+
+    def _check(self, status, responseHeaders, output):
+        """
+        Returns ``(headers, data)`` of a used response, or raises the matching :class:`github.GithubException.GithubException`
+        """
+        return self.__check(status, responseHeaders, output)
+
+    @property
+    def _rateLimitScheduler(self):
+        """
+        :class:`github.RateLimitScheduler.RateLimitScheduler` or None
+        """
+        return self.__rateLimitScheduler
+
+    @property
+    def _server(self):
+        """
+        (scheme, hostname, port, timeout) of the API server
+        """
+        return self.__scheme, self.__hostname, self.__port, self.__timeout
+
+    #############################################################
+
+    def __prepareCachedRequest(self, cnx, verb, url, requestHeaders, input):
+        # Only plain GETs to the API are cached. When the caller makes its own conditional
+        # request (CompletableGithubObject.update), it wants to see the 304 itself.
+        if self.__responseCache is None or verb != "GET" or cnx is not None or input is not None:
+            return None, None
+        if Consts.REQ_IF_NONE_MATCH in requestHeaders or Consts.REQ_IF_MODIFIED_SINCE in requestHeaders:
+            return None, None
+        cacheKey = self.__responseCache.makeKey(url, requestHeaders)
+        cachedEntry = self.__responseCache.get(cacheKey)
+        if cachedEntry is not None:
+            etag, lastModified, headers, output = cachedEntry
+            if etag is not None:
+                requestHeaders[Consts.REQ_IF_NONE_MATCH] = etag
+            if lastModified is not None:
+                requestHeaders[Consts.REQ_IF_MODIFIED_SINCE] = lastModified
+        return cacheKey, cachedEntry
+
+    def __useCachedResponse(self, cacheKey, cachedEntry, status, responseHeaders, output):
+        if status == 304 and cachedEntry is not None:
+            etag, lastModified, headers, output = cachedEntry
+            # Headers of the 304 (rate limiting, date, etc.) are more recent than the cached ones
+            headers = dict(headers)
+            headers.update(responseHeaders)
+            return 200, headers, output
+        if status == 200 and (Consts.RES_ETAG in responseHeaders or Consts.RES_LAST_MODIFED in responseHeaders):
+            self.__responseCache.set(cacheKey, (responseHeaders.get(Consts.RES_ETAG), responseHeaders.get(Consts.RES_LAST_MODIFED), dict(responseHeaders), output))
+        return status, responseHeaders, output
+
+    def __requestRaw(self, cnx, verb, url, requestHeaders, input, stream=False):
         original_cnx = cnx
         if cnx is None:
-            cnx = self.__createConnection()
+            poolKey = (self.__scheme, self.__hostname, self.__port)
+            createConnection = self.__createConnection
         else:
             assert cnx == "status"
-            cnx = self.__httpsConnectionClass("status.github.com", 443)
-        cnx.request(
-            verb,
-            url,
-            input,
-            requestHeaders
-        )
-        response = cnx.getresponse()
+            poolKey = ("https", "status.github.com", 443)
+            createConnection = lambda: self.__httpsConnectionClass("status.github.com", 443)
+
+        cnx, reused = self.__connectionPool.acquire(poolKey, createConnection)
+        try:
+            response = self.__sendRequest(cnx, verb, url, requestHeaders, input)
+        except (httplib.BadStatusLine, socket.error), e:
+            cnx.close()
+            # The server may have closed the keep-alive connection while it was idle: retry once on a fresh one.
+            # But it may also have run the request before the connection broke, so only requests that can be
+            # sent twice are retried, and never after a timeout.
+            if not reused or verb not in ("GET", "HEAD") or isinstance(e, socket.timeout):
+                raise
+            cnx = createConnection()
+            response = self.__sendRequest(cnx, verb, url, requestHeaders, input)
 
         status = response.status
         responseHeaders = dict((k.lower(), v) for k, v in response.getheaders())
-        output = response.read()
 
-        cnx.close()
+        def releaseConnection(exhausted):
+            # A connection can be reused only once its response has been read entirely
+            if exhausted and not getattr(response, "will_close", True):
+                self.__connectionPool.release(poolKey, cnx)
+            else:
+                cnx.close()
+
+        body = response
+        if responseHeaders.get("content-encoding") in ("gzip", "deflate"):
+            body = Decompressor(response, responseHeaders["content-encoding"])
+
+        if stream and status < 400 and not (status == 301 and 'location' in responseHeaders):
+            self.__log(verb, url, requestHeaders, input, status, responseHeaders, "(streamed)")
+            return status, responseHeaders, JsonStream(body, onEnd=releaseConnection)
+
+        output = body.read()
+        releaseConnection(True)
 
         self.__log(verb, url, requestHeaders, input, status, responseHeaders, output)
 
         if status is 301 and 'location' in responseHeaders:
-            return self.__requestRaw(original_cnx, verb, responseHeaders['location'], requestHeaders, input)
+            return self.__requestRaw(original_cnx, verb, responseHeaders['location'], requestHeaders, input, stream)
 
         return status, responseHeaders, output
 
+    def __sendRequest(self, cnx, verb, url, requestHeaders, input):
+        if isinstance(input, Base64JsonBody):
+            input.seek(0)  # It may have been sent already, before a redirection or a retry
+        cnx.request(
+            verb,
+            url,
+            input,
+            requestHeaders
+        )
+        return cnx.getresponse()
+
     def __authenticate(self, url, requestHeaders, parameters):
         if self.__clientId and self.__clientSecret and "client_id=" not in url:
             parameters["client_id"] = self.__clientId
             parameters["client_secret"] = self.__clientSecret
-        if self.__authorizationHeader is not None:
-            requestHeaders["Authorization"] = self.__authorizationHeader
+        authorizationHeader = self.__credentialPool.select()
+        if authorizationHeader is not None:
+            requestHeaders["Authorization"] = authorizationHeader
+        return authorizationHeader
 
     def __makeAbsoluteUrl(self, url):
         # URLs generated locally will be relative to __base_url
@@ -348,6 +575,7 @@ class Requester:
     def __log(self, verb, url, requestHeaders, input, status, responseHeaders, output):
         logger = logging.getLogger(__name__)
         if logger.isEnabledFor(logging.DEBUG):
+            requestHeaders = dict(requestHeaders)  # Don't remove credentials from the headers of a request that may be sent again
             if "Authorization" in requestHeaders:
                 if requestHeaders["Authorization"].startswith("Basic"):
                     requestHeaders["Authorization"] = "Basic (login and password removed)"
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import hashlib
+import sys
+
+from CacheStore import InMemoryCacheStore, FileSystemCacheStore
+
+atLeastPython3 = sys.hexversion >= 0x03000000
+
+
+class ResponseCache:
+    """
+    Base class of the caches given as ``response_cache`` to :class:`github.MainClass.Github`.
+
+    The requester stores the responses of GET requests having an ``ETag`` or a ``Last-Modified`` header,
+    and revalidates them with ``If-None-Match`` and ``If-Modified-Since`` on the next identical request.
+    When the API answers 304 Not Modified (which does not count against the rate limit), the cached body is used.
+
+    Entries are tuples ``(etag, last_modified, headers, output)``.
+    Keys are opaque strings derived from the URL, the parameters and the credentials of the request.
+    Subclasses must be safe to use from several threads.
+    """
+
+    def get(self, key):
+        """
+        :param key: string
+        :rtype: tuple or None
+        """
+        raise NotImplementedError()
+
+    def set(self, key, entry):
+        """
+        :param key: string
+        :param entry: tuple
+        """
+        raise NotImplementedError()
+
+    @staticmethod
+    def makeKey(url, requestHeaders):
+        # Credentials are part of the key (a private repository is not visible to everybody),
+        # but hashed so that they are not stored in clear
+        key = "\n".join([url, requestHeaders.get("Authorization", ""), requestHeaders.get("Accept", "")])
+        if atLeastPython3:
+            key = key.encode("utf-8")  # pragma no cover (Covered by ResponseCache tests with Python 3)
+        return hashlib.sha1(key).hexdigest()
+
+
+class InMemoryResponseCache(InMemoryCacheStore, ResponseCache):
+    """
+    Keeps the ``max_size`` most recently used responses in memory.
+    """
+
+    def __init__(self, max_size=1000):
+        """
+        :param max_size: integer
+        """
+        InMemoryCacheStore.__init__(self, max_size)
+
+
+class FileSystemResponseCache(ResponseCache):
+    """
+    Stores responses as files in a directory, so that they are kept from one run to the next.
+    Nothing is ever removed: delete the directory to clear the cache.
+    """
+
+    def __init__(self, directory):
+        """
+        :param directory: string
+        """
+        self.__store = FileSystemCacheStore(directory)
+
+    def get(self, key):
+        content = self.__store.read(key)
+        if content is None:
+            return None
+        (etag, lastModified, headers), output = content
+        return etag, lastModified, headers, output
+
+    def set(self, key, entry):
+        etag, lastModified, headers, output = entry
+        if atLeastPython3 and isinstance(output, str):  # pragma no cover (Covered by ResponseCache tests with Python 3)
+            output = output.encode("utf-8")  # pragma no cover (Covered by ResponseCache tests with Python 3)
+        self.__store.write(key, [etag, lastModified, headers], output)
@@ -52,6 +52,7 @@ class StatusMessage(github.GithubObject.NonCompletableGithubObject):
         return self._created_on.value
 
     def _initAttributes(self):
+        self._body = github.GithubObject.NotSet
         self._status = github.GithubObject.NotSet
         self._created_on = github.GithubObject.NotSet
 
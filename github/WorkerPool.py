@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import collections
+import Queue
+import sys
+import threading
+
+
+class _Task:
+    def __init__(self, function, item):
+        self.__function = function
+        self.__item = item
+        self.__done = threading.Event()
+        self.__result = None
+        self.__excInfo = None
+
+    def run(self):
+        try:
+            self.__result = self.__function(self.__item)
+        except:
+            self.__excInfo = sys.exc_info()
+        self.__done.set()
+
+    def result(self):
+        self.__done.wait()
+        if self.__excInfo is not None:
+            # Raise the instance itself: 2to3 turns this into "raise instance.with_traceback(traceback)",
+            # whereas "raise type, instance, traceback" would become "raise type(instance)...", wrapping the instance
+            raise self.__excInfo[1], None, self.__excInfo[2]
+        return self.__result
+
+
+class WorkerPool:
+    """
+    Calls a function on many items with a bounded number of threads, and gives the results back in order.
+    """
+
+    def __init__(self, workers):
+        """
+        :param workers: int, maximum number of concurrent calls
+        """
+        assert isinstance(workers, (int, long)) and workers > 0, workers
+        self.__workers = workers
+
+    def imap(self, function, items):
+        """
+        Generator yielding ``function(item)`` for each item of ``items``, in the order of ``items``.
+        At most ``workers`` calls run at the same time, and at most twice as many results are computed ahead
+        of the consumer. If a call raises, the exception is raised when its result is reached.
+        Threads stop when the generator is exhausted or closed.
+
+        :param function: callable taking one item
+        :param items: iterable, consumed lazily
+        """
+        items = iter(items)
+        pending = collections.deque()
+        tasks = Queue.Queue()
+        threads = []
+        try:
+            while True:
+                while len(pending) < 2 * self.__workers:
+                    try:
+                        item = items.next()
+                    except StopIteration:
+                        break
+                    task = _Task(function, item)
+                    pending.append(task)
+                    tasks.put(task)
+                    if len(threads) < self.__workers:
+                        thread = threading.Thread(target=self.__work, args=(tasks,))
+                        thread.setDaemon(True)
+                        thread.start()
+                        threads.append(thread)
+                if len(pending) == 0:
+                    return
+                yield pending.popleft().result()
+        finally:
+            # Drop the work not started yet, and stop the threads
+            try:
+                while True:
+                    tasks.get_nowait()
+            except Queue.Empty:
+                pass
+            for thread in threads:
+                tasks.put(None)
+
+    @staticmethod
+    def __work(tasks):
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+            task.run()
@@ -35,10 +35,12 @@ All classes inherit from :class:`github.GithubObject.GithubObject`.
 import logging
 
 from MainClass import Github
-from GithubException import GithubException, BadCredentialsException, UnknownObjectException, BadUserAgentException, RateLimitExceededException, BadAttributeException
+from GithubException import GithubException, BadCredentialsException, UnknownObjectException, BadUserAgentException, RateLimitExceededException, BadAttributeException, TruncatedGitTreeException
 from InputFileContent import InputFileContent
 from InputGitAuthor import InputGitAuthor
 from InputGitTreeElement import InputGitTreeElement
+from ResponseCache import InMemoryResponseCache, FileSystemResponseCache
+from RateLimitScheduler import RateLimitScheduler
 
 
 def enable_console_debug_logging():  # pragma no cover (Function useful only outside test environment)
@@ -76,6 +76,25 @@ from ExposeAllAttributes import *
 from BadAttributes import *
 from Equality import *
 from Search import *
+from ConnectionPool import *
+from ThreadSafety import *
+from WorkerPool import *
+from ResponseCache import *
+from AsyncGithub import *
+from RateLimitScheduler import *
+from CredentialPool import *
+from LazyAttributes import *
+from ParseDatetime import *
+from IdentityMap import *
+from JsonStream import *
+from Compression import *
+from IncrementalSync import *
+from MirrorStore import *
+from WalkGitTree import *
+from GitObjectCache import *
+from CommitGraph import *
+from CommitBuilder import *
+from Base64JsonBody import *
 
 from Issue33 import *
 from Issue50 import *
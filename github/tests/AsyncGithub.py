@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import os
+import socket
+import sys
+import unittest
+
+import github
+
+import threading
+
+from ThreadSafety import FakeGithubServer
+
+atLeastPython352 = sys.hexversion >= 0x030502F0
+
+
+if atLeastPython352:  # pragma no branch (Python 2 has no asyncio)
+    import asyncio
+
+    class AsyncGithub(unittest.TestCase):
+        requestCount = 32
+
+        def setUp(self):
+            unittest.TestCase.setUp(self)
+            self.debugFlag = github.Requester.Requester.DEBUG_FLAG
+            self.checkAfterInitFlag = github.GithubObject.GithubObject.CHECK_AFTER_INIT_FLAG
+            github.Requester.Requester.setDebugFlag(False)
+            github.GithubObject.GithubObject.setCheckAfterInitFlag(False)
+
+            self.server = FakeGithubServer()
+            self.serverThread = threading.Thread(target=self.server.serve_forever)
+            self.serverThread.setDaemon(True)
+            self.serverThread.start()
+            self.g = github.Github(base_url="http://127.0.0.1:%i" % self.server.server_address[1])
+            self.loop = asyncio.new_event_loop()
+            self.a = self.g.get_async_client(self.loop)
+
+        def tearDown(self):
+            self.loop.close()
+            self.server.shutdown()
+            self.server.server_close()
+            github.Requester.Requester.setDebugFlag(self.debugFlag)
+            github.GithubObject.GithubObject.setCheckAfterInitFlag(self.checkAfterInitFlag)
+            unittest.TestCase.tearDown(self)
+
+        def run_(self, future):
+            return self.loop.run_until_complete(future)
+
+        def testGetUser(self):
+            user = self.run_(self.a.get_user("jacquev6"))
+            self.assertTrue(isinstance(user, github.NamedUser.NamedUser))
+            self.assertEqual(user.login, "jacquev6")
+            self.assertEqual(self.g.rate_limiting, (4999, 5000))
+
+        def testConcurrentRequests(self):
+            logins = ["user%i" % index for index in range(self.requestCount)]
+            users = self.run_(asyncio.gather(*[self.a.get_user(login) for login in logins]))
+            self.assertEqual([user.login for user in users], logins)
+            self.assertEqual(self.server.requestCount, self.requestCount)
+
+        def testComplete(self):
+            issue = self.run_(self.a.iterate(self.g.get_repo("jacquev6/PyGithub", lazy=True).get_issues()).__anext__())
+            self.assertEqual(self.server.requestCount, 1)
+            self.assertTrue(self.run_(self.a.complete(issue)) is issue)
+            self.assertEqual(self.server.requestCount, 2)
+            self.assertTrue(self.run_(self.a.complete(issue)) is issue)
+            self.assertEqual(issue.title, "Issue 1")
+            self.assertEqual(self.server.requestCount, 2)
+
+        def testIterate(self):
+            issues = self.g.get_repo("jacquev6/PyGithub", lazy=True).get_issues()
+            iterator = self.a.iterate(issues)
+            numbers = []
+            while True:
+                try:
+                    numbers.append(self.run_(iterator.__anext__()).number)
+                except StopAsyncIteration:
+                    break
+            self.assertEqual(numbers, list(range(1, 301)))
+            self.assertEqual(self.server.requestCount, 10)
+
+        def testIterateFromCursor(self):
+            issues = self.g.get_repo("jacquev6/PyGithub", lazy=True).get_issues()
+            self.assertEqual(issues[0].number, 1)
+            resumed = self.g.get_repo("jacquev6/PyGithub", lazy=True).get_issues().resume(issues.cursor(20))
+            iterator = self.a.iterate(resumed)
+            numbers = []
+            while True:
+                try:
+                    numbers.append(self.run_(iterator.__anext__()).number)
+                except StopAsyncIteration:
+                    break
+            self.assertEqual(numbers, list(range(21, 301)))
+
+        def testError(self):
+            try:
+                self.run_(self.a.get_organization("nobody"))
+                self.fail()  # pragma no cover (Covered only if the test fails)
+            except github.GithubException, exception:
+                self.assertEqual(exception.status, 404)
+
+        def testRateLimitSchedulerRetries(self):
+            waits = []
+            g = github.Github(base_url="http://127.0.0.1:%i" % self.server.server_address[1], rate_limit_scheduler=github.RateLimitScheduler(sleep=waits.append))
+            self.server.abuseResponses = 1
+            user = self.run_(g.get_async_client(self.loop).get_user("jacquev6"))
+            self.assertEqual(user.login, "jacquev6")
+            self.assertEqual(waits, [2])
+            self.assertEqual(self.server.requestCount, 2)
+
+        def testRateLimitSchedulerPaces(self):
+            waits = []
+            g = github.Github(base_url="http://127.0.0.1:%i" % self.server.server_address[1], rate_limit_scheduler=github.RateLimitScheduler(sleep=waits.append, clock=lambda: 1400000000))
+            a = g.get_async_client(self.loop)
+            for login in ["user1", "user2"]:
+                self.run_(a.get_user(login))
+            self.assertEqual(waits, [])
+            # The budget is now known: 4998 requests in 4998 seconds
+            self.run_(a.get_user("user3"))
+            self.assertEqual(waits, [1])
+
+        def testTimeoutIsBetweenReads(self):
+            # Like with the synchronous client, a response slower than the timeout doesn't time out if data keeps coming
+            a = github.Github(base_url="http://127.0.0.1:%i" % self.server.server_address[1], timeout=1).get_async_client(self.loop)
+            self.server.writeDelay = 0.6
+            self.assertEqual(self.run_(a.get_user("jacquev6")).login, "jacquev6")
+
+        def testTimeout(self):
+            a = github.Github(base_url="http://127.0.0.1:%i" % self.server.server_address[1], timeout=1).get_async_client(self.loop)
+            self.server.writeDelay = 1.5
+            self.assertRaises(socket.timeout, self.run_, a.get_user("jacquev6"))
+
+        def testProxyIsNotSupported(self):
+            os.environ["http_proxy"] = "http://proxy.example.com:3128"
+            try:
+                self.assertRaises(NotImplementedError, self.g.get_async_client, self.loop)
+            finally:
+                del os.environ["http_proxy"]
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import base64
+import io
+import json
+import mmap
+import tempfile
+import unittest
+
+from github.Base64JsonBody import Base64JsonBody as Body
+
+
+class Base64JsonBody(unittest.TestCase):
+    def setUp(self):
+        self.content = bytes(bytearray(i % 256 for i in range(1000)))
+
+    def check(self, content, members={"encoding": "base64", "sha": "abc"}, size=-1):
+        body = Body("content", content, members)
+        for attempt in range(2):  # Rewound and read again, as when a request is retried
+            body.seek(0)
+            parts = []
+            while True:
+                part = body.read(size)
+                if len(part) == 0:
+                    break
+                parts.append(part)
+            encoded = "".encode("ascii").join(parts)
+            self.assertEqual(len(encoded), len(body))
+            decoded = json.loads(encoded.decode("ascii"))
+            self.assertEqual(base64.b64decode(decoded.pop("content").encode("ascii")), self.content)
+            self.assertEqual(decoded, members)
+
+    def testBytes(self):
+        for size in [-1, 1, 7, 1000]:
+            self.check(self.content, size=size)
+            self.check(bytearray(self.content), size=size)
+
+    def testChunks(self):
+        chunkSize = Body.CHUNK_SIZE
+        try:
+            for Body.CHUNK_SIZE in [3, 6, 999]:
+                self.check(self.content)
+                self.check(io.BytesIO(self.content), size=5)
+        finally:
+            Body.CHUNK_SIZE = chunkSize
+
+    def testFile(self):
+        file = io.BytesIO("header".encode("ascii") + self.content)
+        file.seek(6)  # Only the content after the current position is sent
+        self.check(file, size=8192)
+
+    def testMmap(self):
+        file = tempfile.TemporaryFile()
+        try:
+            file.write(self.content)
+            file.flush()
+            region = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                self.check(region)
+            finally:
+                region.close()
+        finally:
+            file.close()
+
+    def testEmpty(self):
+        self.content = "".encode("ascii")
+        self.check(self.content)
+        self.check(self.content, members={})
+
+    def testShortReads(self):
+        self.check(ShortReads(io.BytesIO(self.content), len(self.content)))
+
+    def testTruncatedFile(self):
+        body = Body("content", ShortReads(io.BytesIO(self.content), 500), {})
+        self.assertRaises(IOError, body.read)
+
+    def testStr(self):
+        self.assertEqual(str(Body("content", self.content, {"encoding": "base64"})), '{"content": "(1000 bytes)", "encoding": "base64"}')
+
+
+class ShortReads:
+    def __init__(self, file, end):
+        self.__file = file
+        self.__end = end
+        self.tell = file.tell
+        self.seek = file.seek
+
+    def read(self, size):
+        return self.__file.read(max(0, min(size, 10, self.__end - self.__file.tell())))
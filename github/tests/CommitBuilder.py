@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import io
+
+import Framework
+
+
+class CommitBuilder(Framework.TestCase):
+    def setUp(self):
+        Framework.TestCase.setUp(self)
+        self.builder = self.g.get_repo("jacquev6/PyGithub", lazy=True).get_commit_builder("gh-pages")
+
+    def testCommit(self):
+        self.builder.add_file("index.html", "<html>old</html>\n")
+        self.builder.add_file("index.html", "<html>new</html>\n")
+        # Unchanged, not uploaded
+        self.builder.add_file("style.css", "body {}\n")
+        # Blobs already in the tree are not uploaded
+        self.builder.add_file("copy.css", "body {}\n")
+        self.builder.add_file("run.sh", "#!/bin/sh\n", "100755")
+        self.builder.add_file("app.js", u"alert('é');\n")
+        commit = self.builder.commit("Update site", workers=1)
+        self.assertEqual(commit.sha, "4444444444444444444444444444444444444444")
+        self.assertEqual(commit.tree.sha, "3333333333333333333333333333333333333333")
+
+    def testCommitFileObjects(self):
+        index = io.BytesIO("skipped<html>new</html>\n".encode("ascii"))
+        index.read(7)
+        # Read from their current position, for the SHA and again for the upload
+        self.builder.add_file("index.html", index)
+        self.builder.add_file("style.css", bytearray("body {}\n".encode("ascii")))
+        self.builder.add_file("copy.css", io.BytesIO("body {}\n".encode("ascii")))
+        self.builder.add_file("run.sh", bytearray("#!/bin/sh\n".encode("ascii")), "100755")
+        self.builder.add_file("app.js", io.BytesIO(u"alert('é');\n".encode("utf-8")))
+        commit = self.builder.commit("Update site", workers=1)
+        self.assertEqual(commit.sha, "4444444444444444444444444444444444444444")
+
+    def testNothingChanged(self):
+        self.builder.add_file("style.css", "body {}\n")
+        self.assertEqual(self.builder.commit("Update site"), None)
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import Framework
+
+import github
+
+
+class CommitGraph(Framework.TestCase):
+    # A <- B <- C <- G (master)
+    #  ^             ^
+    #   \            |
+    #    D <- E <--- F (merge)
+    def setUp(self):
+        Framework.TestCase.setUp(self)
+        self.graph = self.g.get_repo("jacquev6/PyGithub", lazy=True).get_commit_graph()
+        for name in "abcdefg":
+            setattr(self, name, name * 40)
+
+    def testQueries(self):
+        self.assertEqual(self.graph.load(self.f), self.f)
+        self.assertEqual(len(self.graph), 6)
+        self.assertEqual(self.graph.get_parents(self.f), [self.c, self.e])
+        self.assertEqual(self.graph.get_parents(self.a), [])
+        self.assertTrue(self.graph.is_ancestor(self.b, self.f))
+        self.assertTrue(self.graph.is_ancestor(self.f, self.f))
+        self.assertFalse(self.graph.is_ancestor(self.f, self.b))
+        self.assertFalse(self.graph.is_ancestor(self.d, self.c))
+        self.assertEqual(self.graph.merge_bases(self.c, self.e), [self.a])
+        self.assertEqual(self.graph.merge_base(self.f, self.c), self.c)
+        self.assertEqual(self.graph.merge_base(self.e, self.f), self.e)
+        self.assertEqual(self.graph.get_commits_between(self.c, self.f), [self.f, self.e, self.d])
+        self.assertEqual(self.graph.get_commits_between(self.a, self.f), [self.f, self.c, self.e, self.b, self.d])
+        self.assertEqual(self.graph.get_commits_between(self.f, self.c), [])
+        # Branch names are resolved by one request, stopped after the first commit because its parents are loaded
+        self.assertEqual(self.graph.merge_base("master", self.e), self.a)
+        self.assertEqual(len(self.graph), 7)
+
+    def testIncrementalLoading(self):
+        self.assertEqual(self.graph.merge_base(self.c, self.b), self.b)
+        self.assertEqual(len(self.graph), 3)
+        # Loading stops before A, that is already loaded
+        self.assertEqual(self.graph.merge_base(self.c, self.e), self.a)
+        self.assertEqual(len(self.graph), 5)
+        self.assertEqual(self.graph.get_commits_between(self.b, self.e), [self.e, self.d])
+
+    def testErrorWhileLoading(self):
+        # The second page fails: C is not kept as loaded, else B would be taken for a root
+        self.assertRaises(github.GithubException, self.graph.load, self.c)
+        self.assertEqual(len(self.graph), 0)
+        self.assertEqual(self.graph.load(self.c), self.c)
+        self.assertEqual(len(self.graph), 3)
+        self.assertTrue(self.graph.is_ancestor(self.a, self.c))
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import io
+import threading
+import unittest
+import zlib
+
+import github
+from github.Decompressor import Decompressor
+
+from ThreadSafety import FakeGithubServer
+
+
+class Decompression(unittest.TestCase):
+    data = ("".join('{"number": %i, "title": "Issue %i"}, ' % (i, i) for i in range(1000))).encode("ascii")
+
+    def compress(self, wbits):
+        compressor = zlib.compressobj(9, zlib.DEFLATED, wbits)
+        return compressor.compress(self.data) + compressor.flush()
+
+    def decompress(self, compressed, contentEncoding, chunkSize, size):
+        decompressor = Decompressor(io.BytesIO(compressed), contentEncoding, chunkSize)
+        chunks = []
+        while True:
+            chunk = decompressor.read(size)
+            if len(chunk) == 0:
+                return "".encode("ascii").join(chunks)
+            self.assertTrue(size is None or len(chunk) <= size)
+            chunks.append(chunk)
+
+    def testGzip(self):
+        compressed = self.compress(16 + zlib.MAX_WBITS)
+        for chunkSize, size in [(1, 1), (7, 100), (1000, 10), (10, None)]:
+            self.assertEqual(self.decompress(compressed, "gzip", chunkSize, size), self.data)
+
+    def testDeflate(self):
+        self.assertEqual(self.decompress(self.compress(zlib.MAX_WBITS), "deflate", 7, 100), self.data)
+
+    def testRawDeflate(self):
+        self.assertEqual(self.decompress(self.compress(-zlib.MAX_WBITS), "deflate", 7, 100), self.data)
+
+    def testCorruptedData(self):
+        self.assertRaises(zlib.error, self.decompress, self.data, "gzip", 7, 100)
+
+
+class Compression(unittest.TestCase):
+    def setUp(self):
+        unittest.TestCase.setUp(self)
+        self.debugFlag = github.Requester.Requester.DEBUG_FLAG
+        self.checkAfterInitFlag = github.GithubObject.GithubObject.CHECK_AFTER_INIT_FLAG
+        github.Requester.Requester.setDebugFlag(False)
+        github.GithubObject.GithubObject.setCheckAfterInitFlag(False)
+
+        self.server = FakeGithubServer()
+        self.serverThread = threading.Thread(target=self.server.serve_forever)
+        self.serverThread.setDaemon(True)
+        self.serverThread.start()
+        self.baseUrl = "http://127.0.0.1:%i" % self.server.server_address[1]
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        github.Requester.Requester.setDebugFlag(self.debugFlag)
+        github.GithubObject.GithubObject.setCheckAfterInitFlag(self.checkAfterInitFlag)
+        unittest.TestCase.tearDown(self)
+
+    def getIssues(self, g):
+        self.assertEqual(g.get_user("jacquev6").login, "jacquev6")
+        issues = g.get_repo("jacquev6/PyGithub").get_issues()
+        self.assertEqual([issue.number for issue in issues], range(1, 301))
+        self.assertEqual([issue.number for issue in issues.streamed()], range(1, 301))
+
+    def testCompressedResponses(self):
+        self.getIssues(github.Github(base_url=self.baseUrl))
+        self.assertEqual(self.server.compressedResponses, 21)
+
+    def testWithoutCompression(self):
+        self.getIssues(github.Github(base_url=self.baseUrl, compression=False))
+        self.assertEqual(self.server.requestCount, 21)
+        self.assertEqual(self.server.compressedResponses, 0)
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import httplib
+import socket
+import unittest
+
+import github
+
+
+class KeepAliveResponse:
+    def __init__(self, output, willClose):
+        self.status = 200
+        self.will_close = willClose
+        self.__output = output
+
+    def getheaders(self):
+        return [("content-type", "application/json; charset=utf-8")]
+
+    def read(self):
+        return self.__output
+
+
+class KeepAliveConnection:
+    def __init__(self, server, host, port, *args, **kwds):
+        self.__server = server
+        # A connected socket pair, so that the pool's health check sees a live idle connection
+        self.sock, self.__serverSock = socket.socketpair()
+        self.closed = False
+        self.requests = []
+        server.connections.append(self)
+
+    def request(self, verb, url, input, headers):
+        self.requests.append((verb, url))
+        if self.__server.resetNextReuse and len(self.requests) > 1:
+            self.__server.resetNextReuse = False
+            raise self.__server.resetError
+
+    def getresponse(self):
+        return KeepAliveResponse('{"login": "jacquev6"}', self.__server.willClose)
+
+    def close(self):
+        self.closed = True
+        self.sock.close()
+        self.__serverSock.close()
+
+
+class FakeServer:
+    def __init__(self):
+        self.connections = []
+        self.willClose = False
+        self.resetNextReuse = False
+        self.resetError = httplib.BadStatusLine("")
+
+
+class ConnectionPool(unittest.TestCase):
+    def setUp(self):
+        unittest.TestCase.setUp(self)
+        self.server = FakeServer()
+        github.Requester.Requester.injectConnectionClasses(
+            lambda ignored, *args, **kwds: KeepAliveConnection(self.server, *args, **kwds),
+            lambda ignored, *args, **kwds: KeepAliveConnection(self.server, *args, **kwds)
+        )
+
+    def tearDown(self):
+        for cnx in self.server.connections:
+            cnx.close()
+        github.Requester.Requester.resetConnectionClasses()
+        unittest.TestCase.tearDown(self)
+
+    def testConnectionIsReused(self):
+        g = github.Github()
+        for i in range(3):
+            self.assertEqual(g.get_user("jacquev6").login, "jacquev6")
+        self.assertEqual(len(self.server.connections), 1)
+        self.assertEqual(len(self.server.connections[0].requests), 3)
+        self.assertFalse(self.server.connections[0].closed)
+
+    def testConnectionIsClosedWhenServerAsks(self):
+        self.server.willClose = True
+        g = github.Github()
+        for i in range(3):
+            g.get_user("jacquev6")
+        self.assertEqual(len(self.server.connections), 3)
+        self.assertTrue(all(cnx.closed for cnx in self.server.connections))
+
+    def testPoolDisabled(self):
+        g = github.Github(pool_size=0)
+        for i in range(3):
+            g.get_user("jacquev6")
+        self.assertEqual(len(self.server.connections), 3)
+        self.assertTrue(all(cnx.closed for cnx in self.server.connections))
+
+    def testIdleTimeout(self):
+        g = github.Github(pool_idle_timeout=-1)
+        for i in range(2):
+            g.get_user("jacquev6")
+        self.assertEqual(len(self.server.connections), 2)
+        self.assertTrue(self.server.connections[0].closed)
+
+    def testReconnectWhenReusedConnectionIsReset(self):
+        g = github.Github()
+        g.get_user("jacquev6")
+        self.server.resetNextReuse = True
+        self.assertEqual(g.get_user("jacquev6").login, "jacquev6")
+        self.assertEqual(len(self.server.connections), 2)
+        self.assertTrue(self.server.connections[0].closed)
+
+    def testNoReconnectForPost(self):
+        # The server may have created the repository before the connection was reset
+        g = github.Github()
+        g.get_user("jacquev6")
+        self.server.resetNextReuse = True
+        self.assertRaises(httplib.BadStatusLine, g.get_user().create_repo, "TestPyGithub")
+        self.assertEqual(len(self.server.connections), 1)
+        self.assertEqual(self.server.connections[0].requests, [("GET", "/users/jacquev6"), ("POST", "/user/repos")])
+
+    def testNoReconnectAfterTimeout(self):
+        g = github.Github()
+        g.get_user("jacquev6")
+        self.server.resetNextReuse = True
+        self.server.resetError = socket.timeout()
+        self.assertRaises(socket.timeout, g.get_user, "jacquev6")
+        self.assertEqual(len(self.server.connections), 1)
+
+    def testUnhealthyConnectionIsNotReused(self):
+        pool = github.ConnectionPool.ConnectionPool(2, 60)
+        cnx, reused = pool.acquire("key", lambda: KeepAliveConnection(self.server, "host", 443))
+        self.assertFalse(reused)
+        pool.release("key", cnx)
+        cnx.close()
+        otherCnx, reused = pool.acquire("key", lambda: KeepAliveConnection(self.server, "host", 443))
+        self.assertFalse(reused)
+        self.assertFalse(otherCnx is cnx)
+
+
+class ConnectionPoolHealthCheck(unittest.TestCase):
+    def testHealthCheckOnRealSocket(self):
+        class Connection:
+            def __init__(self, sock):
+                self.sock = sock
+
+            def close(self):
+                self.sock.close()
+
+        a, b = socket.socketpair()
+        try:
+            pool = github.ConnectionPool.ConnectionPool(1, 60)
+            pool.release("key", Connection(a))
+            cnx, reused = pool.acquire("key", None)
+            self.assertTrue(reused)
+            b.close()  # Server side closes the idle connection
+            pool.release("key", cnx)
+            cnx, reused = pool.acquire("key", lambda: "new connection")
+            self.assertFalse(reused)
+            self.assertEqual(cnx, "new connection")
+        finally:
+            a.close()
+            b.close()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import unittest
+
+import github
+from github.CredentialPool import CredentialPool as Pool
+
+import Framework
+
+
+class CredentialPool(Framework.TestCase):
+    def testRotationOnExhaustion(self):
+        # The first token is exhausted: the request is sent again at once with the second one
+        g = github.Github([self.oauth_token, "other_token"])
+        self.assertEqual(g.get_user("jacquev6").login, "jacquev6")
+        self.assertEqual(g.rate_limiting, (4999, 5000))
+
+
+class CredentialSelection(unittest.TestCase):
+    def setUp(self):
+        unittest.TestCase.setUp(self)
+        self.now = 1000
+        self.pool = Pool(["token a", "token b", "Basic c"], lambda: self.now)
+
+    def testUnknownBudgetsAreTriedFirst(self):
+        self.assertEqual(self.pool.select(), "token a")
+        self.pool.update("token a", 4999, 5000, 2000)
+        self.assertEqual(self.pool.select(), "token b")
+        self.pool.update("token b", 4000, 5000, 2000)
+        self.assertEqual(self.pool.select(), "Basic c")
+        self.assertEqual(self.pool.budget(), (-1, 0))
+
+    def testMostRemainingBudgetIsSelected(self):
+        self.pool.update("token a", 10, 5000, 2000)
+        self.pool.update("token b", 30, 5000, 2000)
+        self.pool.update("Basic c", 20, 5000, 1500)
+        self.assertEqual(self.pool.select(), "token b")
+        self.assertEqual(self.pool.budget(), (60, 2000))
+
+    def testExhaustedBudgets(self):
+        self.pool.update("token a", 0, 5000, 2000)
+        self.pool.update("token b", 0, 5000, 1500)
+        self.pool.update("Basic c", 0, 5000, 1800)
+        self.assertFalse(self.pool.hasBudget())
+        self.assertEqual(self.pool.select(), "token b")
+        self.assertEqual(self.pool.budget(), (0, 1500))
+        # After its reset time, a credential has its full budget again
+        self.now = 1600
+        self.assertTrue(self.pool.hasBudget())
+        self.assertEqual(self.pool.select(), "token b")
+        self.assertEqual(self.pool.budget(), (5000, 2000))
+
+    def testNoCredentials(self):
+        pool = Pool([])
+        self.assertEqual(pool.select(), None)
+        self.assertEqual(pool.budget(), (-1, 0))
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import shutil
+import tempfile
+
+import Framework
+
+import github
+import github.GitObjectCache
+
+
+class GitObjectCache(Framework.TestCase):
+    def setUp(self):
+        Framework.TestCase.setUp(self)
+        self.cache = github.GitObjectCache.InMemoryGitObjectCache()
+        self.g = github.Github(self.login, self.password, git_object_cache=self.cache)
+        self.repo = self.g.get_repo("jacquev6/PyGithub", lazy=True)
+        self.commitSha = "1111111111111111111111111111111111111111"
+        self.treeSha = "2222222222222222222222222222222222222222"
+
+    def testGitObjects(self):
+        commit = self.repo.get_git_commit(self.commitSha)
+        self.assertEqual(commit.message, "Initial commit")
+        # Git objects are used from the cache without request, even when completing lazy objects
+        commit = self.repo.get_git_commit(self.commitSha)
+        self.assertEqual(commit.message, "Initial commit")
+        self.assertEqual([element.path for element in commit.tree.tree], ["doc"])
+        self.assertEqual([element.path for element in self.repo.get_git_commit(self.commitSha).tree.tree], ["doc"])
+        self.assertEqual([element.path for element in self.repo.get_git_tree(self.treeSha).tree], ["doc"])
+        # Recursive trees are cached separately
+        self.assertEqual([element.path for element in self.repo.get_git_tree(self.treeSha, recursive=True).tree], ["doc", "doc/index.rst"])
+        self.assertEqual([element.path for element in self.repo.get_git_tree_elements(self.treeSha, recursive=True)], ["doc", "doc/index.rst"])
+        self.assertEqual(len(self.cache), 3)
+
+    def testTreeAndCommitShareTheArgument(self):
+        # The trees endpoint accepts the SHA of a commit: the tree is cached by its own SHA
+        self.assertEqual(self.repo.get_git_tree(self.commitSha).sha, self.treeSha)
+        commit = self.repo.get_git_commit(self.commitSha)
+        self.assertEqual(commit.sha, self.commitSha)
+        self.assertEqual(commit.message, "Initial commit")
+        self.assertEqual(self.repo.get_git_tree(self.treeSha).sha, self.treeSha)
+        # Branch names are not looked up in the cache
+        self.assertEqual(self.repo.get_git_tree("master").sha, self.treeSha)
+        self.assertEqual(self.repo.get_git_tree("master").sha, self.treeSha)
+        self.assertEqual(sorted(self.cache.get("tree:" + self.treeSha)), ["sha", "tree", "url"])
+        self.assertEqual(len(self.cache), 2)
+
+    def testCompleteAll(self):
+        trees = [self.g.create_from_raw_data(github.GitCommit.GitCommit, {"tree": {"sha": self.treeSha, "url": "https://api.github.com/repos/jacquev6/PyGithub/git/trees/" + self.treeSha}}).tree for i in range(2)]
+        self.g.complete_all(trees)
+        self.assertEqual(self.cache.get("tree:" + self.treeSha)["sha"], self.treeSha)
+        tree = self.g.create_from_raw_data(github.GitCommit.GitCommit, {"tree": {"sha": self.treeSha, "url": "https://api.github.com/repos/jacquev6/PyGithub/git/trees/" + self.treeSha}}).tree
+        self.g.complete_all([tree])
+        self.assertEqual([element.path for element in tree.tree], ["doc"])
+
+    def testInMemoryCacheKeepsMostRecentlyUsed(self):
+        cache = github.GitObjectCache.InMemoryGitObjectCache(max_size=2)
+        cache.set("a" * 40, {"sha": "a" * 40})
+        cache.set("b" * 40, {"sha": "b" * 40})
+        cache.get("a" * 40)
+        cache.set("c" * 40, {"sha": "c" * 40})
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get("b" * 40), None)
+        self.assertEqual(cache.get("a" * 40), {"sha": "a" * 40})
+
+    def testFileSystemCache(self):
+        directory = tempfile.mkdtemp()
+        try:
+            cache = github.GitObjectCache.FileSystemGitObjectCache(directory)
+            self.assertEqual(cache.get("tree:" + self.treeSha), None)
+            cache.set("tree:" + self.treeSha, {"sha": self.treeSha})
+            cache.set("tree:" + self.treeSha + ".recursive", {"sha": self.treeSha, "tree": []})
+            cache = github.GitObjectCache.FileSystemGitObjectCache(directory, memory_size=0)
+            self.assertEqual(cache.get("tree:" + self.treeSha), {"sha": self.treeSha})
+            self.assertEqual(cache.get("tree:" + self.treeSha + ".recursive"), {"sha": self.treeSha, "tree": []})
+            self.assertEqual(cache.get("commit:" + self.treeSha), None)
+        finally:
+            shutil.rmtree(directory)
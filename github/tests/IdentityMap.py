@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import gc
+
+import Framework
+
+import github
+
+
+class IdentityMap(Framework.TestCase):
+    def setUp(self):
+        Framework.TestCase.setUp(self)
+        self.g = github.Github(self.login, self.password, identity_map=True)
+
+    def getAuthors(self):
+        issues = list(self.g.get_repo("jacquev6/PyGithub").get_issues())
+        return [issue.user for issue in issues if issue.user.login == "jacquev6"]
+
+    def testSharedObjects(self):
+        authors = self.getAuthors()
+        self.assertTrue(len(authors) > 1)
+        for author in authors:
+            self.assertTrue(author is authors[0])
+
+    def testCompletionIsShared(self):
+        authors = self.getAuthors()
+        self.assertEqual(authors[0].name, "Vincent Jacques")
+        self.assertTrue(authors[-1]._isCompleted())
+        self.assertEqual(authors[-1].name, "Vincent Jacques")
+
+    def testObjectsAreGarbageCollected(self):
+        repo = self.g.get_repo("jacquev6/PyGithub")
+        self.assertTrue(self.g.get_repo("jacquev6/PyGithub") is repo)
+        self.assertEqual(len(self.g._Github__requester.identity_map), 1)
+        del repo
+        gc.collect()
+        self.assertEqual(len(self.g._Github__requester.identity_map), 0)
+
+    def testRelativeAndAbsoluteUrls(self):
+        repo = self.g.get_repo("jacquev6/PyGithub")
+        self.assertEqual(repo.url, "/repos/jacquev6/PyGithub")
+        # Like a repository in a response
+        other = github.GithubObject.GithubObject._makeObject(github.Repository.Repository, self.g._Github__requester, {}, {"url": "https://api.github.com/repos/jacquev6/PyGithub", "full_name": "jacquev6/PyGithub"}, False)
+        self.assertTrue(other is repo)
+        self.assertEqual(repo.full_name, "jacquev6/PyGithub")
+
+    def testDisabledByDefault(self):
+        g = github.Github()
+        self.assertFalse(g.get_repo("jacquev6/PyGithub") is g.get_repo("jacquev6/PyGithub"))
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import json
+
+import Framework
+
+import github
+
+
+class IncrementalSync(Framework.TestCase):
+    def testIssues(self):
+        repo = self.g.get_repo("jacquev6/PyGithub", lazy=True)
+        sync = self.g.get_incremental_sync()
+        self.assertEqual([issue.number for issue in sync.get_issues(repo)], [1, 2, 3])
+        self.assertEqual(sync.watermarks, {"/repos/jacquev6/PyGithub/issues": {"since": "2014-01-02T00:00:00Z", "ids": [1002, 1003], "etag": None}})
+        # Issues 2 and 3 are returned again by the API, but were already seen
+        self.assertEqual([issue.number for issue in sync.get_issues(repo)], [4])
+        self.assertEqual(sync.watermarks, {"/repos/jacquev6/PyGithub/issues": {"since": "2014-01-03T00:00:00Z", "ids": [1004], "etag": None}})
+        self.assertEqual([issue.number for issue in sync.get_issues(repo)], [])
+        self.assertEqual(sync.watermarks, {"/repos/jacquev6/PyGithub/issues": {"since": "2014-01-03T00:00:00Z", "ids": [1004], "etag": '"c"'}})
+        # A new instance resumes from the dumped watermarks, with a conditional request
+        sync = self.g.get_incremental_sync(json.loads(json.dumps(sync.watermarks)))
+        self.assertEqual([issue.number for issue in sync.get_issues(repo)], [])
+        self.assertEqual(sync.watermarks, {"/repos/jacquev6/PyGithub/issues": {"since": "2014-01-03T00:00:00Z", "ids": [1004], "etag": '"c"'}})
+
+    def testUsers(self):
+        sync = self.g.get_incremental_sync()
+        self.assertEqual([user.login for user in sync.get_users()], ["user1", "user2"])
+        self.assertEqual(sync.watermarks, {"/users": {"since": 2, "etag": None}})
+        self.assertEqual([user.login for user in sync.get_users()], [])
+        self.assertEqual(sync.watermarks, {"/users": {"since": 2, "etag": None}})
+        self.assertEqual([user.login for user in sync.get_users()], ["user3"])
+        self.assertEqual(sync.watermarks, {"/users": {"since": 3, "etag": None}})
+
+    def testWatermarkIsNotUpdatedBeforeTheEnd(self):
+        sync = self.g.get_incremental_sync({"/users": {"since": 2, "etag": None}})
+        sync.get_users()
+        self.assertEqual(sync.watermarks, {"/users": {"since": 2, "etag": None}})
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import io
+import unittest
+
+from github.JsonStream import JsonStream as Stream
+
+
+class JsonStream(unittest.TestCase):
+    def decode(self, document, key=None, chunkSize=Stream.CHUNK_SIZE):
+        if isinstance(document, unicode):
+            document = document.encode("utf-8")
+        self.ends = []
+        self.stream = Stream(io.BytesIO(document), chunkSize, self.ends.append)
+        return list(self.stream.elements(key))
+
+    def testArray(self):
+        document = u'[{"a": [1, 2.5, "x"]}, null, true, 12345, "\\u00e9\u00e9", []]'
+        for chunkSize in [1, 2, 3, 7, 1000]:
+            self.assertEqual(self.decode(document, chunkSize=chunkSize), [{"a": [1, 2.5, "x"]}, None, True, 12345, u"\xe9\xe9", []])
+            self.assertEqual(self.ends, [True])
+
+    def testObject(self):
+        document = ' {"total_count": 2, "items": [{"id": 1}, {"id": 2}], "incomplete_results": false} \n'
+        for chunkSize in [1, 5, 1000]:
+            self.assertEqual(self.decode(document, "items", chunkSize), [{"id": 1}, {"id": 2}])
+            self.assertEqual(self.stream.members, {"total_count": 2, "incomplete_results": False})
+
+    def testObjectWithoutKey(self):
+        self.assertEqual(self.decode('{"sha": "abc", "tree": [1]}', "items"), [])
+        self.assertEqual(self.stream.members, {"sha": "abc", "tree": [1]})
+
+    def testEmpty(self):
+        self.assertEqual(self.decode(""), [])
+        self.assertEqual(self.decode("[ ]"), [])
+        self.assertEqual(self.decode("{}", "items"), [])
+        self.assertEqual(self.ends, [True])
+
+    def testLargeElement(self):
+        element = {"body": "x" * 100000}
+        self.assertEqual(self.decode('[%s, %s]' % (('{"body": "%s"}' % element["body"],) * 2), chunkSize=10), [element, element])
+
+    def testInvalidDocuments(self):
+        for document in ['[1, 2', '[1 2]', '"abc"', '[1] 2', '{"items" [1]}']:
+            self.assertRaises(ValueError, self.decode, document, "items")
+            self.assertEqual(len(self.ends), 1)
+
+    def testInterruptedDecoding(self):
+        self.ends = []
+        stream = Stream(io.BytesIO(b"[1, 2, 3]"), 1, self.ends.append)
+        elements = stream.elements()
+        self.assertEqual(elements.next(), 1)
+        elements.close()
+        self.assertEqual(self.ends, [False])
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import datetime
+import threading
+
+import github
+
+import Framework
+
+
+class LazyAttributes(Framework.TestCase):
+    repoRawData = {
+        "full_name": "jacquev6/PyGithub",
+        "url": "https://api.github.com/repos/jacquev6/PyGithub",
+        "updated_at": "2013-08-05T09:54:36Z",
+        "owner": {"login": "jacquev6", "url": "https://api.github.com/users/jacquev6"},
+    }
+
+    def testAttributesAreSetOnFirstAccess(self):
+        repo = self.g.create_from_raw_data(github.Repository.Repository, self.repoRawData)
+        self.assertEqual(repo._pendingAttributes, [self.repoRawData])
+        self.assertEqual(repo.full_name, "jacquev6/PyGithub")
+        self.assertEqual(repo._pendingAttributes, None)
+        self.assertEqual(repo.description, None)
+        self.assertTrue(repo._description is github.GithubObject.NotSet)
+        self.assertRaises(AttributeError, getattr, repo, "_no_such_attribute")
+
+    def testNestedObjectsAreBuiltOnFirstAccess(self):
+        repo = self.g.create_from_raw_data(github.Repository.Repository, self.repoRawData)
+        self.assertEqual(repo.full_name, "jacquev6/PyGithub")
+        self.assertTrue(isinstance(repo._owner, github.GithubObject._LazyAttribute))
+        self.assertEqual(repo.owner.login, "jacquev6")
+        self.assertTrue(repo.owner is repo.owner)
+        self.assertEqual(repo.updated_at, datetime.datetime(2013, 8, 5, 9, 54, 36))
+
+    def testCompletionBeforeFirstAccess(self):
+        owner = self.g.create_from_raw_data(github.Repository.Repository, self.repoRawData).owner
+        self.assertEqual(owner._pendingAttributes, [self.repoRawData["owner"]])
+        owner._completeWith({}, {"name": "Vincent Jacques", "url": "https://api.github.com/users/jacquev6"})
+        self.assertEqual(owner.login, "jacquev6")
+        self.assertEqual(owner.name, "Vincent Jacques")
+
+    def testConcurrentFirstAccess(self):
+        for i in range(20):
+            repo = self.g.create_from_raw_data(github.Repository.Repository, self.repoRawData)
+            results = []
+
+            def read():
+                results.append((repo.full_name, repo.owner.login, repo.homepage))
+
+            threads = [threading.Thread(target=read) for j in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(results, [("jacquev6/PyGithub", "jacquev6", None)] * 8)
+
+    def testUpdateDuringMaterialization(self):
+        owner = self.g.create_from_raw_data(github.Repository.Repository, self.repoRawData).owner
+        materializing = threading.Event()
+        updated = threading.Event()
+        errors = []
+
+        def materialize():
+            # Like GithubObject.__materialize, stopping in the middle
+            lock = github.GithubObject._getLazyLock(owner)
+            lock.acquire()
+            try:
+                pendingAttributes = owner._pendingAttributes
+                owner._pendingAttributes = github.GithubObject._Materializing
+                materializing.set()
+                updated.wait(0.1)  # The update waits for the end of the materialization
+                for attributes in pendingAttributes:
+                    owner._useAttributes(attributes)
+                owner._pendingAttributes = None
+            finally:
+                lock.release()
+
+        def update():
+            materializing.wait()
+            try:
+                owner._storeAndUseAttributes({}, {"name": "Vincent Jacques", "url": "https://api.github.com/users/jacquev6"})
+            except Exception, e:
+                errors.append(e)
+            updated.set()
+
+        threads = [threading.Thread(target=materialize), threading.Thread(target=update)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(owner.login, "jacquev6")
+        self.assertEqual(owner.name, "Vincent Jacques")
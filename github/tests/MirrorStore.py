@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import datetime
+import os
+import shutil
+import tempfile
+
+import Framework
+
+import github
+
+
+class MirrorStore(Framework.TestCase):
+    def setUp(self):
+        Framework.TestCase.setUp(self)
+        self.store = self.g.open_mirror_store(":memory:")
+
+    def makeIssue(self, number, updated_at):
+        return self.g.create_from_raw_data(github.Issue.Issue, {
+            "url": "https://api.github.com/repos/jacquev6/PyGithub/issues/%i" % number,
+            "id": 1000 + number,
+            "number": number,
+            "title": "Issue %i" % number,
+            "updated_at": updated_at,
+        })
+
+    def testPutAndGet(self):
+        self.store.put(self.makeIssue(1, "2014-01-01T00:00:00Z"))
+        issue = self.store.get("https://api.github.com/repos/jacquev6/PyGithub/issues/1")
+        self.assertTrue(isinstance(issue, github.Issue.Issue))
+        self.assertEqual(issue.title, "Issue 1")
+        self.assertEqual(issue.updated_at, datetime.datetime(2014, 1, 1))
+        self.assertEqual(self.store.get("https://api.github.com/repos/jacquev6/PyGithub/issues/2"), None)
+
+    def testPutReplaces(self):
+        self.store.put(self.makeIssue(1, "2014-01-01T00:00:00Z"))
+        self.store.put(self.makeIssue(1, "2014-01-02T00:00:00Z"))
+        self.assertEqual(len(self.store), 1)
+        self.assertEqual(self.store.get_by_id(github.Issue.Issue, 1001).updated_at, datetime.datetime(2014, 1, 2))
+
+    def testFind(self):
+        self.assertEqual(self.store.put_many(self.makeIssue(number, "2014-01-%02iT00:00:00Z" % number) for number in range(1, 11)), 10)
+        self.store.put(self.g.create_from_raw_data(github.NamedUser.NamedUser, {"url": "https://api.github.com/users/jacquev6", "login": "jacquev6", "id": 327146}))
+        self.assertEqual(len(self.store), 11)
+        self.assertEqual(self.store.count(github.Issue.Issue), 10)
+        self.assertEqual([issue.number for issue in self.store.find(github.Issue.Issue, number=3)], [3])
+        self.assertEqual([issue.number for issue in self.store.find(github.Issue.Issue, updated_since=datetime.datetime(2014, 1, 8))], [8, 9, 10])
+        self.assertEqual(self.store.count(github.Issue.Issue, url_prefix="https://api.github.com/repos/jacquev6/PyGithub/issues/1"), 2)
+        self.assertEqual(self.store.count(github.Issue.Issue, url_prefix="https://api.github.com/repos/jacquev6/"), 10)
+        self.assertEqual([user.login for user in self.store.find(github.NamedUser.NamedUser)], ["jacquev6"])
+        self.assertEqual(self.store.get_by_id(github.NamedUser.NamedUser, 1001), None)
+
+    def testFindByBatches(self):
+        self.store.BATCH_SIZE = 3
+        self.store.put_many(self.makeIssue(number, "2014-01-01T00:00:00Z") for number in range(1, 11))
+        found = []
+        for issue in self.store.find(github.Issue.Issue):
+            found.append(issue.number)
+            # Storing while iterating doesn't disturb the iteration
+            self.store.put(self.makeIssue(issue.number, "2014-01-02T00:00:00Z"))
+        self.assertEqual(len(set(found)), 10)
+        self.assertEqual(self.store.count(updated_since=datetime.datetime(2014, 1, 2)), 10)
+
+    def testDelete(self):
+        self.store.put(self.makeIssue(1, "2014-01-01T00:00:00Z"))
+        self.store.delete("https://api.github.com/repos/jacquev6/PyGithub/issues/1")
+        self.assertEqual(len(self.store), 0)
+
+    def testPutManyIsAtomic(self):
+        def issues():
+            yield self.makeIssue(1, "2014-01-01T00:00:00Z")
+            raise ValueError("Interrupted")
+        self.assertRaises(ValueError, self.store.put_many, issues())
+        self.assertEqual(len(self.store), 0)
+
+    def testPutManyCommitsByBatches(self):
+        self.store.BATCH_SIZE = 2
+
+        def issues():
+            for number in range(1, 4):
+                yield self.makeIssue(number, "2014-01-01T00:00:00Z")
+            raise ValueError("Interrupted")
+        self.assertRaises(ValueError, self.store.put_many, issues())
+        self.assertEqual(len(self.store), 2)
+
+    def testUseDuringPutMany(self):
+        self.store.BATCH_SIZE = 2
+        counts = []
+
+        def issues():
+            for number in range(1, 6):
+                # The store is not locked while objects are iterated
+                counts.append(len(self.store))
+                yield self.makeIssue(number, "2014-01-01T00:00:00Z")
+        self.assertEqual(self.store.put_many(issues()), 5)
+        self.assertEqual(counts, [0, 0, 2, 2, 4])
+
+    def testPutWithoutRawData(self):
+        g = github.Github(keep_raw_data=False)
+        issue = g.create_from_raw_data(github.Issue.Issue, {"url": "https://api.github.com/repos/jacquev6/PyGithub/issues/1", "number": 1})
+        self.assertRaises(ValueError, self.store.put, issue)
+        self.assertRaises(ValueError, self.store.put, self.g.create_from_raw_data(github.Issue.Issue, {"number": 1}))
+        self.assertEqual(len(self.store), 0)
+
+    def testPersistence(self):
+        directory = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(directory, "mirror.sqlite")
+            store = self.g.open_mirror_store(filename)
+            store.put(self.makeIssue(1, "2014-01-01T00:00:00Z"))
+            store.close()
+            store = self.g.open_mirror_store(filename)
+            self.assertEqual(store.get_by_id(github.Issue.Issue, 1001).title, "Issue 1")
+            store.close()
+        finally:
+            shutil.rmtree(directory)
+
+    def testPutPaginatedList(self):
+        self.assertEqual(self.store.put_many(self.g.get_repo("jacquev6/PyGithub", lazy=True).get_issues()), 16)
+        self.assertEqual([issue.number for issue in self.store.find(github.Issue.Issue, updated_since=datetime.datetime(2012, 5, 19))], [30, 3])
+        self.assertEqual([issue.user.login for issue in self.store.find(github.Issue.Issue, number=30)], ["jacquev6"])
@@ -38,6 +38,18 @@ class PaginatedList(Framework.TestCase):
     def testIteration(self):
         self.assertEqual(len(list(self.list)), 333)
 
+    def testPrefetch(self):
+        # A single worker, so that pages are requested in the order of the replay data
+        self.assertListKeyBegin(self.list.prefetch(workers=1), lambda i: i.id, [4772349, 4767675, 4758608])
+        self.assertEqual(len(list(self.list)), 333)
+        self.assertEqual(self.list[332].id, 94898)
+
+    def testStreamed(self):
+        issues = list(self.list.streamed())
+        self.assertEqual(len(issues), 333)
+        self.assertEqual(issues[0].id, 4772349)
+        self.assertEqual(issues[332].id, 94898)
+
     def testSeveralIterations(self):
         self.assertEqual(len(list(self.list)), 333)
         self.assertEqual(len(list(self.list)), 333)
@@ -151,5 +163,12 @@ class PaginatedList(Framework.TestCase):
         self.g.per_page = 100
         self.assertEqual(len(self.repo.get_issues().get_page(2)), 100)
 
+    def testWithPerPage(self):
+        self.assertEqual(len(list(self.repo.get_issues().with_per_page(100))), 456)
+        self.assertEqual(self.g.per_page, 30)
+
+    def testWithPerPageWithGetPage(self):
+        self.assertEqual(len(self.repo.get_issues().with_per_page(100).get_page(2)), 100)
+
     def testNoFirstPage(self):
         self.assertFalse(next(iter(self.list), None))
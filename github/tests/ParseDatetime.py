@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import datetime
+import unittest
+
+import github.GithubObject
+from github.GithubObject import GithubObject
+
+
+class ParseDatetime(unittest.TestCase):
+    def testUtc(self):
+        self.assertEqual(GithubObject._parseDatetime("2013-08-05T09:54:36Z"), datetime.datetime(2013, 8, 5, 9, 54, 36))
+        self.assertEqual(GithubObject._parseDatetime(u"2013-08-05T09:54:37Z"), datetime.datetime(2013, 8, 5, 9, 54, 37))
+        self.assertEqual(GithubObject._parseDatetime("2013-08-05T09:54:38.000Z"), datetime.datetime(2013, 8, 5, 9, 54, 38))
+
+    def testOffsets(self):
+        self.assertEqual(GithubObject._parseDatetime("2013-08-05T11:54:36+02:00"), datetime.datetime(2013, 8, 5, 9, 54, 36))
+        self.assertEqual(GithubObject._parseDatetime("2013-08-04T23:24:36-10:30"), datetime.datetime(2013, 8, 5, 9, 54, 36))
+
+    def testInvalidValues(self):
+        for s in ["foobar", "2013-13-05T09:54:36Z", "2013-08-05 09:54:36Z", "2013-08-05T09:54:3aZ", "2013-08-05T09:54:36+0200"]:
+            self.assertRaises(ValueError, GithubObject._parseDatetime, s)
+
+    def testCache(self):
+        self.assertTrue(GithubObject._parseDatetime("2013-08-05T09:54:39Z") is GithubObject._parseDatetime("2013-08-05T09:54:39Z"))
+
+    def testFixedFormatAgreesWithStrptime(self):
+        # Timing is measured by scripts/benchmark_datetime.py, not here
+        for i in range(200):
+            s = "2013-08-%02iT%02i:%02i:%02iZ" % (1 + i % 28, i % 24, i % 60, i % 59)
+            self.assertEqual(GithubObject._GithubObject__parseFixedFormatDatetime(s), datetime.datetime.strptime(s, "%Y-%m-%dT%H:%M:%SZ"))
+
+    def testCacheIsBounded(self):
+        start = datetime.datetime(2013, 8, 5, 9, 54, 36)
+        for i in range(github.GithubObject._PARSED_DATETIMES_CACHE_SIZE + 10):
+            GithubObject._parseDatetime((start + datetime.timedelta(seconds=i)).strftime("%Y-%m-%dT%H:%M:%SZ"))
+        self.assertTrue(len(github.GithubObject._parsedDatetimes) <= github.GithubObject._PARSED_DATETIMES_CACHE_SIZE)
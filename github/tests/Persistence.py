@@ -54,3 +54,48 @@ class Persistence(Framework.TestCase):
     def testLoadAndUpdate(self):
         loadedRepo = self.g.load(self.dumpedRepo)
         self.assertTrue(loadedRepo.update())
+
+    def testDumpManyAndLoadMany(self):
+        dumped = IO()
+        self.assertEqual(self.g.dump_many([self.repo, self.repo.owner], dumped), 2)
+        dumped.seek(0)
+        loadedRepo, loadedOwner = self.g.load_many(dumped)
+        self.assertTrue(isinstance(loadedRepo, github.Repository.Repository))
+        self.assertTrue(loadedRepo._requester is self.repo._requester)
+        self.assertEqual(loadedRepo.name, "PyGithub")
+        self.assertEqual(loadedRepo.url, "https://api.github.com/repos/akfish/PyGithub")
+        self.assertTrue(isinstance(loadedOwner, github.NamedUser.NamedUser))
+        self.assertEqual(loadedOwner.login, "akfish")
+
+    def testDumpManyAndLoadManyLazyObject(self):
+        self.assertFalse(self.repo.owner._isCompleted())
+        dumped = IO()
+        self.g.dump_many([self.repo, self.repo.owner], dumped)
+        dumped.seek(0)
+        loadedRepo, loadedOwner = self.g.load_many(dumped)
+        self.assertTrue(loadedRepo._isCompleted())
+        # Its missing attributes are requested, as the ones of the dumped object would have been
+        self.assertFalse(loadedOwner._isCompleted())
+        self.assertEqual(loadedOwner.login, "akfish")
+
+    def testLoadManyIsLazy(self):
+        dumped = IO()
+        self.g.dump_many([self.repo, self.repo], dumped)
+        dumped.seek(0)
+        loaded = []
+        for repo in self.g.load_many(dumped):
+            loaded.append(repo.name)
+            if len(loaded) == 1:
+                self.assertTrue(dumped.tell() < len(dumped.getvalue()))
+        self.assertEqual(loaded, ["PyGithub", "PyGithub"])
+
+    def testLoadManyOnlyCreatesPyGithubObjects(self):
+        for className in ["os.system", "github.MainClass.Github", "github.GithubObject.sys", "github.Repository.Unknown"]:
+            dumped = IO(('["%s",{},{},true]\n' % className).encode("ascii"))
+            self.assertRaises(ValueError, list, self.g.load_many(dumped))
+
+    def testDumpWithoutRawData(self):
+        g = github.Github(keep_raw_data=False)
+        user = g.create_from_raw_data(github.NamedUser.NamedUser, {"login": "jacquev6", "url": "https://api.github.com/users/jacquev6"})
+        self.assertRaises(ValueError, g.dump, user, IO())
+        self.assertRaises(ValueError, g.dump_many, [user], IO())
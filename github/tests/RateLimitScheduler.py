@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import unittest
+
+import github
+
+import Framework
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+        self.waits = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+    def onWait(self, seconds, reason):
+        self.waits.append((seconds, reason))
+
+
+class RateLimitScheduler(Framework.TestCase):
+    def setUp(self):
+        Framework.TestCase.setUp(self)
+        self.clock = FakeClock(1375802800)
+
+    def makeGithub(self, **kwds):
+        scheduler = github.RateLimitScheduler(pace=False, on_wait=self.clock.onWait, sleep=self.clock.sleep, clock=self.clock.time, **kwds)
+        return github.Github(self.login, self.password, rate_limit_scheduler=scheduler)
+
+    def testRetryAfterAbuseDetection(self):
+        self.assertEqual(self.makeGithub().get_user("jacquev6").login, "jacquev6")
+        self.assertEqual(self.clock.waits, [(3, github.RateLimitScheduler.RETRY_AFTER)])
+
+    def testRetryAfterRateLimitExceeded(self):
+        self.assertEqual(self.makeGithub().get_user("jacquev6").login, "jacquev6")
+        self.assertEqual(self.clock.waits, [(17, github.RateLimitScheduler.RESET)])
+
+    def testWaitForReset(self):
+        g = self.makeGithub()
+        g.get_user("jacquev6")
+        self.assertEqual(self.clock.waits, [])
+        g.get_user("jacquev6")
+        self.assertEqual(self.clock.waits, [(17, github.RateLimitScheduler.RESET)])
+        self.assertEqual(g.rate_limiting, (4999, 5000))
+
+    def testMaxWait(self):
+        self.assertRaises(github.RateLimitExceededException, self.makeGithub(max_wait=10).get_user, "jacquev6")
+        self.assertEqual(self.clock.waits, [])
+
+
+class Pacing(unittest.TestCase):
+    def setUp(self):
+        unittest.TestCase.setUp(self)
+        self.clock = FakeClock(1000)
+        self.scheduler = github.RateLimitScheduler(on_wait=self.clock.onWait, sleep=self.clock.sleep, clock=self.clock.time)
+
+    def testBudgetIsSpreadUntilReset(self):
+        for i in range(3):
+            self.scheduler.beforeRequest(10, 1100)
+        # 10 requests remaining for 100 seconds: one every 10 seconds
+        self.assertEqual(self.clock.waits, [(10, github.RateLimitScheduler.PACE), (10, github.RateLimitScheduler.PACE)])
+        self.assertEqual(self.clock.now, 1020)
+
+    def testUnknownBudget(self):
+        self.scheduler.beforeRequest(-1, 0)
+        self.scheduler.beforeRequest(-1, 0)
+        self.assertEqual(self.clock.waits, [])
+
+    def testNoRetryForOtherErrors(self):
+        self.assertFalse(self.scheduler.afterResponse(403, {"x-ratelimit-remaining": "4000"}, 0))
+        self.assertFalse(self.scheduler.afterResponse(500, {"retry-after": "3"}, 0))
+        self.assertTrue(self.scheduler.afterResponse(429, {"retry-after": "3"}, 2))
+        self.assertFalse(self.scheduler.afterResponse(429, {"retry-after": "3"}, 3))
+
+    def testRetryAfterDate(self):
+        self.clock.now = 1375802800
+        self.assertTrue(self.scheduler.afterResponse(403, {"retry-after": "Tue, 06 Aug 2013 15:27:22 GMT"}, 0))
+        self.assertTrue(self.scheduler.afterResponse(403, {"retry-after": "soon"}, 0))
+        self.assertEqual(self.clock.waits, [(42, github.RateLimitScheduler.RETRY_AFTER), (60, github.RateLimitScheduler.RETRY_AFTER)])
@@ -97,3 +97,22 @@ class RawData(Framework.TestCase):
         user = self.g.create_from_raw_data(github.NamedUser.NamedUser, RawData.jacquev6RawData)
         self.assertEqual(user._CompletableGithubObject__completed, True)
         self.assertEqual(user.name, "Vincent Jacques")
+
+    def testWithoutRawData(self):
+        g = github.Github(keep_raw_data=False)
+        user = g.create_from_raw_data(github.NamedUser.NamedUser, RawData.jacquev6RawData)
+        self.assertEqual(user.raw_data, None)
+        self.assertEqual(user.name, "Vincent Jacques")
+
+    def testCompactObjects(self):
+        user = self.g.create_from_raw_data(github.NamedUser.NamedUser, RawData.jacquev6RawData)
+        self.assertFalse(hasattr(user, "__dict__"))
+        self.assertFalse(hasattr(user.plan, "__dict__"))
+        self.assertTrue(user._hireable is self.g.create_from_raw_data(github.NamedUser.NamedUser, RawData.jacquev6RawData)._hireable)
+
+        # Classes derived by users can still have their own attributes
+        class MyUser(github.NamedUser.NamedUser):
+            pass
+        user = self.g.create_from_raw_data(MyUser, RawData.jacquev6RawData)
+        user.note = "Author of PyGithub"
+        self.assertEqual(user.note, "Author of PyGithub")
@@ -26,6 +26,7 @@ import Framework
 
 import github
 import datetime
+import io
 
 
 class Repository(Framework.TestCase):
@@ -229,10 +230,30 @@ class Repository(Framework.TestCase):
         ref = self.repo.create_git_ref("refs/heads/BranchCreatedByPyGithub", "4303c5b90e2216d927155e9609436ccb8984c495")
         self.assertEqual(ref.url, "https://api.github.com/repos/jacquev6/PyGithub/git/refs/heads/BranchCreatedByPyGithub")
 
+    def testCompareGitTrees(self):
+        differences = [(status, base and base.path, head and head.path) for status, base, head in self.repo.compare_git_trees("c" * 40, "d" * 40)]
+        self.assertEqual(differences, [
+            ("modified", "a/b.py", "a/b.py"),
+            ("removed", "a/c.py", None),
+            ("added", None, "a/d.py"),
+            ("modified", "run.sh", "run.sh"),
+            ("modified", "vendor", "vendor"),
+            ("added", None, "z.txt"),
+        ])
+
+    def testCompareTruncatedGitTrees(self):
+        # The subtrees of the truncated base tree are requested one by one
+        differences = [(status, base and base.path, head and head.path) for status, base, head in self.repo.compare_git_trees("e" * 40, "f" * 40)]
+        self.assertEqual(differences, [("added", None, "d/y.py")])
+
     def testCreateGitBlob(self):
         blob = self.repo.create_git_blob("Blob created by PyGithub", "latin1")
         self.assertEqual(blob.sha, "5dd930f591cd5188e9ea7200e308ad355182a1d8")
 
+    def testCreateGitBlobFromFile(self):
+        blob = self.repo.create_git_blob(io.BytesIO("Blob created by PyGithub".encode("ascii")), "base64")
+        self.assertEqual(blob.sha, "5dd930f591cd5188e9ea7200e308ad355182a1d8")
+
     def testCreateGitTree(self):
         tree = self.repo.create_git_tree(
             [github.InputGitTreeElement(
@@ -379,6 +400,11 @@ class Repository(Framework.TestCase):
         self.assertEqual(len(tree.tree), 90)
         self.assertEqual(tree.tree[50].path, "github/GithubObjects/Gist.py")
 
+    def testGetGitTreeElementsWithRecursive(self):
+        elements = list(self.repo.get_git_tree_elements("f492784d8ca837779650d1fb406a1a3587a764ad", True))
+        self.assertEqual(len(elements), 90)
+        self.assertEqual(elements[50].path, "github/GithubObjects/Gist.py")
+
     def testGetHooks(self):
         self.assertListKeyEqual(self.repo.get_hooks(), lambda h: h.id, [257993])
 
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import github
+
+import Framework
+
+
+class ResponseCache(Framework.TestCase):
+    def testRevalidation(self):
+        g = github.Github(self.login, self.password, response_cache=github.InMemoryResponseCache())
+        repo = g.get_repo("akfish/PyGithub", lazy=False)
+        self.assertEqual(repo.full_name, "akfish/PyGithub")
+        # Second request is answered 304 Not Modified: the cached body is used
+        repo = g.get_repo("akfish/PyGithub", lazy=False)
+        self.assertEqual(repo.full_name, "akfish/PyGithub")
+        self.assertEqual(repo.etag, '"8600bedcb7fed1d8065e1693e05529ce"')
+        self.assertEqual(g.rate_limiting, (4988, 5000))
+
+    def testFileSystemCache(self):
+        directory = tempfile.mkdtemp()
+        try:
+            g = github.Github(self.login, self.password, response_cache=github.FileSystemResponseCache(directory))
+            self.assertEqual(g.get_repo("akfish/PyGithub", lazy=False).full_name, "akfish/PyGithub")
+            # A new Github instance, like in a new process, finds the cached response on disk
+            g = github.Github(self.login, self.password, response_cache=github.FileSystemResponseCache(directory))
+            repo = g.get_repo("akfish/PyGithub", lazy=False)
+            self.assertEqual(repo.full_name, "akfish/PyGithub")
+            self.assertEqual(repo.owner.login, "akfish")
+        finally:
+            shutil.rmtree(directory)
+
+    def testCredentialsArePartOfKey(self):
+        cache = github.InMemoryResponseCache()
+        github.Github(self.login, self.password, response_cache=cache).get_repo("akfish/PyGithub", lazy=False)
+        github.Github(self.oauth_token, response_cache=cache).get_repo("akfish/PyGithub", lazy=False)
+        self.assertEqual(len(cache), 2)
+
+
+class InMemoryResponseCache(unittest.TestCase):
+    def testLeastRecentlyUsedEntriesAreEvicted(self):
+        cache = github.InMemoryResponseCache(2)
+        cache.set("a", ("etag a", None, {}, "output a"))
+        cache.set("b", ("etag b", None, {}, "output b"))
+        self.assertEqual(cache.get("a"), ("etag a", None, {}, "output a"))
+        cache.set("c", ("etag c", None, {}, "output c"))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get("b"), None)
+        self.assertEqual(cache.get("a")[0], "etag a")
+        self.assertEqual(cache.get("c")[0], "etag c")
+
+    def testUpdatedEntryIsKept(self):
+        cache = github.InMemoryResponseCache(2)
+        cache.set("a", ("etag a", None, {}, "output a"))
+        cache.set("b", ("etag b", None, {}, "output b"))
+        cache.set("a", ("etag a2", None, {}, "output a2"))
+        cache.set("c", ("etag c", None, {}, "output c"))
+        self.assertEqual(cache.get("b"), None)
+        self.assertEqual(cache.get("a")[0], "etag a2")
+
+
+class FileSystemResponseCache(unittest.TestCase):
+    def testEntryIsReplacedLikeOnWindows(self):
+        rename = os.rename
+
+        def windowsRename(source, destination):
+            if os.path.exists(destination):
+                raise OSError(17, "File exists")
+            rename(source, destination)
+
+        directory = tempfile.mkdtemp()
+        os.rename = windowsRename
+        try:
+            cache = github.FileSystemResponseCache(directory)
+            cache.set("a", ("etag a", None, {}, "output a".encode("ascii")))
+            cache.set("a", ("etag a2", None, {}, "output a2".encode("ascii")))
+            self.assertEqual(cache.get("a"), ("etag a2", None, {}, "output a2".encode("ascii")))
+            self.assertEqual(os.listdir(directory), ["a"])
+        finally:
+            os.rename = rename
+            shutil.rmtree(directory)
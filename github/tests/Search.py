@@ -23,6 +23,7 @@
 # ##############################################################################
 
 import Framework
+import itertools
 import sys
 
 atLeastPython3 = sys.hexversion >= 0x03000000
@@ -38,6 +39,12 @@ class Search(Framework.TestCase):
         self.assertEqual(users[0].login, "nvie")
         self.assertEqual(users[14].login, "Vayn")
 
+    def testStreamedSearchUsers(self):
+        users = self.g.search_users("vincent", sort="followers", order="desc")
+        logins = [u.login for u in itertools.islice(users.streamed(), 15)]
+        self.assertEqual(logins[0], "nvie")
+        self.assertEqual(logins[14], "Vayn")
+
     def testPaginateSearchUsers(self):
         users = self.g.search_users("", location="Berlin")
         self.assertListKeyBegin(users, lambda u: u.login, [u'cloudhead', u'felixge', u'sferik', u'rkh', u'jezdez', u'janl', u'marijnh', u'nikic', u'igorw', u'froschi', u'svenfuchs', u'omz', u'chad', u'bergie', u'roidrage', u'pcalcado', u'durran', u'hukl', u'mttkay', u'aFarkas', u'ole', u'hagenburger', u'jberkel', u'naderman', u'joshk', u'pudo', u'robb', u'josephwilk', u'hanshuebner', u'txus', u'paulasmuth', u'splitbrain', u'langalex', u'bendiken', u'stefanw'])
@@ -0,0 +1,367 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import BaseHTTPServer
+import pickle
+import socket
+import SocketServer
+import sys
+import threading
+import time
+import unittest
+import urlparse
+import zlib
+
+import github
+
+import Framework
+
+if Framework.atLeastPython26:
+    import json
+else:  # pragma no cover (Covered by all tests with Python 2.5)
+    import simplejson as json  # pragma no cover (Covered by all tests with Python 2.5)
+
+
+class FakeGithubHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, so that pooled connections are exercised too
+    wbufsize = -1  # Send each response in one write
+
+    def do_GET(self):
+        # Requester sends a "null" body even with GET
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        server = self.server
+        url = urlparse.urlparse(self.path)
+        server.lock.acquire()
+        try:
+            server.requestCount += 1
+            remaining = 5000 - server.requestCount
+            server.pageRequests[self.path] = server.pageRequests.get(self.path, 0) + 1
+            abused = server.abuseResponses > 0
+            if abused:
+                server.abuseResponses -= 1
+        finally:
+            server.lock.release()
+
+        if abused:
+            output = json.dumps({"message": "You have triggered an abuse detection mechanism"}).encode("utf-8")
+            self.send_response(403)
+            self.send_header("Retry-After", "2")
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(output)))
+            self.end_headers()
+            self.wfile.write(output)
+            return
+
+        headers = {
+            "x-ratelimit-limit": "5000",
+            "x-ratelimit-remaining": str(remaining),
+            "x-ratelimit-reset": str(1400000000 + remaining),
+        }
+        if url.path.startswith("/users/"):
+            login = url.path[len("/users/"):]
+            body = {"login": login, "url": "http://127.0.0.1:%i/users/%s" % (server.server_address[1], login)}
+        elif url.path == "/repos/jacquev6/PyGithub/issues":
+            query = urlparse.parse_qs(url.query)
+            page = int(query.get("page", ["1"])[0])
+            perPage = int(query.get("per_page", ["30"])[0])
+            issueCount = server.pageCount * 30
+            lastPage = (issueCount + perPage - 1) // perPage
+            body = [{"number": number, "url": "/repos/jacquev6/PyGithub/issues/%i" % number} for number in range((page - 1) * perPage + 1, min(page * perPage, issueCount) + 1)]
+            if page < lastPage:
+                pageUrl = "http://127.0.0.1:%i/repos/jacquev6/PyGithub/issues?page=%%i%s" % (server.server_address[1], "" if perPage == 30 else "&per_page=%i" % perPage)
+                headers["link"] = '<%s>; rel="next", <%s>; rel="last"' % (pageUrl % (page + 1), pageUrl % lastPage)
+        elif url.path.startswith("/repos/jacquev6/PyGithub/issues/"):
+            number = int(url.path[len("/repos/jacquev6/PyGithub/issues/"):])
+            body = {"number": number, "title": "Issue %i" % number, "url": "/repos/jacquev6/PyGithub/issues/%i" % number}
+        else:
+            self.send_error(404)
+            return
+
+        output = json.dumps(body).encode("utf-8")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            compressor = zlib.compressobj(9, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            output = compressor.compress(output) + compressor.flush()
+            headers["content-encoding"] = "gzip"
+            server.lock.acquire()
+            try:
+                server.compressedResponses += 1
+            finally:
+                server.lock.release()
+        self.send_response(200)
+        for name, value in headers.iteritems():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(output)))
+        self.end_headers()
+        if server.writeDelay == 0:
+            self.wfile.write(output)
+        else:
+            # A slow response: the body is sent in three pieces, after a delay each
+            self.wfile.flush()
+            for index in range(3):
+                time.sleep(server.writeDelay)
+                self.wfile.write(output[index * len(output) // 3:(index + 1) * len(output) // 3])
+                self.wfile.flush()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeGithubServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+    request_queue_size = 64
+
+    def __init__(self):
+        BaseHTTPServer.HTTPServer.__init__(self, ("127.0.0.1", 0), FakeGithubHandler)
+        self.lock = threading.Lock()
+        self.requestCount = 0
+        self.pageRequests = dict()
+        self.compressedResponses = 0
+        self.pageCount = 10
+        self.abuseResponses = 0  # Number of next requests answered 403 with a Retry-After header
+        self.writeDelay = 0  # Seconds between the pieces of the body of each response
+
+    def handle_error(self, request, client_address):
+        # Clients timing out close their connection while a slow response is sent
+        if not isinstance(sys.exc_info()[1], socket.error):
+            BaseHTTPServer.HTTPServer.handle_error(self, request, client_address)  # pragma no cover (Covered only if the test fails)
+
+
+class ThreadSafety(unittest.TestCase):
+    threadCount = 32
+
+    def setUp(self):
+        unittest.TestCase.setUp(self)
+        # Debug frames are a test-only, single-threaded feature
+        self.debugFlag = github.Requester.Requester.DEBUG_FLAG
+        self.checkAfterInitFlag = github.GithubObject.GithubObject.CHECK_AFTER_INIT_FLAG
+        github.Requester.Requester.setDebugFlag(False)
+        github.GithubObject.GithubObject.setCheckAfterInitFlag(False)
+
+        self.server = FakeGithubServer()
+        self.serverThread = threading.Thread(target=self.server.serve_forever)
+        self.serverThread.setDaemon(True)
+        self.serverThread.start()
+        self.g = github.Github(base_url="http://127.0.0.1:%i" % self.server.server_address[1], pool_size=self.threadCount)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        github.Requester.Requester.setDebugFlag(self.debugFlag)
+        github.GithubObject.GithubObject.setCheckAfterInitFlag(self.checkAfterInitFlag)
+        unittest.TestCase.tearDown(self)
+
+    def runInThreads(self, function):
+        errors = []
+
+        def run(index):
+            try:
+                function(index)
+            except Exception, e:  # pragma no cover (Covered only if the test fails)
+                errors.append(e)
+
+        threads = [threading.Thread(target=run, args=(index,)) for index in range(self.threadCount)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def testConcurrentRequests(self):
+        def getUsers(index):
+            for i in range(20):
+                login = "user%i-%i" % (index, i)
+                self.assertEqual(self.g.get_user(login).login, login)
+
+        self.runInThreads(getUsers)
+
+        self.assertEqual(self.server.requestCount, self.threadCount * 20)
+        remaining, limit = self.g.rate_limiting
+        self.assertEqual(limit, 5000)
+        # Rate limiting values come from a single response
+        self.assertEqual(self.g.rate_limiting_resettime, 1400000000 + remaining)
+
+    def testConcurrentIterationOfSharedPaginatedList(self):
+        issues = self.g.get_repo("jacquev6/PyGithub").get_issues()
+        results = [None] * self.threadCount
+
+        def iterate(index):
+            results[index] = [issue.number for issue in issues]
+
+        self.runInThreads(iterate)
+
+        for numbers in results:
+            self.assertEqual(numbers, range(1, 301))
+        # Each page was fetched exactly once
+        self.assertEqual(len(self.server.pageRequests), 10)
+        self.assertEqual(set(self.server.pageRequests.values()), set([1]))
+
+    def testConcurrentStreaming(self):
+        def stream(index):
+            issues = self.g.get_repo("jacquev6/PyGithub").get_issues()
+            self.assertEqual([issue.number for issue in issues.streamed()], range(1, 301))
+
+        self.runInThreads(stream)
+
+        self.assertEqual(self.server.requestCount, self.threadCount * 10)
+
+    def testPrefetch(self):
+        issues = self.g.get_repo("jacquev6/PyGithub").get_issues().prefetch(workers=8)
+        self.assertEqual([issue.number for issue in issues], range(1, 301))
+        self.assertEqual(len(self.server.pageRequests), 10)
+        self.assertEqual(set(self.server.pageRequests.values()), set([1]))
+
+    def testWithPerPage(self):
+        issues = self.g.get_repo("jacquev6/PyGithub").get_issues().with_per_page(100)
+        self.assertEqual([issue.number for issue in issues], range(1, 301))
+        self.assertEqual(sorted(self.server.pageRequests), ["/repos/jacquev6/PyGithub/issues?page=2&per_page=100", "/repos/jacquev6/PyGithub/issues?page=3&per_page=100", "/repos/jacquev6/PyGithub/issues?per_page=100"])
+
+    def testAdaptivePerPage(self):
+        g = github.Github(base_url="http://127.0.0.1:%i" % self.server.server_address[1], adaptive_per_page=True)
+        issues = g.get_repo("jacquev6/PyGithub").get_issues()
+        self.assertEqual([issue.number for issue in issues], range(1, 301))
+        # 30 + 30 elements, then pages of 60 elements until 180, then of 90, the largest size dividing 180
+        self.assertEqual(self.server.requestCount, 6)
+        self.assertEqual([issue.number for issue in issues.streamed()], range(1, 301))
+        self.assertEqual(self.server.requestCount, 12)
+
+    def testAdaptivePerPageWithIndexing(self):
+        g = github.Github(base_url="http://127.0.0.1:%i" % self.server.server_address[1], adaptive_per_page=True)
+        issues = g.get_repo("jacquev6/PyGithub").get_issues()
+        self.assertEqual(issues[299].number, 300)
+        self.assertEqual(issues.get_page(3)[0].number, 91)
+        self.assertEqual(self.server.requestCount, 7)
+
+    def testCursor(self):
+        issues = self.g.get_repo("jacquev6/PyGithub").get_issues()
+        for index, issue in enumerate(issues):
+            if index == 44:
+                cursor = json.loads(json.dumps(issues.cursor(index + 1)))
+                break
+        self.assertEqual(cursor["index"], 45)
+        self.assertEqual(cursor["offset"], 15)
+        self.assertEqual(self.server.requestCount, 2)
+
+        resumed = self.g.get_repo("jacquev6/PyGithub").get_issues().resume(cursor)
+        self.assertEqual([issue.number for issue in resumed], range(46, 301))
+        self.assertEqual(resumed[0].number, 46)
+        # The second page is requested again, then the eight next ones
+        self.assertEqual(self.server.requestCount, 11)
+
+        # Cursors of a resumed list
+        cursor = pickle.loads(pickle.dumps(resumed.cursor(100)))
+        self.assertEqual(cursor["index"], 145)
+        self.assertEqual([issue.number for issue in self.g.get_repo("jacquev6/PyGithub").get_issues().resume(cursor).streamed()], range(146, 301))
+        self.assertEqual(list(self.g.get_repo("jacquev6/PyGithub").get_issues().resume(resumed.cursor(255))), [])
+
+    def testCursorHasNoCredentials(self):
+        g = github.Github("s3cr3t-token", base_url="http://127.0.0.1:%i" % self.server.server_address[1])
+        issues = github.PaginatedList.PaginatedList(github.Issue.Issue, g._Github__requester, "/repos/jacquev6/PyGithub/issues", None, headers={"Accept": "application/vnd.github.v3+json"})
+        self.assertEqual(issues[0].number, 1)
+        cursor = issues.cursor(1)
+        self.assertEqual(cursor["headers"], {"Accept": "application/vnd.github.v3+json"})
+        self.assertFalse("s3cr3t-token" in json.dumps(cursor))
+        resumed = github.PaginatedList.PaginatedList(github.Issue.Issue, g._Github__requester, "/repos/jacquev6/PyGithub/issues", None).resume(cursor)
+        self.assertEqual(resumed[0].number, 2)
+
+    def testCursorBeforeIteration(self):
+        issues = self.g.get_repo("jacquev6/PyGithub").get_issues().with_per_page(100)
+        cursor = issues.cursor(0)
+        self.assertEqual(cursor["params"], {"per_page": 100})
+        self.assertEqual([issue.number for issue in self.g.get_repo("jacquev6/PyGithub").get_issues().resume(cursor)], range(1, 301))
+        self.assertEqual(self.server.requestCount, 3)
+
+    def testCompleteAll(self):
+        issues = list(self.g.get_repo("jacquev6/PyGithub").get_issues())
+        self.assertEqual(self.server.requestCount, 10)
+        # Objects with the same URL are completed by the same request
+        self.assertEqual(len(self.g.complete_all(issues + issues[:30], workers=8)), 330)
+        self.assertEqual(self.server.requestCount, 310)
+        self.assertEqual([issue.title for issue in issues], ["Issue %i" % number for number in range(1, 301)])
+        self.assertEqual(self.server.requestCount, 310)
+
+    def testCompletedPaginatedList(self):
+        issues = self.g.get_repo("jacquev6/PyGithub").get_issues().completed(workers=8)
+        self.assertEqual([issue.title for issue in issues], ["Issue %i" % number for number in range(1, 301)])
+        self.assertEqual(self.server.requestCount, 310)
+
+    def testCompletedUsesThePageSizeOfTheList(self):
+        for issue in self.g.get_repo("jacquev6/PyGithub").get_issues().with_per_page(100).completed(workers=8):
+            break
+        # The first page and its 100 elements
+        self.assertEqual(self.server.requestCount, 101)
+
+    def testCompletedWithAdaptivePerPage(self):
+        g = github.Github(base_url="http://127.0.0.1:%i" % self.server.server_address[1], adaptive_per_page=True)
+        issues = g.get_repo("jacquev6/PyGithub").get_issues().completed(workers=8)
+        numbers = []
+        for issue in issues:
+            numbers.append(issue.number)
+            if issue.number == 61:
+                # Pages of 30, 30, then 60 elements: the third one is completed as a whole
+                self.assertEqual(self.server.requestCount, 3 + 120)
+        self.assertEqual(numbers, range(1, 301))
+
+    def testPrefetchSharedBetweenThreads(self):
+        issues = self.g.get_repo("jacquev6/PyGithub").get_issues().prefetch(workers=4)
+        results = [None] * self.threadCount
+
+        def iterate(index):
+            results[index] = [issue.number for issue in issues]
+
+        self.runInThreads(iterate)
+
+        for numbers in results:
+            self.assertEqual(numbers, range(1, 301))
+        self.assertEqual(set(self.server.pageRequests.values()), set([1]))
+
+    def testIdentityMapSharedBetweenThreads(self):
+        # Half of the threads build nested objects (repo.owner) while the other half build objects directly
+        g = github.Github(base_url="http://127.0.0.1:%i" % self.server.server_address[1], identity_map=True)
+        requester = g._Github__requester
+        baseUrl = "http://127.0.0.1:%i" % self.server.server_address[1]
+        errors = []
+
+        def run(index):
+            try:
+                for i in range(200):
+                    login = "user%i" % (i % 5)
+                    owner = {"login": login, "url": baseUrl + "/users/" + login}
+                    if index % 2 == 0:
+                        repo = github.GithubObject.GithubObject._makeObject(github.Repository.Repository, requester, {}, {"name": "repo", "url": baseUrl + "/repos/%s/repo%i-%i" % (login, index, i), "owner": owner}, True)
+                        self.assertEqual(repo.owner.login, login)
+                    else:
+                        user = github.GithubObject.GithubObject._makeObject(github.NamedUser.NamedUser, requester, {}, owner, False)
+                        self.assertEqual(user.login, login)
+            except Exception, e:  # pragma no cover (Covered only if the test fails)
+                errors.append(e)
+
+        threads = [threading.Thread(target=run, args=(index,)) for index in range(8)]
+        for thread in threads:
+            thread.setDaemon(True)
+            thread.start()
+        deadline = time.time() + 30  # Deadlocked threads never end
+        for thread in threads:
+            thread.join(max(0, deadline - time.time()))
+        self.assertEqual([thread for thread in threads if thread.is_alive()], [])
+        self.assertEqual(errors, [])
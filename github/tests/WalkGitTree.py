@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import shutil
+import tempfile
+
+import Framework
+
+import github
+import github.GitObjectCache
+
+
+class WalkGitTree(Framework.TestCase):
+    def setUp(self):
+        Framework.TestCase.setUp(self)
+        self.repo = self.g.get_repo("jacquev6/PyGithub", lazy=True)
+        self.sha = "7777777777777777777777777777777777777777"
+
+    def testWalk(self):
+        # Trees and submodules are skipped, and requests are made in order with a single worker
+        self.assertEqual(list(self.repo.walk_git_tree(self.sha, workers=1)), [
+            ("ReadMe.md", "# PyGithub\n".encode("ascii")),
+            ("doc/ReadMe.md", "# PyGithub\n".encode("ascii")),
+            ("doc/index.rst", "Documentation\n".encode("ascii")),
+            ("github/__init__.py", "# License: LGPL\n".encode("ascii")),
+        ])
+
+    def testPathFilter(self):
+        self.assertEqual([path for path, content in self.repo.walk_git_tree(self.sha, "*.md", workers=1)], ["ReadMe.md", "doc/ReadMe.md"])
+        self.assertEqual([path for path, content in self.repo.walk_git_tree(self.sha, lambda path: path.startswith("github/"), workers=1)], ["github/__init__.py"])
+
+    def testCache(self):
+        directory = tempfile.mkdtemp()
+        try:
+            cache = github.GitObjectCache.FileSystemGitObjectCache(directory)
+            # The blob at two paths is downloaded once
+            first = list(self.repo.walk_git_tree(self.sha, workers=1, cache=cache))
+            self.assertEqual(cache.get("blob:2222222222222222222222222222222222222222")["encoding"], "base64")
+            # The tree and the blobs are all in the cache: nothing is requested
+            cache = github.GitObjectCache.FileSystemGitObjectCache(directory)
+            self.assertEqual(list(self.repo.walk_git_tree(self.sha, cache=cache)), first)
+        finally:
+            shutil.rmtree(directory)
+
+    def testTruncatedTree(self):
+        cache = github.GitObjectCache.InMemoryGitObjectCache()
+        self.assertEqual(list(self.repo.walk_git_tree(self.sha, workers=1, cache=cache)), [
+            ("a.txt", "A\n".encode("ascii")),
+            ("d/x.py", "X\n".encode("ascii")),
+        ])
+        # The truncated tree is not cached, unlike the complete ones
+        self.assertEqual(cache.get("tree:" + self.sha + ".recursive"), None)
+        self.assertEqual(cache.get("tree:" + self.sha)["sha"], self.sha)
+        self.assertEqual(cache.get("tree:" + "3" * 40 + ".recursive")["sha"], "3" * 40)
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+import threading
+import time
+import unittest
+
+import github
+import github.WorkerPool
+
+
+class WorkerPool(unittest.TestCase):
+    def testResultsAreInOrder(self):
+        def slowSquare(i):
+            time.sleep(0.001 * (10 - i))
+            return i * i
+
+        self.assertEqual(list(github.WorkerPool.WorkerPool(4).imap(slowSquare, range(10))), [i * i for i in range(10)])
+
+    def testConcurrencyIsBounded(self):
+        lock = threading.Lock()
+        state = {"running": 0, "maxRunning": 0}
+
+        def work(i):
+            lock.acquire()
+            state["running"] += 1
+            state["maxRunning"] = max(state["maxRunning"], state["running"])
+            lock.release()
+            time.sleep(0.002)
+            lock.acquire()
+            state["running"] -= 1
+            lock.release()
+            return i
+
+        self.assertEqual(list(github.WorkerPool.WorkerPool(3).imap(work, range(20))), range(20))
+        self.assertTrue(1 <= state["maxRunning"] <= 3)
+
+    def testExceptionIsRaisedInOrder(self):
+        def work(i):
+            if i == 3:
+                raise ValueError(i)
+            return i
+
+        results = []
+        raised = False
+        try:
+            for result in github.WorkerPool.WorkerPool(2).imap(work, range(10)):
+                results.append(result)
+        except ValueError, exception:
+            raised = True
+            self.assertEqual(exception.args, (3,))
+        self.assertTrue(raised)
+        self.assertEqual(results, [0, 1, 2])
+
+    def testExceptionIsRaisedUnchanged(self):
+        exception = github.GithubException(404, {"message": "Not Found"})
+
+        def work(i):
+            raise exception
+
+        raised = None
+        try:
+            list(github.WorkerPool.WorkerPool(2).imap(work, range(3)))
+        except github.GithubException, e:
+            raised = e
+        self.assertTrue(raised is exception)
+        self.assertEqual(raised.status, 404)
+
+    def testItemsAreConsumedLazily(self):
+        consumed = []
+
+        def items():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        results = github.WorkerPool.WorkerPool(2).imap(lambda i: i, items())
+        self.assertEqual(results.next(), 0)
+        self.assertTrue(len(consumed) <= 5)
+        results.close()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+# Copyright 2013 Vincent Jacques <vincent@vincent-jacques.net>                 #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+# Measures the parsing of datetimes returned by the API, compared to datetime.strptime,
+# on distinct values so that the cache of parsed values doesn't help.
+# Usage, from the root of the repository: python scripts/benchmark_datetime.py [count]
+
+import datetime
+import sys
+import timeit
+
+sys.path.insert(0, ".")
+
+from github.GithubObject import GithubObject
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    values = ["2013-08-%02iT%02i:%02i:%02iZ" % (1 + i % 28, i % 24, i % 60, i % 59) for i in range(count)]
+    fast = min(timeit.repeat(lambda: [GithubObject._GithubObject__parseFixedFormatDatetime(s) for s in values], number=1, repeat=5))
+    slow = min(timeit.repeat(lambda: [datetime.datetime.strptime(s, "%Y-%m-%dT%H:%M:%SZ") for s in values], number=1, repeat=5))
+    print "Milliseconds to parse %i distinct datetimes:" % count
+    print "    %-18s %7.2f" % ("fixed format:", fast * 1000)
+    print "    %-18s %7.2f" % ("strptime:", slow * 1000)
+
+
+if __name__ == "__main__":
+    main()
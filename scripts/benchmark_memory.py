@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+# Copyright 2013 Vincent Jacques <vincent@vincent-jacques.net>                 #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+# Measures the memory used by each Repository object, as in a list returned by Github.get_repos.
+# Usage, from the root of the repository: python scripts/benchmark_memory.py [count]
+
+import gc
+import json
+import sys
+import types
+
+sys.path.insert(0, ".")
+
+import github
+
+
+def repositoryData():
+    # Body of the response to GET /repos/jacquev6/PyGithub
+    with open("github/tests/ReplayData/Repository.setUp.txt") as f:
+        return f.readlines()[20]
+
+
+def deepSize(roots, shared):
+    seen = set(id(o) for o in shared)
+    size = 0
+    todo = list(roots)
+    while todo:
+        o = todo.pop()
+        if id(o) in seen or isinstance(o, (type, types.ClassType, types.ModuleType, types.FunctionType)):
+            continue
+        seen.add(id(o))
+        size += sys.getsizeof(o)
+        todo.extend(gc.get_referents(o))
+    return size
+
+
+def measure(count, **kwds):
+    g = github.Github(**kwds)
+    data = repositoryData()
+    headers = {}
+    # A new dict for each object, like when parsing responses
+    repos = [g.create_from_raw_data(github.Repository.Repository, json.loads(data), headers) for i in range(count)]
+    for repo in repos:
+        repo.owner.login  # Nested objects are created when parsing, this just checks they work
+    requester = repos[0]._requester
+    return deepSize(repos, [requester, headers, github.GithubObject.NotSet]) / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    print "Bytes per Repository object (%i objects):" % count
+    print "    with raw_data:    %6i" % measure(count)
+    print "    without raw_data: %6i" % measure(count, keep_raw_data=False)
+    print "    with identity_map, without raw_data: %6i" % measure(count, keep_raw_data=False, identity_map=True)
+
+
+if __name__ == "__main__":
+    main()
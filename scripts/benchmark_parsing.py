@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+# Copyright 2013 Vincent Jacques <vincent@vincent-jacques.net>                 #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+# Measures the time to build a page of Repository objects, compared to decoding its JSON,
+# and the time to then read a few attributes of each object.
+# Usage, from the root of the repository: python scripts/benchmark_parsing.py [pages]
+
+import json
+import sys
+import timeit
+
+sys.path.insert(0, ".")
+
+import github
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    with open("github/tests/ReplayData/Repository.setUp.txt") as f:
+        page = "[" + ",".join([f.readlines()[20].strip()] * 100) + "]"
+    g = github.Github()
+
+    def decode():
+        return json.loads(page)
+
+    def build():
+        return [g.create_from_raw_data(github.Repository.Repository, data) for data in json.loads(page)]
+
+    def buildAndRead():
+        for repo in build():
+            repo.full_name
+            repo.updated_at
+
+    print "Milliseconds per page of 100 Repository objects (%i pages):" % pages
+    for name, function in [("decode JSON", decode), ("build objects", build), ("read 2 attributes", buildAndRead)]:
+        print "    %-18s %7.2f" % (name + ":", timeit.timeit(function, number=pages) * 1000 / pages)
+
+
+if __name__ == "__main__":
+    main()
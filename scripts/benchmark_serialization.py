@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+# Copyright 2013 Vincent Jacques <vincent@vincent-jacques.net>                 #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+
+# Compares Github.dump/load (pickle, one object at a time) to Github.dump_many/load_many (one line of JSON per object).
+# Usage, from the root of the repository: python scripts/benchmark_serialization.py [count]
+
+import json
+import pickle
+import sys
+import time
+
+sys.path.insert(0, ".")
+
+import github
+
+if sys.hexversion >= 0x02060000:
+    from io import BytesIO as IO
+else:
+    from StringIO import StringIO as IO
+
+
+def repositoryData():
+    # Body of the response to GET /repos/jacquev6/PyGithub
+    with open("github/tests/ReplayData/Repository.setUp.txt") as f:
+        return f.readlines()[20]
+
+
+def timed(f):
+    before = time.time()
+    result = f()
+    return result, time.time() - before
+
+
+def dumpWithPickle(g, repos, protocol):
+    f = IO()
+    for repo in repos:
+        g.dump(repo, f, protocol)
+    return f.getvalue()
+
+
+def loadWithPickle(g, data):
+    f = IO(data)
+    repos = []
+    while f.tell() < len(data):
+        repos.append(g.load(f))
+    return repos
+
+
+def dumpMany(g, repos):
+    f = IO()
+    g.dump_many(repos, f)
+    return f.getvalue()
+
+
+def loadMany(g, data):
+    return list(g.load_many(IO(data)))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    g = github.Github()
+    data = repositoryData()
+    repos = [g.create_from_raw_data(github.Repository.Repository, json.loads(data)) for i in range(count)]
+    print "%i Repository objects:      size (bytes)   dump (s)   load (s)" % count
+    for name, dump, load in [
+        ("pickle, protocol 0", lambda: dumpWithPickle(g, repos, 0), lambda data: loadWithPickle(g, data)),
+        ("pickle, highest protocol", lambda: dumpWithPickle(g, repos, pickle.HIGHEST_PROTOCOL), lambda data: loadWithPickle(g, data)),
+        ("dump_many/load_many", lambda: dumpMany(g, repos), lambda data: loadMany(g, data)),
+    ]:
+        dumped, dumpDuration = timed(dump)
+        loaded, loadDuration = timed(lambda: load(dumped))
+        assert len(loaded) == count
+        print "    %-24s %12i %10.3f %10.3f" % (name, len(dumped), dumpDuration, loadDuration)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# ########################## Copyrights and license ############################
+#                                                                              #
+# Copyright 2013 Vincent Jacques <vincent@vincent-jacques.net>                 #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.github.io/PyGithub/v1/index.html                             #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+# ##############################################################################
+
+
+# Measures Repository.compare_git_trees on two recursive trees of 100000 entries each, found in a git_object_cache,
+# and compares it to building GitTree objects and comparing dicts of their elements.
+# Usage, from the root of the repository: python scripts/benchmark_tree_diff.py [count]
+
+import hashlib
+import sys
+import time
+
+sys.path.insert(0, ".")
+
+import github
+import github.GitObjectCache
+
+
+def makeTree(sha, count, changed):
+    # About 10% of the blobs are in each directory, and one blob in "changed" is modified
+    elements = []
+    for i in range(count):
+        path = "dir%i/file%i.py" % (i % 10, i)
+        blobSha = hashlib.sha1(("%s %i" % (path, i in changed)).encode("ascii")).hexdigest()
+        elements.append({"path": path, "type": "blob", "mode": "100644", "sha": blobSha, "size": 100})
+    return {"sha": sha, "tree": elements, "truncated": False}
+
+
+def timed(f):
+    before = time.time()
+    result = f()
+    return result, time.time() - before
+
+
+def compareWithObjects(repo, base, head):
+    baseElements = dict((element.path, element) for element in repo.get_git_tree(base, recursive=True).tree if element.type != "tree")
+    headElements = dict((element.path, element) for element in repo.get_git_tree(head, recursive=True).tree if element.type != "tree")
+    differences = []
+    for path in sorted(set(baseElements) | set(headElements)):
+        baseElement, headElement = baseElements.get(path), headElements.get(path)
+        if baseElement is None or headElement is None or baseElement.sha != headElement.sha or baseElement.mode != headElement.mode:
+            differences.append((baseElement, headElement))
+    return differences
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    base, head = "1" * 40, "2" * 40
+    cache = github.GitObjectCache.InMemoryGitObjectCache()
+    cache.set("tree:" + base + ".recursive", makeTree(base, count, set()))
+    cache.set("tree:" + head + ".recursive", makeTree(head, count, set(range(0, count, 100))))
+    repo = github.Github(git_object_cache=cache).get_repo("jacquev6/PyGithub", lazy=True)
+    print "Comparing two trees of %i blobs, without requests:" % count
+    differences, duration = timed(lambda: list(repo.compare_git_trees(base, head)))
+    print "    compare_git_trees:                     %6.3f s (%i differences)" % (duration, len(differences))
+    differences, duration = timed(lambda: compareWithObjects(repo, base, head))
+    print "    GitTree objects and dicts of elements: %6.3f s (%i differences)" % (duration, len(differences))
+
+
+if __name__ == "__main__":
+    main()